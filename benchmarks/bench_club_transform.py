@@ -0,0 +1,43 @@
+"""Time the columnar club transform against the old iterrows loop.
+
+    python -m benchmarks.bench_club_transform [--sizes 10000 100000 1000000]
+
+The row-wise loop is only run up to ``--max-legacy-rows`` lines since it
+takes minutes at a million.
+"""
+
+import argparse
+import time
+
+from benchmarks.legacy import transform_club_orders_rowwise
+from benchmarks.synthetic import make_club_df
+from era_engine import build_parts_lookup, transform_club_orders
+from parts_data import PARTS_DATA_RAW
+
+
+def _time(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-legacy-rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    parts_lookup = build_parts_lookup(PARTS_DATA_RAW)
+    print(f"{'lines':>10} {'rowwise s':>10} {'columnar s':>11} {'speedup':>8}")
+    for n in args.sizes:
+        club_df = make_club_df(n)
+        columnar = _time(transform_club_orders, club_df, parts_lookup)
+        if n <= args.max_legacy_rows:
+            rowwise = _time(transform_club_orders_rowwise, club_df, parts_lookup)
+            print(f"{n:>10} {rowwise:>10.3f} {columnar:>11.3f} {rowwise / columnar:>7.1f}x")
+        else:
+            print(f"{n:>10} {'-':>10} {columnar:>11.3f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare writing and reading back the combined output as xlsx, Parquet and CSV.
+
+    python -m benchmarks.bench_output_formats [--sizes 10000 100000]
+
+Sizes are club order lines; the output has three rows per line. Reports
+write time, file size and the time ``pandas`` takes to load the file again.
+"""
+
+import argparse
+import io
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_club_df
+from era_engine import OUTPUT_COLUMNS, transform_club_orders
+from parts_catalogue import get_catalogue
+from table_writer import CsvTableWriter, ParquetTableWriter
+from xlsx_writer import CombinedSheetWriter
+
+FORMATS = [
+    ("xlsx", CombinedSheetWriter, pd.read_excel),
+    ("parquet", ParquetTableWriter, pd.read_parquet),
+    ("csv", CsvTableWriter, pd.read_csv),
+]
+
+
+def _measure(final_df, writer_cls, read):
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    with writer_cls(buffer, OUTPUT_COLUMNS) as writer:
+        writer.append(final_df)
+    written = time.perf_counter() - start
+
+    buffer.seek(0)
+    start = time.perf_counter()
+    read(buffer)
+    read_back = time.perf_counter() - start
+    return written, len(buffer.getvalue()), read_back
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>8} {'format':>8} {'write s':>8} {'size MB':>8} {'read s':>8}")
+    for n in args.sizes:
+        final_df = transform_club_orders(make_club_df(n), get_catalogue())
+        for name, writer_cls, read in FORMATS:
+            written, size, read_back = _measure(final_df, writer_cls, read)
+            print(
+                f"{len(final_df):>8} {name:>8} {written:>8.2f} "
+                f"{size / 1024 ** 2:>8.1f} {read_back:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
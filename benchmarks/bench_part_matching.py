@@ -0,0 +1,95 @@
+"""Time Part matching as the catalogue and the order volume grow.
+
+    python -m benchmarks.bench_part_matching [--catalogue 400 4000 40000]
+                                             [--lines 10000 100000 1000000]
+
+Larger catalogues are made by repeating the real Part Names with other
+dimensions in front. Order lines use catalogue names: most exactly, some
+with other case and spacing, some misspelt, and some unknown names. For each
+size this prints the time to build the index, the time for the club
+transform on a cold index (every distinct name matched) and again on a warm
+one, and the transform time per line, which should stay flat.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from era_engine import transform_club_orders
+from parts_catalogue import PartsCatalogue, get_catalogue
+from benchmarks.synthetic import make_club_df
+
+
+def make_catalogue(n: int, seed: int = 0) -> PartsCatalogue:
+    """A catalogue of ``n`` parts made from the real ones."""
+    rng = np.random.default_rng(seed)
+    records = list(get_catalogue().raw.values())
+    raw = {}
+    for i in range(n):
+        record = dict(records[i % len(records)])
+        if i >= len(records):
+            w, h = rng.integers(10, 5000, 2)
+            record["Part Name"] = f"{w}x{h} {record['Part Name']}"
+        record["Part URN"] = i + 1
+        raw[str(i + 1)] = record
+    return PartsCatalogue.from_raw(raw)
+
+
+def _variant(name: str, rng) -> str:
+    kind = rng.random()
+    if kind < 0.8:
+        return name
+    if kind < 0.9:
+        return f" {name.upper()}  "
+    if kind < 0.97 and len(name) > 8:
+        i = int(rng.integers(3, len(name) - 1))
+        return name[:i] + name[i + 1 :]
+    return f"Unknown {name}"
+
+
+def make_orders(catalogue: PartsCatalogue, n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    club_df = make_club_df(n, seed=seed)
+    names = np.array(list(catalogue), dtype=object)
+    # Spellings are drawn from a fixed pool, as real exports repeat theirs
+    pool = np.array([_variant(name, rng) for name in rng.choice(names, 2000)], dtype=object)
+    club_df["Part"] = rng.choice(pool, n)
+    return club_df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalogue", type=int, nargs="+", default=[400, 4_000, 40_000])
+    parser.add_argument("--lines", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'catalogue':>9} {'lines':>9} {'index ms':>9} {'cold s':>8} {'warm s':>8} "
+        f"{'us/line':>8} {'fuzzy':>6} {'unmatched':>9}"
+    )
+    for size in args.catalogue:
+        catalogue = make_catalogue(size)
+        start = time.perf_counter()
+        index = catalogue.part_index()
+        index_ms = (time.perf_counter() - start) * 1000
+        for n in args.lines:
+            club_df = make_orders(catalogue, n)
+            index._cache.clear()
+            start = time.perf_counter()
+            transform_club_orders(club_df, catalogue)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            transform_club_orders(club_df, catalogue)
+            warm = time.perf_counter() - start
+            matches = [index.match(name) for name in club_df["Part"].unique()]
+            fuzzy = sum(m.how == "fuzzy" for m in matches)
+            unmatched = sum(m.how is None for m in matches)
+            print(
+                f"{size:>9} {n:>9} {index_ms:>9.1f} {cold:>8.3f} {warm:>8.3f} "
+                f"{warm / n * 1e6:>8.2f} {fuzzy:>6} {unmatched:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare loading the parts catalogue against the old dict-literal module.
+
+    python -m benchmarks.bench_parts_catalogue [--repeat 20]
+
+"literal" compiles and runs ``PARTS_DATA_RAW = {...}`` as the old
+``parts_data.py`` did on a cold import; "literal (pyc)" runs the already
+compiled code, as a warm import did. Both then build the Part Name lookup,
+as ``main()`` did on every rerun.
+"""
+
+import argparse
+import time
+
+from era_engine import build_parts_lookup
+from parts_catalogue import CATALOGUE_PATH, PartsCatalogue, get_catalogue
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    raw = get_catalogue().raw
+    source = "PARTS_DATA_RAW = " + str(raw)
+    code = compile(source, "parts_data.py", "exec")
+
+    def literal():
+        ns = {}
+        exec(compile(source, "parts_data.py", "exec"), ns)
+        build_parts_lookup(ns["PARTS_DATA_RAW"])
+
+    def literal_pyc():
+        ns = {}
+        exec(code, ns)
+        build_parts_lookup(ns["PARTS_DATA_RAW"])
+
+    def catalogue():
+        PartsCatalogue.load(CATALOGUE_PATH)
+
+    print(f"{'load':<16} {'ms':>8}")
+    for name, fn in [("literal", literal), ("literal (pyc)", literal_pyc), ("catalogue", catalogue)]:
+        print(f"{name:<16} {_best(fn, args.repeat) * 1000:>8.2f}")
+    print(f"{'cached rerun':<16} {_best(get_catalogue, args.repeat) * 1000:>8.4f}")
+
+    lookup = get_catalogue()
+    names = list(lookup)
+    probes = [names[i % len(names)] for i in range(args.lookups)]
+    start = time.perf_counter()
+    for name in probes:
+        lookup.get(name)
+    elapsed = time.perf_counter() - start
+    print(f"\nname lookups/s  {args.lookups / elapsed:,.0f}")
+
+    urns = list(raw)
+    probes = [urns[i % len(urns)] for i in range(args.lookups // 10)]
+    start = time.perf_counter()
+    for urn in probes:
+        lookup.by_urn(urn)
+    elapsed = time.perf_counter() - start
+    print(f"URN lookups/s   {len(probes) / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
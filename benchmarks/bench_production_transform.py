@@ -0,0 +1,38 @@
+"""Time the columnar production transform against the groupby/iterrows loop.
+
+    python -m benchmarks.bench_production_transform [--sizes 10000 100000]
+"""
+
+import argparse
+import time
+
+from benchmarks.legacy import transform_production_rowwise
+from benchmarks.synthetic import make_production_pair
+from era_engine import transform_production
+
+
+def _time(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-legacy-rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'rowwise s':>10} {'columnar s':>11} {'speedup':>8}")
+    for n in args.sizes:
+        df_print, df_cp = make_production_pair(n)
+        columnar = _time(transform_production, df_print, df_cp)
+        if n <= args.max_legacy_rows:
+            rowwise = _time(transform_production_rowwise, df_print, df_cp)
+            print(f"{n:>10} {rowwise:>10.3f} {columnar:>11.3f} {rowwise / columnar:>7.1f}x")
+        else:
+            print(f"{n:>10} {'-':>10} {columnar:>11.3f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the streaming xlsx reader against pd.read_excel on club exports.
+
+    python -m benchmarks.bench_xlsx_reader [--sizes 1000 10000 50000]
+
+Reports parse time and tracemalloc peak for each reader. The synthetic
+exports carry the unused Buy Price columns the real ones do.
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+import warnings
+
+from benchmarks.synthetic import make_club_df
+from ingest import load_club_report
+from xlsx_reader import READERS
+
+
+def _club_xlsx(n: int) -> bytes:
+    df = make_club_df(n)
+    for col in ["Buy Price (DT)", "Buy Price (FT)", "Buy Price (STK)", "Notes", "Approver"]:
+        df[col] = "unused"
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _measure(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+
+    # Separate run for memory: tracemalloc slows parsing down several-fold
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args(argv)
+    warnings.simplefilter("ignore")
+
+    print(f"{'lines':>8} {'reader':>8} {'seconds':>8} {'peak MB':>8}")
+    for n in args.sizes:
+        data = _club_xlsx(n)
+        for reader in READERS:
+            elapsed, peak = _measure(load_club_report, data, reader)
+            print(f"{n:>8} {reader:>8} {elapsed:>8.2f} {peak / 1024 ** 2:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare the constant-memory sheet writer against the old to_excel block.
+
+    python -m benchmarks.bench_xlsx_writer [--sizes 10000 100000]
+
+Sizes are club order lines; the output sheet has three rows per line.
+Reports write time and tracemalloc peak for each writer.
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from benchmarks.legacy import write_combined_to_excel
+from benchmarks.synthetic import make_club_df
+from era_engine import OUTPUT_COLUMNS, transform_club_orders
+from output_frame import expand_output
+from parts_catalogue import get_catalogue
+from xlsx_writer import CombinedSheetWriter
+
+
+def _write_sheet(final_df, target):
+    with CombinedSheetWriter(target, OUTPUT_COLUMNS) as writer:
+        writer.append(final_df)
+
+
+def _measure(fn, *args):
+    start = time.perf_counter()
+    fn(*args, io.BytesIO())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(*args, io.BytesIO())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>8} {'writer':>10} {'seconds':>8} {'peak MB':>8}")
+    for n in args.sizes:
+        final_df = transform_club_orders(make_club_df(n), get_catalogue())
+        # The old block only takes the full output layout, not the compact one
+        runs = [
+            ("to_excel", write_combined_to_excel, expand_output(final_df)),
+            ("streaming", _write_sheet, final_df),
+        ]
+        for name, fn, df in runs:
+            elapsed, peak = _measure(fn, df)
+            print(f"{len(final_df):>8} {name:>10} {elapsed:>8.2f} {peak / 1024 ** 2:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Row-by-row reference implementations of the merger transforms.
+
+These are the loops ``era_data_merger.main()`` used before the columnar
+rewrites. They are kept for the equivalence tests and as the baseline the
+benchmarks compare against; nothing in the app imports them.
+"""
+
+import pandas as pd
+
+
+def transform_club_orders_rowwise(club_df, parts_lookup, start_index=1):
+    club_rows = []
+    index_counter = start_index
+
+    for _, row in club_df.iterrows():
+        part = row.get("Part")
+        part_info = parts_lookup.get(part, {})
+
+        print_val = row.get("Print", 0)
+        cp_raw = row.get("Collate & pack", 0)
+        d_raw = row.get("Despatch", 0)
+
+        if pd.isna(print_val):
+            print_val = 0
+
+        if print_val == 0 and cp_raw == 0 and d_raw == 0:
+            print_val = row.get("Total", 0)
+
+        cp_val = cp_raw if cp_raw != 0 else 2.35
+        d_val = d_raw if d_raw != 0 else 5.33
+
+        sell_total = row.get("Total", 0)
+        if pd.isna(sell_total) or sell_total == 0:
+            sell_total = print_val + cp_val + d_val
+
+        common = {
+            "index no": index_counter,
+            "Matrix": "",
+            "Matrix URN": "",
+            "Order type": "Club",
+            "Project Ref": row.get("Local Marketing Order Ref", ""),
+            "Project name": "Club",
+            "Brief ref": row.get("Local Marketing Order Line Ref", ""),
+        }
+        tail = {
+            "Print Matrix": "",
+            "Number of clubs": 1,
+            "Comment": "",
+            "ERA Comments": "",
+            "ITG Comment": "",
+            "Credit": "",
+        }
+
+        club_rows.append(
+            {
+                **common,
+                "Product": part,
+                "Size": part_info.get("Size", ""),
+                "Pagination": part_info.get("Pagination", ""),
+                "Material": part_info.get("Material", ""),
+                "Finishing": part_info.get("Finishing", ""),
+                "Quantity": row.get("Quantity", ""),
+                "Print Matrix": "",
+                "Print Sell": print_val,
+                "Sell": "",
+                **tail,
+            }
+        )
+        club_rows.append(
+            {
+                **common,
+                "Product": "C&P",
+                "Size": "",
+                "Pagination": "",
+                "Material": "",
+                "Finishing": "C&P",
+                "Quantity": 1,
+                "Print Matrix": "",
+                "Print Sell": cp_val,
+                "Sell": "",
+                **tail,
+            }
+        )
+        club_rows.append(
+            {
+                **common,
+                "Product": "Delivery",
+                "Size": "",
+                "Pagination": "",
+                "Material": "",
+                "Finishing": "Delivery",
+                "Quantity": 1,
+                "Print Matrix": "",
+                "Print Sell": d_val,
+                "Sell": sell_total,
+                **tail,
+            }
+        )
+
+        index_counter += 1
+
+    return pd.DataFrame(club_rows)
+
+
+def transform_production_rowwise(df_print, df_cp, start_index=1):
+    cp_lookup = df_cp.set_index("Project Ref")["Collate And Pack Cost Price"].to_dict()
+    index_counter = start_index
+
+    grouped = df_print.groupby("Project Ref")
+    prod_rows = []
+
+    for project_ref, group in grouped:
+        current_index = index_counter
+        project_name = group["Project Description"].iloc[0]
+        cp_cost = cp_lookup.get(project_ref, "NOT FOUND")
+        total_sell = 0
+
+        for _, row in group.iterrows():
+            try:
+                sell = float(row.get("Production Sell Price", 0))
+            except Exception:
+                sell = 0
+            total_sell += sell
+
+            prod_rows.append(
+                {
+                    "index no": current_index,
+                    "Matrix": "Matrix",
+                    "Matrix URN": "",
+                    "Order type": "Camp / Misc",
+                    "Project Ref": row.get("Project Ref", ""),
+                    "Project name": row.get("Project Description", ""),
+                    "Brief ref": row.get("Brief Ref", ""),
+                    "Product": row.get("Part", ""),
+                    "Size": f"{row.get('Height', '')}x{row.get('Width', '')}",
+                    "Pagination": row.get("No of Pages", ""),
+                    "Material": row.get("Material", ""),
+                    "Finishing": row.get("Production Finishing Notes", ""),
+                    "Quantity": row.get("Total including Spares", ""),
+                    "Print Matrix": "",
+                    "Print Sell": sell,
+                    "Sell": "",
+                    "Number of clubs": row.get("No of Clubs", ""),
+                    "Comment": "",
+                    "ERA Comments": "",
+                    "ITG Comment": "",
+                    "Credit": "",
+                }
+            )
+
+        prod_rows.append(
+            {
+                "index no": current_index,
+                "Matrix": "Matrix",
+                "Matrix URN": "",
+                "Order type": "Camp / Misc",
+                "Project Ref": project_ref,
+                "Project name": project_name,
+                "Brief ref": "",
+                "Product": "C&P",
+                "Size": "",
+                "Pagination": "",
+                "Material": "",
+                "Finishing": "C&P",
+                "Quantity": "",
+                "Print Matrix": "",
+                "Print Sell": cp_cost,
+                "Sell": total_sell + (cp_cost if isinstance(cp_cost, (int, float)) else 0),
+                "Number of clubs": group["No of Clubs"].iloc[0],
+                "Comment": "",
+                "ERA Comments": "",
+                "ITG Comment": "",
+                "Credit": "",
+            }
+        )
+
+        index_counter += 1
+
+    return pd.DataFrame(prod_rows)
+
+
+def write_combined_to_excel(final_df, target):
+    """The old output block: ``to_excel``, then header, widths and borders.
+
+    Widths use ``len(str(v))`` per value; the original
+    ``astype(str).apply(len)`` fails on missing values under pandas 3.
+    """
+    with pd.ExcelWriter(target, engine="xlsxwriter") as writer:
+        final_df.to_excel(writer, sheet_name="Combined Data", index=False)
+
+        workbook = writer.book
+        worksheet = writer.sheets["Combined Data"]
+
+        border_fmt = workbook.add_format({"border": 1, "border_color": "#000000"})
+        header_fmt = workbook.add_format(
+            {
+                "border": 1,
+                "border_color": "#000000",
+                "bold": True,
+                "text_wrap": True,
+                "valign": "top",
+            }
+        )
+
+        for col_num, value in enumerate(final_df.columns.values):
+            worksheet.write(0, col_num, value, header_fmt)
+
+        for idx, col in enumerate(final_df.columns):
+            series = final_df[col]
+            max_len = max(series.map(lambda v: len(str(v))).max(), len(str(series.name))) + 2
+            worksheet.set_column(idx, idx, max_len)
+
+        for criteria in ("no_blanks", "blanks"):
+            worksheet.conditional_format(
+                0,
+                0,
+                len(final_df),
+                len(final_df.columns) - 1,
+                {"type": criteria, "format": border_fmt},
+            )
@@ -0,0 +1,220 @@
+"""Time parsing, transforming and writing at several sizes and track the results.
+
+    python -m benchmarks.suite [--sizes 1000 10000 100000 1000000] [--repeat 3]
+                               [--history benchmarks/history.jsonl]
+                               [--data-dir DIR] [--fail-on-regression]
+
+Sizes are general_report lines. Each size generates a new-format and an
+old-format general_report workbook and a Print / C&P pair with a tenth as
+many Print rows, then times reading and parsing them, the club and
+production transforms and writing the combined output as xlsx, Parquet and
+CSV. The xlsx write is skipped once the output has more rows than
+``--max-xlsx-rows``; at three rows per line, 1M lines are past the sheet
+limit anyway.
+
+Every run is appended to ``--history`` (JSON lines) and each result is
+compared with the median of the last ``--window`` runs of the same stage and
+size on the same host. A result more than ``--threshold`` slower than that,
+and at least ``--min-seconds`` slower, is flagged as a regression.
+
+Generating the workbooks takes longer than reading them at the larger sizes;
+pass ``--data-dir`` to keep them between runs.
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import (
+    make_general_report,
+    make_production_workbooks,
+    workbook_bytes,
+)
+from era_engine import OUTPUT_COLUMNS, build_combined, split_production
+from ingest import load_club_report, load_production_workbook
+from parts_catalogue import get_catalogue
+from run_profile import RunProfile
+from table_writer import CsvTableWriter, ParquetTableWriter
+from xlsx_writer import SHEET_MAX_ROWS, CombinedSheetWriter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HISTORY = REPO_ROOT / "benchmarks" / "history.jsonl"
+
+WRITERS = [
+    ("xlsx", CombinedSheetWriter),
+    ("parquet", ParquetTableWriter),
+    ("csv", CsvTableWriter),
+]
+
+
+def _cached(data_dir, name: str, make) -> bytes:
+    if data_dir is None:
+        return make()
+    path = Path(data_dir) / name
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(make())
+    return path.read_bytes()
+
+
+def generate_inputs(n: int, data_dir=None) -> dict:
+    """Workbook bytes for one size: new and old club reports, Print and C&P."""
+    inputs = {
+        fmt: _cached(
+            data_dir,
+            f"general_report_{fmt}_{n}.xlsx",
+            lambda: workbook_bytes(make_general_report(n, old_format=fmt == "old")),
+        )
+        for fmt in ("new", "old")
+    }
+    names = [f"production_{kind}_{n}.xlsx" for kind in ("print", "cp")]
+    if data_dir is not None and all((Path(data_dir) / name).exists() for name in names):
+        production = [(Path(data_dir) / name).read_bytes() for name in names]
+    else:
+        production = make_production_workbooks(max(1, n // 10))
+        for name, data in zip(names, production):
+            _cached(data_dir, name, lambda: data)
+    inputs["print"], inputs["cp"] = production
+    return inputs
+
+
+def time_stages(inputs: dict, parts_lookup, max_xlsx_rows: int = SHEET_MAX_ROWS) -> dict:
+    """Seconds per stage for one pass over ``inputs``; skipped stages are left out."""
+    seconds = {}
+    club_frames = []
+    for fmt in ("new", "old"):
+        timings = {}
+        club_frames.append(load_club_report(inputs[fmt], timings=timings))
+        for step, spent in timings.items():
+            seconds[f"{step} club ({fmt})"] = spent
+
+    timings = {}
+    df1 = load_production_workbook(inputs["print"], timings=timings)
+    df2 = load_production_workbook(inputs["cp"], timings=timings)
+    seconds["read production"] = timings["read"]
+    df_print, df_cp = split_production(df1, df2)
+
+    profile = RunProfile()
+    final_df = build_combined(club_frames, df_print, df_cp, parts_lookup, profile=profile)
+    for name in ("club transform", "production transform"):
+        seconds[name] = profile.stages[name].seconds
+
+    for fmt, writer_cls in WRITERS:
+        if fmt == "xlsx" and len(final_df) > max_xlsx_rows:
+            continue
+        profile = RunProfile()
+        with profile.stage(f"write {fmt}"):
+            with writer_cls(io.BytesIO(), OUTPUT_COLUMNS) as writer:
+                writer.append(final_df)
+        seconds[f"write {fmt}"] = profile.stages[f"write {fmt}"].seconds
+    return seconds
+
+
+def load_history(path) -> list:
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baseline(history: list, host: str, rows: int, stage: str, window: int = 5):
+    """Median seconds of the last ``window`` matching runs, or None if there are none."""
+    previous = [
+        record["seconds"]
+        for record in history
+        if record["host"] == host and record["rows"] == rows and record["stage"] == stage
+    ]
+    return statistics.median(previous[-window:]) if previous else None
+
+
+def is_regression(seconds: float, base, threshold: float, min_seconds: float) -> bool:
+    if base is None:
+        return False
+    return seconds > base * (1 + threshold) and seconds - base >= min_seconds
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=1, help="keep the fastest of N passes")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY))
+    parser.add_argument("--no-record", action="store_true", help="do not append to --history")
+    parser.add_argument("--window", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-seconds", type=float, default=0.05)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--max-xlsx-rows", type=int, default=SHEET_MAX_ROWS)
+    parser.add_argument("--data-dir", help="keep generated workbooks here between runs")
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    host = platform.node()
+    run = {
+        "run": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "host": host,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+    }
+    parts_lookup = get_catalogue()
+
+    records, regressions = [], 0
+    print(f"{'rows':>8} {'stage':<22} {'seconds':>8} {'baseline':>8} {'change':>7}")
+    for n in args.sizes:
+        inputs = generate_inputs(n, args.data_dir)
+        passes = [time_stages(inputs, parts_lookup, args.max_xlsx_rows) for _ in range(args.repeat)]
+        for stage in passes[0]:
+            seconds = min(p[stage] for p in passes)
+            base = baseline(history, host, n, stage, args.window)
+            flag = ""
+            if is_regression(seconds, base, args.threshold, args.min_seconds):
+                flag = "REGRESSION"
+                regressions += 1
+            base_text, change = "", ""
+            if base is not None:
+                base_text = f"{base:.3f}"
+                change = f"{(seconds - base) / base:+.0%}" if base else ""
+            print(f"{n:>8} {stage:<22} {seconds:>8.3f} {base_text:>8} {change:>7} {flag}")
+            records.append({**run, "rows": n, "stage": stage, "seconds": seconds})
+        if "write xlsx" not in passes[0]:
+            print(f"{n:>8} {'write xlsx':<22} {'-':>8}  (over --max-xlsx-rows)")
+
+    if not args.no_record:
+        history_path = Path(args.history)
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    if regressions:
+        print(f"{regressions} regression(s) against the last {args.window} runs", file=sys.stderr)
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Synthetic inputs for the benchmarks, shaped like the real exports."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from ingest import (
+    BASE_COLUMNS,
+    CATEGORY_COLUMNS,
+    FINAL_COLUMNS,
+    OLD_PRICE_COLUMNS,
+)
+from parts_data import PARTS_DATA_RAW
+
+PART_NAMES = sorted({p["Part Name"] for p in PARTS_DATA_RAW.values()})
+LOCATIONS = ["Poole", "Hanley", "Blackburn", "Washington", "Clacton on Sea", "Barnsley"]
+STATUSES = ["In Progress", "Completed", "Part Delivered"]
+
+
+def make_club_df(n: int, seed: int = 0) -> pd.DataFrame:
+    """A parsed club frame (``FINAL_COLUMNS``) with ``n`` order lines.
+
+    Mixes new-format lines (Print/C&P/Despatch breakdown), old-format lines
+    (Total only), lines with no C&P or despatch charge and unknown parts so
+    every branch of the club transform is exercised.
+    """
+    rng = np.random.default_rng(seed)
+    order_no = rng.integers(10000, 99999, n)
+    line_no = rng.integers(1, 9, n)
+
+    parts = rng.choice(np.array(PART_NAMES + ["Unknown part OT"], dtype=object), n)
+    print_cost = np.round(rng.uniform(1, 50, n), 2)
+    cp = np.where(rng.random(n) < 0.8, 2.35, 0.0)
+    despatch = np.where(rng.random(n) < 0.8, 5.33, 0.0)
+    total = np.round(print_cost + cp + despatch, 2)
+
+    old_format = rng.random(n) < 0.3
+    print_cost = np.where(old_format, 0.0, print_cost)
+    cp = np.where(old_format, 0.0, cp)
+    despatch = np.where(old_format, 0.0, despatch)
+    total = np.where(rng.random(n) < 0.05, 0.0, total)
+
+    location = rng.choice(np.array(LOCATIONS, dtype=object), n)
+    placed = pd.Timestamp("2025-06-01") + pd.to_timedelta(rng.integers(0, 60 * 86400, n), unit="s")
+
+    df = pd.DataFrame(
+        {
+            "Order Owner": location,
+            "Order Status": rng.choice(np.array(STATUSES, dtype=object), n),
+            "Local Marketing Order Ref": [f"BZL{o}" for o in order_no],
+            "Stock Order Ref": np.nan,
+            "Order Placed Date": placed,
+            "Order Line Reference": [f"{o}/{l}" for o, l in zip(order_no, line_no)],
+            "Local Marketing Asset": [f"AS{o}" for o in order_no],
+            "Local Marketing Order Line Ref": [f"BZL{o}/{l}" for o, l in zip(order_no, line_no)],
+            "Stock Item": np.nan,
+            "Stock Order Line Ref": np.nan,
+            "Part": parts,
+            "Quantity": rng.integers(1, 500, n),
+            "Date Approved": placed + pd.Timedelta(days=3),
+            "Location": location,
+            "Workflow Reference Number": [f"BUZ{o}/{i}" for i, o in enumerate(order_no)],
+            "If tender pre 5.25%": 0.0,
+            "Print": print_cost,
+            "Collate & pack": cp,
+            "Despatch": despatch,
+            "Total": total,
+        }
+    )
+    df = df.astype({col: "category" for col in CATEGORY_COLUMNS})
+    df["Quantity"] = df["Quantity"].astype(np.int32)
+    return df[FINAL_COLUMNS]
+
+
+def make_production_pair(n: int, seed: int = 0, projects: int = None):
+    """A (Print, C&P) pair of production frames with ``n`` Print rows.
+
+    Roughly one in ten projects has no C&P entry so the "NOT FOUND" path is
+    exercised, and a few sell prices are blank or non-numeric.
+    """
+    rng = np.random.default_rng(seed)
+    projects = projects or max(1, n // 8)
+    refs = np.array([f"PRJ{i:06d}" for i in range(projects)], dtype=object)
+    project_ref = rng.choice(refs, n)
+
+    sell = np.round(rng.uniform(5, 900, n), 2).astype(object)
+    bad = rng.random(n)
+    sell[bad < 0.01] = "TBC"
+    sell[(bad >= 0.01) & (bad < 0.02)] = np.nan
+
+    df_print = pd.DataFrame(
+        {
+            "Project Ref": project_ref,
+            "Project Description": [f"Campaign {r[3:]}" for r in project_ref],
+            "Brief Ref": [f"BR{i}" for i in rng.integers(1000, 9999, n)],
+            "Part": rng.choice(np.array(PART_NAMES, dtype=object), n),
+            "Height": rng.choice([297, 420, 594, 841], n),
+            "Width": rng.choice([210, 297, 420, 594], n),
+            "No of Pages": rng.choice([1, 2, 4, 8], n),
+            "Material": rng.choice(np.array(["170gsm Silk", "350gsm Silk", "Banner grade PVC"], dtype=object), n),
+            "Production Finishing Notes": rng.choice(np.array(["Trim", "Laminated", ""], dtype=object), n),
+            "Total including Spares": rng.integers(1, 2000, n),
+            "Production Sell Price": sell,
+            "No of Clubs": rng.integers(1, 300, n),
+        }
+    )
+
+    with_cp = refs[rng.random(projects) < 0.9]
+    df_cp = pd.DataFrame(
+        {
+            "Project Ref": with_cp,
+            "Collate And Pack Cost Price": np.round(rng.uniform(10, 400, len(with_cp)), 2),
+        }
+    )
+    return df_print, df_cp
+
+
+# Buy price columns the old export carries after its sell prices
+OLD_BUY_COLUMNS = ["Buy Price (DT)", "Buy Price (FT)"]
+
+
+def make_general_report(n: int, seed: int = 0, old_format: bool = False) -> pd.DataFrame:
+    """A general_report export with ``n`` lines, as it arrives before parsing.
+
+    About one line in ten is a stock order line with no Local Marketing
+    references. The new format carries the Print / Collate &
+    pack / Despatch / Total breakdown; the old one puts each line's price in
+    one of the Sell Price columns, followed by Buy Price columns.
+    """
+    rng = np.random.default_rng(seed + 1)
+    stock_columns = ["Stock Order Ref", "Stock Item", "Stock Order Line Ref"]
+    df = make_club_df(n, seed).astype({col: object for col in stock_columns})
+
+    stock = rng.random(n) < 0.1
+    stock_ref = np.array([f"B{i}" for i in rng.integers(3000, 4000, n)], dtype=object)
+    df.loc[stock, "Stock Order Ref"] = stock_ref[stock]
+    df.loc[stock, "Stock Order Line Ref"] = [f"{r}/{i}" for i, r in enumerate(stock_ref[stock])]
+    df.loc[stock, "Stock Item"] = [f"BUZ{i}" for i in rng.integers(10000, 20000, stock.sum())]
+    local_columns = [
+        "Local Marketing Order Ref", "Local Marketing Asset", "Local Marketing Order Line Ref"
+    ]
+    df.loc[stock, local_columns] = np.nan
+
+    if not old_format:
+        df["If tender pre 5.25%"] = np.where(rng.random(n) < 0.2, df["Print"], np.nan)
+        return df[FINAL_COLUMNS]
+
+    price_column = rng.integers(0, len(OLD_PRICE_COLUMNS), n)
+    for i, col in enumerate(OLD_PRICE_COLUMNS):
+        df[col] = np.where(price_column == i, df["Total"], 0.0)
+    for col in OLD_BUY_COLUMNS:
+        df[col] = np.round(rng.uniform(0, 40, n), 2)
+    return df[BASE_COLUMNS + OLD_PRICE_COLUMNS + OLD_BUY_COLUMNS]
+
+
+def workbook_bytes(df: pd.DataFrame, startrow: int = 0) -> bytes:
+    """``df`` as a one-sheet xlsx workbook, header on row ``startrow``.
+
+    Written row by row in constant-memory mode, which is much quicker than
+    ``to_excel`` for the million-line sizes. Missing values are left empty.
+    """
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"constant_memory": True})
+    worksheet = workbook.add_worksheet()
+    date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+
+    writers = []
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            writers.append(lambda r, c, v: worksheet.write_datetime(r, c, v, date_fmt))
+        else:
+            writers.append(worksheet.write)
+    values = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in df.columns]
+
+    worksheet.write_row(startrow, 0, [str(col) for col in df.columns])
+    for row_num, row in enumerate(zip(*values), start=startrow + 1):
+        for col_num, value in enumerate(row):
+            if value is not None:
+                writers[col_num](row_num, col_num, value)
+    workbook.close()
+    return buffer.getvalue()
+
+
+def make_production_workbooks(n: int, seed: int = 0):
+    """``(Print, C&P)`` workbook bytes with ``n`` Print rows, headers on the second row."""
+    df_print, df_cp = make_production_pair(n, seed)
+    return workbook_bytes(df_print, startrow=1), workbook_bytes(df_cp, startrow=1)
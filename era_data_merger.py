@@ -1,118 +1,214 @@
+import threading
 import streamlit as st
-import pandas as pd
-import io
-import warnings
+from streamlit.errors import StreamlitAPIException
+from contextlib import ExitStack
 from datetime import datetime
-from parts_data import PARTS_DATA_RAW
-
-# Constants for general report parsing
-OLD_PRICE_COLUMNS = [
-    "Sell Price (DT)",
-    "Sell Price (FT)",
-    "Sell Price (STK)",
-    "Sell Price (STA)",
-    "Sell Price (RFP)",
-]
-
-BASE_COLUMNS = [
-    "Order Owner",
-    "Order Status",
-    "Local Marketing Order Ref",
-    "Stock Order Ref",
-    "Order Placed Date",
-    "Order Line Reference",
-    "Local Marketing Asset",
-    "Local Marketing Order Line Ref",
-    "Stock Item",
-    "Stock Order Line Ref",
-    "Part",
-    "Quantity",
-    "Date Approved",
-    "Location",
-    "Workflow Reference Number",
-]
-
-COST_COLUMNS = [
-    "If tender pre 5.25%",
-    "Print",
-    "Collate & pack",
-    "Despatch",
-    "Total",
-]
-
-FINAL_COLUMNS = BASE_COLUMNS + COST_COLUMNS
-
-
-def parse_general_report(df: pd.DataFrame) -> pd.DataFrame:
-    """Parse a general_report sheet into a unified schema."""
-
-    # --- Promote header row ---
-    header_row_idx = None
-    for i in range(len(df)):
-        if df.iloc[i].notna().any():
-            header_row_idx = i
-            break
-    if header_row_idx is None:
-        raise ValueError("Could not determine header row")
-
-    header = df.iloc[header_row_idx].astype(str).str.strip()
-    df = df.iloc[header_row_idx + 1 :].reset_index(drop=True)
-    df.columns = header
-    df.columns = df.columns.astype(str).str.strip()
-    df = df.dropna(how="all")
-
-    # --- Detect format ---
-    is_old = any(col in df.columns for col in OLD_PRICE_COLUMNS)
-    is_new = ("Total" in df.columns) and any(
-        col in df.columns for col in ["Print", "Collate & pack", "Despatch"]
+from era_engine import run_merge
+from ingest import FINAL_COLUMNS, Upload, parse_general_report
+from merge_jobs import CANCELLED, FAILED, QUEUED, JobRunner
+from merge_state import dataset_state_path
+from output_spool import OutputSpool
+from parts_catalogue import get_catalogue
+from run_profile import RunProfile, cprofiled, profile_stats_bytes
+from upload_cache import UploadCache
+from validation import ERROR, issue_counts
+
+
+@st.cache_resource
+def get_upload_cache() -> UploadCache:
+    """The parsed-upload cache shared by every session of this server."""
+    return UploadCache()
+
+
+# Typed copies of the output offered next to the workbook
+EXTRA_FORMATS = {
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "CSV": ("csv", "text/csv"),
+}
+
+
+@st.cache_resource
+def get_job_runner() -> JobRunner:
+    """The merge job queue shared by every session of this server."""
+    return JobRunner()
+
+
+@st.cache_resource
+def get_state_lock(state_path: str) -> threading.Lock:
+    """Held by incremental merges of one dataset, which read and save its state file."""
+    return threading.Lock()
+
+
+def download_spooled(spool: OutputSpool, **kwargs):
+    """A download button that reads ``spool`` only when clicked.
+
+    Streamlit cannot stream a download: on a click the whole workbook is read
+    back into bytes, which Streamlit's media file manager holds in memory
+    while the download is served. Spooling bounds memory while the output
+    waits to be downloaded, not during the download itself.
+    """
+    try:
+        st.download_button(data=spool.getvalue, on_click="ignore", **kwargs)
+    except StreamlitAPIException:
+        # Streamlit without deferred downloads: hand over the file itself
+        spool.file.seek(0)
+        st.download_button(data=spool.file, on_click="ignore", **kwargs)
+
+
+def merge_target(
+    club_uploads,
+    prod_uploads,
+    spools: dict,
+    *,
+    parts_lookup,
+    low_memory: bool,
+    state_path,
+    trace_memory: bool,
+    use_cprofile: bool,
+):
+    """The merge a background job runs: returns ``(report, cProfile stats or None)``.
+
+    Resources shared between sessions are looked up here, in the script
+    thread, because the job runs without a Streamlit script context.
+    """
+    upload_cache = get_upload_cache()
+    state_lock = None if state_path is None else get_state_lock(state_path)
+
+    def run(job):
+        profile = RunProfile(trace_memory=trace_memory, on_stage=job.enter_stage)
+        with ExitStack() as stack:
+            if state_path is not None:
+                job.enter_stage("waiting for another incremental merge")
+                stack.enter_context(state_lock)
+            if trace_memory:
+                job.enter_stage("waiting for another traced merge")
+            stack.enter_context(profile)
+            profiler = stack.enter_context(cprofiled()) if use_cprofile else None
+            report = run_merge(
+                club_uploads,
+                prod_uploads,
+                spools["xlsx"].file,
+                low_memory=low_memory,
+                cache=upload_cache,
+                parts_lookup=parts_lookup,
+                on_file=job.file_read,
+                extra_outputs={fmt: spool.file for fmt, spool in spools.items() if fmt != "xlsx"},
+                state_path=state_path,
+                profile=profile,
+            )
+        return report, None if profiler is None else profile_stats_bytes(profiler)
+
+    return run
+
+
+@st.fragment(run_every=1.0)
+def show_job_progress(job_id: str):
+    """Progress of a queued or running merge, refreshed every second until it finishes."""
+    runner = get_job_runner()
+    job = runner.get(job_id)
+    if job is None or job.done:
+        st.rerun()
+    if job.cancel_requested:
+        status = "Cancelling..."
+    elif job.status == QUEUED:
+        ahead = sum(1 for j in runner.jobs() if not j.done and j.submitted < job.submitted)
+        status = f"Queued behind {ahead} other merge(s)"
+    else:
+        status = f"Running: {job.stage or 'starting'}"
+    st.progress(
+        job.fraction or 0.0,
+        text=f"{status} ({job.files_done} of {job.files_total} files read)",
+    )
+    st.caption("The merge runs in the background; you can leave this page open or come back.")
+    if st.button("Cancel", disabled=job.cancel_requested):
+        job.cancel()
+
+
+def show_job_result(job):
+    """Downloads and run details of a finished merge."""
+    if job.status == CANCELLED:
+        st.info("The merge was cancelled.")
+        return
+    if job.status == FAILED:
+        st.error(f"An error occurred: {job.error}")
+        return
+
+    report, cprofile_stats = job.result
+    today = datetime.fromtimestamp(job.submitted).strftime("%Y-%m-%d")
+    for failure in report.failures:
+        st.warning(f"Could not read {failure.name}: {failure.error}")
+    download_spooled(
+        job.outputs["xlsx"],
+        label="Download Combined Data",
+        file_name=f"ERA_Combined_Data_{today}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
-    if not (is_old or is_new):
-        raise ValueError(
-            "Unrecognized general_report format. Expected Sell Price columns or Total with Print/Collate & pack/Despatch columns."
+    for label, (fmt, mime) in EXTRA_FORMATS.items():
+        if fmt in job.outputs:
+            download_spooled(
+                job.outputs[fmt],
+                label=f"Download Combined Data ({label})",
+                file_name=f"ERA_Combined_Data_{today}.{fmt}",
+                mime=mime,
+            )
+    if cprofile_stats is not None:
+        st.download_button(
+            label="Download cProfile stats",
+            data=cprofile_stats,
+            file_name=f"ERA_run_{today}.prof",
+            mime="application/octet-stream",
+            on_click="ignore",
         )
-
-    # --- Validate required columns ---
-    missing = [c for c in BASE_COLUMNS if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {', '.join(missing)}")
-
-    df = df.copy()
-
-    # --- Map to unified schema ---
-    if is_old:
-        # Create cost columns with zeros
-        for col in ["If tender pre 5.25%", "Print", "Collate & pack", "Despatch"]:
-            df[col] = 0
-        df["Total"] = (
-            df[OLD_PRICE_COLUMNS].apply(pd.to_numeric, errors="coerce").sum(axis=1, skipna=True)
+    st.success("Data processing complete! Click the button above to download.")
+    if report.remerge is not None:
+        stats = report.remerge
+        st.caption(
+            f"Rebuilt {stats.club_rebuilt} club lines and "
+            f"{stats.projects_rebuilt} projects; reused {stats.club_reused} "
+            f"club lines and {stats.projects_reused} projects"
         )
-    else:
-        # Ensure all cost columns exist
-        for col in COST_COLUMNS:
-            if col not in df.columns:
-                df[col] = 0
-
-    # --- Type coercion ---
-    for col in COST_COLUMNS:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-
-    df["Order Placed Date"] = pd.to_datetime(
-        df["Order Placed Date"], dayfirst=True, errors="coerce"
-    )
-    df["Date Approved"] = pd.to_datetime(
-        df["Date Approved"], dayfirst=True, errors="coerce"
+    cache_stats = get_upload_cache().stats()
+    st.caption(
+        f"Upload cache: {cache_stats['hits']} hits, "
+        f"{cache_stats['misses']} misses, "
+        f"{cache_stats['bytes'] / 1024 ** 2:.1f} of "
+        f"{cache_stats['max_bytes'] / 1024 ** 2:.0f} MB used"
     )
-
-    quantity_num = pd.to_numeric(df["Quantity"], errors="coerce")
-    if quantity_num.isna().any():
-        warnings.warn("Non-numeric Quantity values coerced to 0")
-    df["Quantity"] = quantity_num.fillna(0).astype(int)
-
-    if (df["Total"] < 0).any():
-        warnings.warn("Negative Total values found")
-
-    df = df[FINAL_COLUMNS]
-    return df
+    if report.summaries:
+        with st.expander("Summaries"):
+            st.caption(
+                "Totals by Order type, club Location, Part and project, also on "
+                "the workbook's summary sheets. Quantities count product rows "
+                "only, not the C&P and Delivery rows."
+            )
+            for tab, (name, summary) in zip(
+                st.tabs(list(report.summaries)), report.summaries.items()
+            ):
+                tab.dataframe(summary, hide_index=True)
+    if len(report.issues):
+        errors = int((report.issues["Severity"] == ERROR).sum())
+        with st.expander(f"Data issues ({errors} errors, {len(report.issues) - errors} warnings)"):
+            st.caption(
+                "Input rows that broke a validation rule, also listed on the "
+                "workbook's Issues sheet. References are Order Ref / Line Ref "
+                "for club lines and the Project Ref for production rows."
+            )
+            st.dataframe(issue_counts(report.issues), hide_index=True)
+            st.dataframe(report.issues, hide_index=True)
+    if len(report.part_matches):
+        with st.expander("Part matching"):
+            st.caption(
+                "Club Parts not found in the catalogue under their exact "
+                "name: matched by normalised name, matched to the most "
+                "similar Part Name, or left unmatched with empty part details."
+            )
+            st.dataframe(report.part_matches.summary(), hide_index=True)
+    with st.expander("Run profile"):
+        st.caption(
+            f"{report.profile.wall_seconds:.2f} s in total. Stages marked as worker "
+            "stages are summed over files parsed in parallel."
+        )
+        st.dataframe(report.profile.to_frame())
 
 
 def main():
@@ -120,14 +216,7 @@ def main():
     st.title("🔄 ERA Club & Production Data Merger")
 
     # --- PARTS LOOKUP TRANSFORM ---
-    PARTS_DATA = {}
-    for part_data in PARTS_DATA_RAW.values():
-        PARTS_DATA[part_data["Part Name"]] = {
-            "Size": f"{part_data['Height (mm)']}x{part_data['Width (mm)']}",
-            "Pagination": part_data["No. of Pages"],
-            "Material": part_data["Materials"],
-            "Finishing": part_data.get("Finishing", ""),
-        }
+    PARTS_DATA = get_catalogue()
 
     # --- SESSION STATE SETUP ---
     if "step" not in st.session_state:
@@ -154,297 +243,98 @@ def main():
     # --- STEP 2: PRODUCTION DATA ---
     if st.session_state.step >= 2:
         st.header("Step 2: Upload Production Data")
-        st.caption("Upload BOTH the Print and C&P files")
+        st.caption(
+            "Upload the Print and C&P files, for one period or several; "
+            "they are told apart automatically"
+        )
         prod_files = st.file_uploader(
-            "Choose Production Excel files (2 required)",
+            "Choose Production Excel files (at least 2)",
             type="xlsx",
             accept_multiple_files=True,
         )
 
-        if prod_files and len(prod_files) == 2:
+        if prod_files and len(prod_files) >= 2:
             st.session_state.prod_files = prod_files
             st.success("Production files uploaded. Proceed to generate output")
             st.session_state.step = 3
-        elif prod_files and len(prod_files) != 2:
-            st.error("Please upload exactly 2 production files: 1 Print and 1 C&P file")
+        elif prod_files:
+            st.error("Please upload at least 2 production files: a Print and a C&P file")
 
     # --- STEP 3: PROCESS & DOWNLOAD ---
     if st.session_state.step == 3:
-        if st.button("Generate Combined Output"):
-            with st.spinner("Processing your files..."):
-                try:
-                    today = datetime.today().strftime("%Y-%m-%d")
-
-                    # --- Load club files ---
-                    club_dfs = []
-                    for f in st.session_state.club_files:
-                        raw_df = pd.read_excel(f, header=None)
-                        df = parse_general_report(raw_df)
-                        club_dfs.append(df)
-
-                    club_df = pd.concat(club_dfs, ignore_index=True)
-
-                    # --- Load production files ---
-                    df1 = pd.read_excel(st.session_state.prod_files[0], header=1)
-                    df2 = pd.read_excel(st.session_state.prod_files[1], header=1)
-                    df1.columns = df1.columns.str.strip()
-                    df2.columns = df2.columns.str.strip()
-
-                    df_cp = df1 if "Collate And Pack Cost Price" in df1.columns else df2
-                    df_print = df2 if df_cp is df1 else df1
-
-                    cp_lookup = df_cp.set_index("Project Ref")[
-                        "Collate And Pack Cost Price"
-                    ].to_dict()
-
-                    # --- Transform Club Orders ---
-                    club_rows = []
-                    index_counter = 1
-
-                    for _, row in club_df.iterrows():
-                        part = row.get("Part")
-                        part_info = PARTS_DATA.get(part, {})
-
-                        print_val = row.get("Print", 0)
-                        cp_raw = row.get("Collate & pack", 0)
-                        d_raw = row.get("Despatch", 0)
-
-                        if pd.isna(print_val):
-                            print_val = 0
-
-                        if print_val == 0 and cp_raw == 0 and d_raw == 0:
-                            print_val = row.get("Total", 0)
-
-                        cp_val = cp_raw if cp_raw != 0 else 2.35
-                        d_val = d_raw if d_raw != 0 else 5.33
-
-                        sell_total = row.get("Total", 0)
-                        if pd.isna(sell_total) or sell_total == 0:
-                            sell_total = print_val + cp_val + d_val
-
-                        # Row 1
-                        club_rows.append(
-                            {
-                                "index no": index_counter,
-                                "Matrix": "",
-                                "Matrix URN": "",
-                                "Order type": "Club",
-                                "Project Ref": row.get("Local Marketing Order Ref", ""),
-                                "Project name": "Club",
-                                "Brief ref": row.get("Local Marketing Order Line Ref", ""),
-                                "Product": part,
-                                "Size": part_info.get("Size", ""),
-                                "Pagination": part_info.get("Pagination", ""),
-                                "Material": part_info.get("Material", ""),
-                                "Finishing": part_info.get("Finishing", ""),
-                                "Quantity": row.get("Quantity", ""),
-                                "Print Matrix": "",
-                                "Print Sell": print_val,
-                                "Sell": "",
-                                "Number of clubs": 1,
-                                "Comment": "",
-                                "ERA Comments": "",
-                                "ITG Comment": "",
-                                "Credit": "",
-                            }
-                        )
-
-                        # Row 2: C&P
-                        club_rows.append(
-                            {
-                                "index no": index_counter,
-                                "Matrix": "",
-                                "Matrix URN": "",
-                                "Order type": "Club",
-                                "Project Ref": row.get("Local Marketing Order Ref", ""),
-                                "Project name": "Club",
-                                "Brief ref": row.get("Local Marketing Order Line Ref", ""),
-                                "Product": "C&P",
-                                "Size": "",
-                                "Pagination": "",
-                                "Material": "",
-                                "Finishing": "C&P",
-                                "Quantity": 1,
-                                "Print Matrix": "",
-                                "Print Sell": cp_val,
-                                "Sell": "",
-                                "Number of clubs": 1,
-                                "Comment": "",
-                                "ERA Comments": "",
-                                "ITG Comment": "",
-                                "Credit": "",
-                            }
-                        )
-
-                        # Row 3: Delivery
-                        club_rows.append(
-                            {
-                                "index no": index_counter,
-                                "Matrix": "",
-                                "Matrix URN": "",
-                                "Order type": "Club",
-                                "Project Ref": row.get("Local Marketing Order Ref", ""),
-                                "Project name": "Club",
-                                "Brief ref": row.get("Local Marketing Order Line Ref", ""),
-                                "Product": "Delivery",
-                                "Size": "",
-                                "Pagination": "",
-                                "Material": "",
-                                "Finishing": "Delivery",
-                                "Quantity": 1,
-                                "Print Matrix": "",
-                                "Print Sell": d_val,
-                                "Sell": sell_total,
-                                "Number of clubs": 1,
-                                "Comment": "",
-                                "ERA Comments": "",
-                                "ITG Comment": "",
-                                "Credit": "",
-                            }
-                        )
-
-                        index_counter += 1
-
-                    df_club_out = pd.DataFrame(club_rows)
-
-                    # --- Transform Production Data ---
-                    grouped = df_print.groupby("Project Ref")
-                    prod_rows = []
-
-                    for project_ref, group in grouped:
-                        current_index = index_counter
-                        project_name = group["Project Description"].iloc[0]
-                        cp_cost = cp_lookup.get(project_ref, "NOT FOUND")
-                        total_sell = 0
-
-                        for _, row in group.iterrows():
-                            try:
-                                sell = float(row.get("Production Sell Price", 0))
-                            except Exception:
-                                sell = 0
-                            total_sell += sell
-
-                            prod_rows.append(
-                                {
-                                    "index no": current_index,
-                                    "Matrix": "Matrix",
-                                    "Matrix URN": "",
-                                    "Order type": "Camp / Misc",
-                                    "Project Ref": row.get("Project Ref", ""),
-                                    "Project name": row.get("Project Description", ""),
-                                    "Brief ref": row.get("Brief Ref", ""),
-                                    "Product": row.get("Part", ""),
-                                    "Size": f"{row.get('Height', '')}x{row.get('Width', '')}",
-                                    "Pagination": row.get("No of Pages", ""),
-                                    "Material": row.get("Material", ""),
-                                    "Finishing": row.get("Production Finishing Notes", ""),
-                                    "Quantity": row.get("Total including Spares", ""),
-                                    "Print Matrix": "",
-                                    "Print Sell": sell,
-                                    "Sell": "",
-                                    "Number of clubs": row.get("No of Clubs", ""),
-                                    "Comment": "",
-                                    "ERA Comments": "",
-                                    "ITG Comment": "",
-                                    "Credit": "",
-                                }
-                            )
-
-                        prod_rows.append(
-                            {
-                                "index no": current_index,
-                                "Matrix": "Matrix",
-                                "Matrix URN": "",
-                                "Order type": "Camp / Misc",
-                                "Project Ref": project_ref,
-                                "Project name": project_name,
-                                "Brief ref": "",
-                                "Product": "C&P",
-                                "Size": "",
-                                "Pagination": "",
-                                "Material": "",
-                                "Finishing": "C&P",
-                                "Quantity": "",
-                                "Print Matrix": "",
-                                "Print Sell": cp_cost,
-                                "Sell": total_sell
-                                + (cp_cost if isinstance(cp_cost, (int, float)) else 0),
-                                "Number of clubs": group["No of Clubs"].iloc[0],
-                                "Comment": "",
-                                "ERA Comments": "",
-                                "ITG Comment": "",
-                                "Credit": "",
-                            }
-                        )
-
-                        index_counter += 1
-
-                    df_prod_out = pd.DataFrame(prod_rows)
-
-                    # --- Combine outputs ---
-                    final_df = pd.concat([df_club_out, df_prod_out], ignore_index=True)
-
-                    # Save to buffer
-                    buffer = io.BytesIO()
-                    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
-                        final_df.to_excel(writer, sheet_name="Combined Data", index=False)
-
-                        workbook = writer.book
-                        worksheet = writer.sheets["Combined Data"]
-
-                        border_fmt = workbook.add_format(
-                            {
-                                "border": 1,
-                                "border_color": "#000000",
-                            }
-                        )
-
-                        header_fmt = workbook.add_format(
-                            {
-                                "border": 1,
-                                "border_color": "#000000",
-                                "bold": True,
-                                "text_wrap": True,
-                                "valign": "top",
-                            }
-                        )
-
-                        for col_num, value in enumerate(final_df.columns.values):
-                            worksheet.write(0, col_num, value, header_fmt)
-
-                        for idx, col in enumerate(final_df.columns):
-                            series = final_df[col]
-                            max_len = max(
-                                series.astype(str).apply(len).max(),
-                                len(str(series.name)),
-                            ) + 2
-                            worksheet.set_column(idx, idx, max_len)
-
-                        worksheet.conditional_format(
-                            0,
-                            0,
-                            len(final_df),
-                            len(final_df.columns) - 1,
-                            {"type": "no_blanks", "format": border_fmt},
-                        )
-                        worksheet.conditional_format(
-                            0,
-                            0,
-                            len(final_df),
-                            len(final_df.columns) - 1,
-                            {"type": "blanks", "format": border_fmt},
-                        )
-
-                    buffer.seek(0)
-                    st.download_button(
-                        label="Download Combined Data",
-                        data=buffer,
-                        file_name=f"ERA_Combined_Data_{today}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    )
-                    st.success("Data processing complete! Click the button above to download.")
-                except Exception as e:
-                    st.error(f"An error occurred: {str(e)}")
+        low_memory = st.checkbox(
+            "Low-memory mode",
+            help="Process club files one at a time in batches instead of all at once. "
+            "Use for very large exports; uploads are not cached in this mode.",
+        )
+        incremental = st.checkbox(
+            "Incremental re-merge",
+            disabled=low_memory,
+            help="Reuse the last incremental run's output for orders and projects whose "
+            "inputs have not changed, keeping their index numbers. Not available in "
+            "low-memory mode.",
+        )
+        dataset = ""
+        if incremental and not low_memory:
+            dataset = st.text_input(
+                "Dataset name",
+                help="Incremental merges of the same dataset share their index numbers. "
+                "Use one name per dataset, e.g. the client and year; merges under "
+                "another name start their numbering afresh.",
+            )
+        extra_formats = st.multiselect(
+            "Also export as",
+            list(EXTRA_FORMATS),
+            help="Typed copies of the same rows for loading into other tools. "
+            "Print Sell and Sell are numeric; a missing C&P price is left blank.",
+        )
+        with st.expander("Diagnostics"):
+            trace_memory = st.checkbox(
+                "Trace memory per stage",
+                help="Record each stage's peak Python allocations in the run profile. "
+                "Makes the run noticeably slower. Traced merges run one at a time, and "
+                "merges running alongside one add to its figures.",
+            )
+            use_cprofile = st.checkbox(
+                "Collect cProfile stats",
+                help="Profile this run function by function and offer the stats for "
+                "download (open with pstats or snakeviz).",
+            )
+        needs_dataset = incremental and not low_memory and not dataset.strip()
+        if needs_dataset:
+            st.caption("Name the dataset to merge it incrementally.")
+        if st.button("Generate Combined Output", disabled=needs_dataset):
+            runner = get_job_runner()
+            previous = st.session_state.get("merge_job_id")
+            if previous is not None:
+                runner.discard(previous)
+            club_uploads = [Upload(f.name, f.getvalue()) for f in st.session_state.club_files]
+            prod_uploads = [Upload(f.name, f.getvalue()) for f in st.session_state.prod_files]
+            spools = {
+                fmt: OutputSpool()
+                for fmt in ["xlsx"] + [EXTRA_FORMATS[label][0] for label in extra_formats]
+            }
+            target = merge_target(
+                club_uploads,
+                prod_uploads,
+                spools,
+                parts_lookup=PARTS_DATA,
+                low_memory=low_memory,
+                state_path=dataset_state_path(dataset) if dataset.strip() else None,
+                trace_memory=trace_memory,
+                use_cprofile=use_cprofile,
+            )
+            job = runner.submit(
+                target, files_total=len(club_uploads) + len(prod_uploads), outputs=spools
+            )
+            st.session_state.merge_job_id = job.id
+
+        job_id = st.session_state.get("merge_job_id")
+        job = None if job_id is None else get_job_runner().get(job_id)
+        if job is not None and not job.done:
+            show_job_progress(job.id)
+        elif job is not None:
+            show_job_result(job)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,980 @@
+"""Merge engine: ingest -> transform -> write.
+
+Everything the Streamlit front end does when "Generate Combined Output" is
+clicked, importable and with a command-line entry point for batch runs:
+
+    python -m era_engine --club "exports/2025-*/*.xlsx" \
+        --production Print.xlsx CandP.xlsx -o combined.xlsx
+"""
+
+import argparse
+import glob
+import itertools
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Mapping
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ingest import (
+    CP_PRICE,
+    DEFAULT_MAX_WORKERS,
+    IngestResult,
+    Upload,
+    iter_ingest,
+)
+from merge_state import (
+    CLUB_KEY,
+    PROJECT_KEY,
+    MergeState,
+    assign_indices,
+    club_fingerprints,
+    parts_key,
+    project_fingerprints,
+)
+from order_store import OrderStore
+from output_frame import concat_output, output_frame
+from part_index import PartMatchLog
+from parts_catalogue import (
+    PART_ATTRIBUTES,
+    attributes_frame,
+    get_catalogue,
+    part_attributes,
+    part_index,
+)
+from run_profile import RunProfile, cprofiled
+from summaries import SummaryBuilder
+from table_writer import TABLE_WRITERS
+from validation import CLUB, CP, PRINT, Validator, issue_counts, production_issues
+from xlsx_writer import CombinedSheetWriter
+
+# Output layout of the combined sheet
+OUTPUT_COLUMNS = [
+    "index no",
+    "Matrix",
+    "Matrix URN",
+    "Order type",
+    "Project Ref",
+    "Project name",
+    "Brief ref",
+    "Product",
+    "Size",
+    "Pagination",
+    "Material",
+    "Finishing",
+    "Quantity",
+    "Print Matrix",
+    "Print Sell",
+    "Sell",
+    "Number of clubs",
+    "Comment",
+    "ERA Comments",
+    "ITG Comment",
+    "Credit",
+]
+
+# Charges applied to club lines that carry no C&P / despatch cost
+CLUB_CP_DEFAULT = 2.35
+CLUB_DESPATCH_DEFAULT = 5.33
+
+# The sheet the validation issues are written to, after the combined rows
+ISSUES_SHEET = "Issues"
+
+# Club lines transformed per batch in low-memory mode
+CHUNK_ROWS = int(os.environ.get("ERA_CHUNK_ROWS", "50000"))
+
+
+def build_parts_lookup(parts_raw: dict) -> dict:
+    """Map each Part Name to the Size/Pagination/Material/Finishing it outputs."""
+    parts_lookup = {}
+    for part_data in parts_raw.values():
+        parts_lookup[part_data["Part Name"]] = part_attributes(part_data)
+    return parts_lookup
+
+
+def _interleave(blocks: list) -> pd.DataFrame:
+    """Stack equally sized frames so row i of every block ends up adjacent."""
+    n = len(blocks[0])
+    order = np.arange(n * len(blocks)).reshape(len(blocks), n).T.ravel()
+    combined = concat_output(blocks)
+    return combined.take(order).reset_index(drop=True)
+
+
+def empty_output() -> pd.DataFrame:
+    """An output frame with no rows, in the compact layout of ``output_frame``."""
+    return output_frame({col: [] for col in OUTPUT_COLUMNS}, 0)
+
+
+def club_charges(club_df: pd.DataFrame):
+    """``(print, C&P, delivery, sell)`` arrays: what each club line is charged in the output."""
+    print_raw = club_df["Print"].fillna(0).to_numpy(dtype=float)
+    cp_raw = club_df["Collate & pack"].to_numpy(dtype=float)
+    d_raw = club_df["Despatch"].to_numpy(dtype=float)
+    total = club_df["Total"].to_numpy(dtype=float)
+
+    # Lines with no cost breakdown carry the whole charge as Print
+    no_breakdown = (print_raw == 0) & (cp_raw == 0) & (d_raw == 0)
+    print_val = np.where(no_breakdown, total, print_raw)
+    cp_val = np.where(cp_raw != 0, cp_raw, CLUB_CP_DEFAULT)
+    d_val = np.where(d_raw != 0, d_raw, CLUB_DESPATCH_DEFAULT)
+
+    sell_total = np.where(
+        np.isnan(total) | (total == 0), print_val + cp_val + d_val, total
+    )
+    return print_val, cp_val, d_val, sell_total
+
+
+def transform_club_orders(
+    club_df: pd.DataFrame,
+    parts_lookup: Mapping,
+    start_index: int = 1,
+    matches: Optional[PartMatchLog] = None,
+) -> pd.DataFrame:
+    """Expand each parsed club order line into its part, C&P and Delivery rows.
+
+    Parts are looked up through ``part_index``, so a name that differs from
+    the catalogue only in case or spacing, or is a close misspelling, still
+    gets its attributes; Product keeps the name as the export spells it.
+    Names not matched exactly are recorded in ``matches``. The rows are in
+    the compact layout described in ``output_frame``.
+    """
+    if club_df.empty:
+        return empty_output()
+
+    n = len(club_df)
+    print_val, cp_val, d_val, sell_total = club_charges(club_df)
+
+    # Each distinct Part is matched once, then its catalogue row is taken per line
+    parts = club_df["Part"].reset_index(drop=True)
+    codes, part_matches = part_index(parts_lookup).resolve(parts)
+    if matches is not None:
+        matches.record(codes, part_matches)
+    parts_frame = attributes_frame(parts_lookup)
+    rows = pd.Index(parts_frame["Part"]).get_indexer([match.part for match in part_matches])
+    # Unmatched names, and missing Parts (code -1), point past the last catalogue row, at ""
+    rows = np.append(np.where(rows < 0, len(parts_frame), rows), len(parts_frame))
+    line_rows = rows[codes]
+
+    common = {
+        "index no": np.arange(start_index, start_index + n),
+        "Matrix": "",
+        "Matrix URN": "",
+        "Order type": "Club",
+        "Project Ref": club_df["Local Marketing Order Ref"].to_numpy(),
+        "Project name": "Club",
+        "Brief ref": club_df["Local Marketing Order Line Ref"].to_numpy(),
+    }
+    tail = {
+        "Number of clubs": 1,
+        "Comment": "",
+        "ERA Comments": "",
+        "ITG Comment": "",
+        "Credit": "",
+    }
+
+    part_rows = output_frame(
+        {
+            **common,
+            "Product": parts,
+            **{
+                attr: np.append(parts_frame[attr].to_numpy(dtype=object), "")[line_rows]
+                for attr in PART_ATTRIBUTES
+            },
+            "Quantity": club_df["Quantity"].to_numpy(),
+            "Print Matrix": "",
+            "Print Sell": print_val,
+            "Sell": "",
+            **tail,
+        },
+        n,
+    )
+    cp_rows = output_frame(
+        {
+            **common,
+            "Product": "C&P",
+            "Size": "",
+            "Pagination": "",
+            "Material": "",
+            "Finishing": "C&P",
+            "Quantity": 1,
+            "Print Matrix": "",
+            "Print Sell": cp_val,
+            "Sell": "",
+            **tail,
+        },
+        n,
+    )
+    delivery_rows = output_frame(
+        {
+            **common,
+            "Product": "Delivery",
+            "Size": "",
+            "Pagination": "",
+            "Material": "",
+            "Finishing": "Delivery",
+            "Quantity": 1,
+            "Print Matrix": "",
+            "Print Sell": d_val,
+            "Sell": sell_total,
+            **tail,
+        },
+        n,
+    )
+
+    return _interleave([part_rows, cp_rows, delivery_rows])
+
+
+def _column(df: pd.DataFrame, name: str, default="") -> pd.Series:
+    """Column ``name`` of ``df``, or ``default`` on every row if it is absent."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _coerce_sell_prices(values: pd.Series) -> np.ndarray:
+    """Sell prices as floats; blanks stay NaN, anything unparseable becomes 0."""
+    sell = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, copy=True)
+    sell[np.isnan(sell) & values.notna().to_numpy()] = 0.0
+    return sell
+
+
+def transform_production(
+    df_print: pd.DataFrame, df_cp: pd.DataFrame, start_index: int = 1
+) -> pd.DataFrame:
+    """Build the per-project Print rows, each followed by its C&P summary row.
+
+    Projects are numbered in sorted Project Ref order from ``start_index``.
+    Projects missing from the C&P file get "NOT FOUND" as their C&P price.
+    The rows are in the compact layout described in ``output_frame``.
+    """
+    df_print = df_print[df_print["Project Ref"].notna()]
+    if df_print.empty:
+        return empty_output()
+
+    codes, project_refs = pd.factorize(df_print["Project Ref"], sort=True)
+    order = np.argsort(codes, kind="stable")
+    df_print = df_print.iloc[order].reset_index(drop=True)
+    codes = codes[order]
+    n_projects = len(project_refs)
+
+    sell = _coerce_sell_prices(_column(df_print, "Production Sell Price", 0))
+    missing_sell = np.isnan(sell)
+    total_sell = np.bincount(codes, weights=np.where(missing_sell, 0.0, sell), minlength=n_projects)
+    total_sell[np.bincount(codes, weights=missing_sell, minlength=n_projects) > 0] = np.nan
+
+    # Later duplicates win, as they did with the old dict lookup
+    cp_table = df_cp[["Project Ref", CP_PRICE]].drop_duplicates("Project Ref", keep="last")
+    cp_row = pd.Index(cp_table["Project Ref"]).get_indexer(project_refs)
+    cp_found = cp_row >= 0
+    cp_cost = np.where(
+        cp_found, cp_table[CP_PRICE].to_numpy(dtype=object)[np.maximum(cp_row, 0)], None
+    )
+    if pd.api.types.is_numeric_dtype(cp_table[CP_PRICE]):
+        cp_numeric = cp_found
+    else:
+        cp_numeric = cp_found & np.array(
+            [isinstance(v, (int, float)) for v in cp_cost], dtype=bool
+        )
+    cp_cost[~cp_found] = "NOT FOUND"
+    cp_sell = np.where(cp_numeric, cp_cost, 0).astype(float)
+
+    first_rows = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    size = (
+        np.asarray(_column(df_print, "Height"), dtype=object).astype(str).astype(object)
+        + "x"
+        + np.asarray(_column(df_print, "Width"), dtype=object).astype(str).astype(object)
+    )
+
+    common = {
+        "Matrix": "Matrix",
+        "Matrix URN": "",
+        "Order type": "Camp / Misc",
+    }
+    tail = {
+        "Comment": "",
+        "ERA Comments": "",
+        "ITG Comment": "",
+        "Credit": "",
+    }
+
+    detail_rows = output_frame(
+        {
+            "index no": start_index + codes,
+            **common,
+            "Project Ref": _column(df_print, "Project Ref").to_numpy(),
+            "Project name": _column(df_print, "Project Description").to_numpy(),
+            "Brief ref": _column(df_print, "Brief Ref").to_numpy(),
+            "Product": _column(df_print, "Part").to_numpy(),
+            "Size": size,
+            "Pagination": _column(df_print, "No of Pages").to_numpy(),
+            "Material": _column(df_print, "Material").to_numpy(),
+            "Finishing": _column(df_print, "Production Finishing Notes").to_numpy(),
+            "Quantity": _column(df_print, "Total including Spares").to_numpy(),
+            "Print Matrix": "",
+            "Print Sell": sell,
+            "Sell": "",
+            "Number of clubs": _column(df_print, "No of Clubs").to_numpy(),
+            **tail,
+        },
+        len(df_print),
+    )
+    summary_rows = output_frame(
+        {
+            "index no": start_index + np.arange(n_projects),
+            **common,
+            "Project Ref": np.asarray(project_refs, dtype=object),
+            "Project name": df_print["Project Description"].to_numpy()[first_rows],
+            "Brief ref": "",
+            "Product": "C&P",
+            "Size": "",
+            "Pagination": "",
+            "Material": "",
+            "Finishing": "C&P",
+            "Quantity": "",
+            "Print Matrix": "",
+            "Print Sell": cp_cost,
+            "Sell": total_sell + cp_sell,
+            "Number of clubs": df_print["No of Clubs"].to_numpy()[first_rows],
+            **tail,
+        },
+        n_projects,
+    )
+
+    combined = concat_output([detail_rows, summary_rows])
+    is_summary = np.r_[np.zeros(len(detail_rows)), np.ones(n_projects)]
+    position = np.lexsort((is_summary, combined["index no"].to_numpy()))
+    return combined.take(position).reset_index(drop=True)
+
+
+def iter_combined_chunks(
+    club_frames, df_print: pd.DataFrame, df_cp: pd.DataFrame, parts_lookup: Mapping,
+    chunk_rows: int = CHUNK_ROWS, profile: Optional[RunProfile] = None,
+    matches: Optional[PartMatchLog] = None,
+):
+    """The combined output as a sequence of bounded-size frames.
+
+    Parsed club frames are consumed one at a time and transformed at most
+    ``chunk_rows`` lines at a time, with ``index no`` carrying on across
+    chunks and into the production projects, which come last. Concatenated,
+    the chunks hold the same rows as the in-memory path.
+    """
+    profile = profile or RunProfile()
+    index_counter = 1
+    for club_df in club_frames:
+        for start in range(0, len(club_df), chunk_rows):
+            chunk = club_df.iloc[start : start + chunk_rows]
+            with profile.stage("club transform", rows_in=len(chunk)) as run:
+                out = transform_club_orders(chunk, parts_lookup, index_counter, matches)
+                run.rows_out = len(out)
+            yield out
+            index_counter += len(chunk)
+    with profile.stage("production transform", rows_in=len(df_print)) as run:
+        out = transform_production(df_print, df_cp, index_counter)
+        run.rows_out = len(out)
+    yield out
+
+
+@dataclass
+class ProductionInputs:
+    """Print rows and the C&P table of any number of production workbooks.
+
+    ``df_cp`` has one row per Project Ref. ``issues`` lists the Project Refs
+    that need checking: C&P entries repeated (``"duplicate C&P"``) or with
+    different prices (``"conflicting C&P"``), where the last one is used, and
+    projects in more than one Print workbook, whose rows are all kept.
+    """
+
+    df_print: pd.DataFrame
+    df_cp: pd.DataFrame
+    issues: pd.DataFrame
+
+
+ISSUE_COLUMNS = ["Project Ref", "Issue", "Files", "C&P prices", "Used"]
+
+
+def _joined(values) -> str:
+    return ", ".join(str(v) for v in values)
+
+
+def _cp_issues(entries: pd.DataFrame) -> pd.DataFrame:
+    """Issues for the C&P entries (Project Ref, price, File) of refs listed more than once."""
+    grouped = entries.groupby("Project Ref", sort=True)
+    prices = grouped[CP_PRICE]
+    return pd.DataFrame(
+        {
+            "Project Ref": prices.size().index,
+            "Issue": np.where(
+                prices.nunique(dropna=False).to_numpy() > 1, "conflicting C&P", "duplicate C&P"
+            ),
+            "Files": grouped["File"].agg(lambda f: _joined(dict.fromkeys(f))).to_numpy(),
+            "C&P prices": prices.agg(_joined).to_numpy(),
+            # The entry merged is the last one, even when its price is blank
+            "Used": prices.last(skipna=False).to_numpy(dtype=object),
+        }
+    )
+
+
+def combine_production(workbooks) -> ProductionInputs:
+    """Classify and combine ``(file name, frame)`` production workbooks.
+
+    A workbook with a "Collate And Pack Cost Price" column is a C&P file and
+    any other is a Print file; at least one of each is needed. Print rows are
+    stacked in the order given. C&P entries are stacked the same way and
+    deduplicated by Project Ref, later entries winning as they always have.
+    """
+    workbooks = list(workbooks)
+    prints = [(name, df) for name, df in workbooks if CP_PRICE not in df.columns]
+    cps = [(name, df) for name, df in workbooks if CP_PRICE in df.columns]
+    if not prints or not cps:
+        raise ValueError(
+            "The production files must include at least one Print and one C&P workbook"
+        )
+
+    df_print = prints[0][1] if len(prints) == 1 else pd.concat(
+        [df for _, df in prints], ignore_index=True
+    )
+    entries = pd.concat(
+        [df[["Project Ref", CP_PRICE]].assign(File=name) for name, df in cps],
+        ignore_index=True,
+    )
+    entries = entries[entries["Project Ref"].notna()]
+    repeated = entries["Project Ref"].duplicated(keep=False).to_numpy()
+    df_cp = entries[["Project Ref", CP_PRICE]].drop_duplicates("Project Ref", keep="last")
+
+    print_refs = pd.concat(
+        [
+            pd.DataFrame({"Project Ref": df["Project Ref"].dropna().unique(), "File": name})
+            for name, df in prints
+        ],
+        ignore_index=True,
+    )
+    in_several = print_refs[print_refs["Project Ref"].duplicated(keep=False).to_numpy()]
+    print_issues = in_several.groupby("Project Ref", sort=True)["File"].agg(_joined)
+    issues = pd.concat(
+        [
+            _cp_issues(entries[repeated]),
+            pd.DataFrame(
+                {
+                    "Project Ref": print_issues.index,
+                    "Issue": "in several Print workbooks",
+                    "Files": print_issues.to_numpy(),
+                    "C&P prices": "",
+                    "Used": "",
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    return ProductionInputs(
+        df_print=df_print,
+        df_cp=df_cp.reset_index(drop=True),
+        issues=issues.reindex(columns=ISSUE_COLUMNS),
+    )
+
+
+def split_production(df1: pd.DataFrame, df2: pd.DataFrame):
+    """Tell a Print and a C&P workbook apart; returns ``(df_print, df_cp)``."""
+    production = combine_production([("1", df1), ("2", df2)])
+    return production.df_print, production.df_cp
+
+
+def build_combined(
+    club_frames, df_print: pd.DataFrame, df_cp: pd.DataFrame, parts_lookup: Mapping,
+    profile: Optional[RunProfile] = None, matches: Optional[PartMatchLog] = None,
+) -> pd.DataFrame:
+    """The whole combined output as one frame."""
+    profile = profile or RunProfile()
+    club_df = pd.concat(club_frames, ignore_index=True)
+    with profile.stage("club transform", rows_in=len(club_df)) as run:
+        df_club_out = transform_club_orders(club_df, parts_lookup, matches=matches)
+        run.rows_out = len(df_club_out)
+    with profile.stage("production transform", rows_in=len(df_print)) as run:
+        df_prod_out = transform_production(df_print, df_cp, 1 + len(club_df))
+        run.rows_out = len(df_prod_out)
+    return concat_output([df_club_out, df_prod_out])
+
+
+def _reuse_blocks(
+    previous_output: Optional[pd.DataFrame], rebuilt: pd.DataFrame, keep: np.ndarray
+) -> pd.DataFrame:
+    """Previous output rows whose ``index no`` is in ``keep`` plus ``rebuilt``, in index order."""
+    blocks = [rebuilt]
+    if previous_output is not None and len(keep):
+        blocks.insert(0, previous_output[previous_output["index no"].isin(keep)])
+    combined = concat_output(blocks)
+    return combined.sort_values("index no", kind="stable").reset_index(drop=True)
+
+
+@dataclass
+class RemergeStats:
+    """How much of an incremental merge was rebuilt rather than reused."""
+
+    club_rebuilt: int = 0
+    club_reused: int = 0
+    projects_rebuilt: int = 0
+    projects_reused: int = 0
+
+
+def remerge_combined(
+    club_frames,
+    df_print: pd.DataFrame,
+    df_cp: pd.DataFrame,
+    parts_lookup: Mapping,
+    state: Optional[MergeState] = None,
+    profile: Optional[RunProfile] = None,
+    matches: Optional[PartMatchLog] = None,
+):
+    """The combined output, rebuilding only what changed since ``state``.
+
+    Returns ``(final_df, new_state, stats)``. Without a previous state this
+    numbers and builds everything as ``build_combined`` does. With one, club
+    lines and production projects whose inputs are unchanged reuse their
+    previous rows, and every line and project keeps its ``index no``.
+    Club lines come first and production projects last, each in
+    ``index no`` order. ``matches`` records the Part matching of every club
+    line, reused or not.
+    """
+    profile = profile or RunProfile()
+    club_df = pd.concat(club_frames, ignore_index=True)
+    next_index = 1 if state is None else state.next_index
+
+    with profile.stage("incremental diff", rows_in=len(club_df) + len(df_print)):
+        current_parts_key = parts_key(attributes_frame(parts_lookup))
+        club = club_fingerprints(club_df)
+        club_index, club_unchanged, next_index = assign_indices(
+            club, None if state is None else state.club, CLUB_KEY + ["occurrence"], next_index
+        )
+        if state is not None and state.parts_key != current_parts_key:
+            club_unchanged[:] = False
+        projects = project_fingerprints(df_print, df_cp)
+        project_index, project_unchanged, next_index = assign_indices(
+            projects, None if state is None else state.projects, PROJECT_KEY, next_index
+        )
+
+    with profile.stage("club transform", rows_in=int((~club_unchanged).sum())) as run:
+        club_rebuilt = transform_club_orders(club_df[~club_unchanged], parts_lookup)
+        run.rows_out = len(club_rebuilt)
+    if matches is not None:
+        matches.record(*part_index(parts_lookup).resolve(club_df["Part"]))
+    club_rebuilt["index no"] = np.repeat(club_index[~club_unchanged], 3)
+    club_output = _reuse_blocks(
+        None if state is None else state.club_output,
+        club_rebuilt,
+        club_index[club_unchanged],
+    )
+
+    changed_refs = projects["Project Ref"][~project_unchanged]
+    changed_print = df_print[df_print["Project Ref"].isin(changed_refs)]
+    with profile.stage("production transform", rows_in=len(changed_print)) as run:
+        production_rebuilt = transform_production(changed_print, df_cp)
+        run.rows_out = len(production_rebuilt)
+    production_rebuilt["index no"] = production_rebuilt["Project Ref"].map(
+        pd.Series(project_index, index=projects["Project Ref"])
+    )
+    production_output = _reuse_blocks(
+        None if state is None else state.production_output,
+        production_rebuilt,
+        project_index[project_unchanged],
+    )
+
+    new_state = MergeState(
+        parts_key=current_parts_key,
+        next_index=next_index,
+        club=club.assign(**{"index no": club_index}),
+        club_output=club_output,
+        projects=projects.assign(**{"index no": project_index}),
+        production_output=production_output,
+    )
+    stats = RemergeStats(
+        club_rebuilt=int((~club_unchanged).sum()),
+        club_reused=int(club_unchanged.sum()),
+        projects_rebuilt=int((~project_unchanged).sum()),
+        projects_reused=int(project_unchanged.sum()),
+    )
+    final_df = concat_output([club_output, production_output])
+    return final_df, new_state, stats
+
+
+@dataclass
+class MergeReport:
+    """What a merge run wrote and which files it had to skip."""
+
+    rows: int = 0
+    failures: list = field(default_factory=list)
+    remerge: Optional[RemergeStats] = None
+    profile: Optional[RunProfile] = None
+    part_matches: PartMatchLog = field(default_factory=PartMatchLog)
+    production_issues: Optional[pd.DataFrame] = None
+    issues: Optional[pd.DataFrame] = None
+    summaries: dict = field(default_factory=dict)
+
+
+def run_merge(
+    club_uploads,
+    production_uploads,
+    target,
+    *,
+    low_memory: bool = False,
+    cache=None,
+    parts_lookup: Optional[Mapping] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_failure: Optional[Callable[[IngestResult], None]] = None,
+    on_file: Optional[Callable[[IngestResult], None]] = None,
+    extra_outputs: Optional[Mapping] = None,
+    state_path: Optional[str] = None,
+    store: Optional[OrderStore] = None,
+    since=None,
+    until=None,
+    profile: Optional[RunProfile] = None,
+) -> MergeReport:
+    """Merge club and production uploads into the Combined Data workbook.
+
+    ``target`` is a path or writable binary file. ``extra_outputs`` maps
+    formats in ``TABLE_WRITERS`` ("parquet", "csv") to further targets that
+    get a typed copy of the same rows. ``production_uploads`` are any number
+    of Print and C&P workbooks, combined by ``combine_production``; Project
+    Refs to check are listed in ``report.production_issues``. Unreadable
+    club files are skipped and reported through ``on_failure`` and the
+    returned report; unreadable production files, production files without
+    both a Print and a C&P workbook, or no readable club files at all, raise
+    ValueError. ``on_file`` is called with every file's result once it has
+    been read. ``low_memory`` streams the club files through the transform
+    in batches of ``chunk_rows`` lines and bypasses ``cache``.
+
+    With ``state_path`` the merge is incremental: only club lines and
+    projects that changed since the run that saved ``state_path`` are
+    rebuilt, ``index no`` stays stable, and the new state is saved there once
+    the output is written. It cannot be combined with ``low_memory``.
+
+    With ``store`` the readable club uploads are upserted into it, and the
+    merge runs over the stored lines placed from ``since`` to ``until``
+    (inclusive, either may be None) instead of over the uploads alone.
+
+    Stage timings are recorded in ``profile`` (a new ``RunProfile`` if None)
+    and returned as ``report.profile``. Club Parts that were not matched to
+    the catalogue exactly are listed in ``report.part_matches``.
+
+    Every club, Print and C&P frame read is checked against the rules in
+    ``validation``; the issues found are returned as ``report.issues`` and
+    written to an "Issues" sheet after the combined rows. Totals by Order
+    type, club Location, Part and project are worked out from the frames as
+    they pass, returned as ``report.summaries`` and written to a sheet each,
+    between the combined rows and the issues.
+    """
+    if low_memory and state_path is not None:
+        raise ValueError("Incremental merges cannot run in low-memory mode")
+    extra_outputs = dict(extra_outputs or {})
+    unknown = set(extra_outputs) - set(TABLE_WRITERS)
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {', '.join(sorted(unknown))}")
+    parts_lookup = get_catalogue() if parts_lookup is None else parts_lookup
+    profile = profile or RunProfile()
+    report = MergeReport(profile=profile)
+    validator = Validator(parts_lookup)
+
+    summaries = SummaryBuilder()
+
+    def validate(source, df, file):
+        with profile.stage("validation", rows_in=len(df)):
+            validator.check(source, df, file)
+        return df
+
+    def club_frame(df, file):
+        validate(CLUB, df, file)
+        with profile.stage("summaries", rows_in=len(df)):
+            summaries.add_club(df, *club_charges(df))
+        return df
+
+    def check(results):
+        for result in results:
+            for step, seconds in result.timings.items():
+                profile.add(
+                    f"{result.kind} {step} (summed over files)",
+                    seconds,
+                    rows_out=len(result.frame),
+                    worker=True,
+                )
+            if not result.ok:
+                report.failures.append(result)
+                if on_failure is not None:
+                    on_failure(result)
+            if on_file is not None:
+                on_file(result)
+            yield result
+
+    club_jobs = [("club", upload) for upload in club_uploads]
+    prod_jobs = [("production", upload) for upload in production_uploads]
+
+    # --- Load production files ---
+    prod_results = iter_ingest(prod_jobs, cache=cache, max_workers=max_workers)
+    prod_results = list(check(profile.iter_stage("production files", prod_results)))
+    if not all(r.ok for r in prod_results):
+        raise ValueError("Every production file must be readable")
+    with profile.stage("production combine", rows_in=sum(len(r.frame) for r in prod_results)):
+        production = combine_production((r.name, r.frame) for r in prod_results)
+    report.production_issues = production.issues
+    df_print, df_cp = production.df_print, production.df_cp
+    validator.set_production(df_print, df_cp)
+    validator.add(production_issues(production.issues))
+    for r in prod_results:
+        validate(CP if CP_PRICE in r.frame.columns else PRINT, r.frame, r.name)
+
+    if store is not None:
+        club_results = iter_ingest(club_jobs, max_workers=max_workers)
+        for result in check(profile.iter_stage("club files", club_results)):
+            if result.ok:
+                with profile.stage("order store upsert", rows_in=len(result.frame)):
+                    store.upsert(result.frame)
+
+    if low_memory:
+        if store is not None:
+            club_frames = (
+                club_frame(frame, "order store")
+                for frame in profile.iter_stage(
+                    "order store read", store.iter_orders(since, until, chunk_rows)
+                )
+            )
+        else:
+            club_results = iter_ingest(club_jobs, max_workers=max_workers)
+            club_frames = (
+                club_frame(r.frame, r.name)
+                for r in check(profile.iter_stage("club files", club_results))
+                if r.ok
+            )
+        # Read up to the first club frame before any output is opened, so that a
+        # run without club lines fails here just as it does in memory
+        club_frames = iter(club_frames)
+        first = next(club_frames, None)
+        if first is None or (store is not None and first.empty):
+            raise ValueError(
+                "The order store has no club orders in that date range"
+                if store is not None
+                else "None of the club order files could be read"
+            )
+        club_frames = itertools.chain([first], club_frames)
+        chunks = iter_combined_chunks(
+            club_frames, df_print, df_cp, parts_lookup, chunk_rows, profile,
+            report.part_matches,
+        )
+    else:
+        if store is not None:
+            with profile.stage("order store read") as run:
+                club_frames = [store.orders(since, until)]
+                run.rows_out = len(club_frames[0])
+            if club_frames[0].empty:
+                raise ValueError("The order store has no club orders in that date range")
+            club_frame(club_frames[0], "order store")
+        else:
+            club_results = iter_ingest(club_jobs, cache=cache, max_workers=max_workers)
+            club_results = list(check(profile.iter_stage("club files", club_results)))
+            club_frames = [club_frame(r.frame, r.name) for r in club_results if r.ok]
+            if not club_frames:
+                raise ValueError("None of the club order files could be read")
+        if state_path is not None:
+            final_df, new_state, report.remerge = remerge_combined(
+                club_frames, df_print, df_cp, parts_lookup, MergeState.load(state_path), profile,
+                report.part_matches,
+            )
+        else:
+            final_df = build_combined(
+                club_frames, df_print, df_cp, parts_lookup, profile, report.part_matches
+            )
+        chunks = [final_df]
+
+    with ExitStack() as stack:
+
+        def open_writer(fmt, writer_cls, writer_target):
+            writer = writer_cls(writer_target, OUTPUT_COLUMNS)
+
+            def close():
+                # Closing finishes the file, which is a large part of the work for
+                # xlsx. It is timed without entering the stage, as the stage hook
+                # stops cancelled jobs: the writer and its temporary files must be
+                # closed while a cancelled or failed merge unwinds, too.
+                start = time.perf_counter()
+                try:
+                    writer.close()
+                finally:
+                    profile.add(f"write {fmt}", time.perf_counter() - start)
+
+            stack.callback(close)
+            return writer
+
+        sheet = open_writer("xlsx", CombinedSheetWriter, target)
+        writers = {"xlsx": sheet}
+        for fmt, extra_target in extra_outputs.items():
+            writers[fmt] = open_writer(fmt, TABLE_WRITERS[fmt], extra_target)
+        for chunk in chunks:
+            for fmt, writer in writers.items():
+                with profile.stage(f"write {fmt}", rows_in=len(chunk)):
+                    writer.append(chunk)
+            with profile.stage("summaries", rows_in=len(chunk)):
+                summaries.add(chunk)
+        report.summaries = summaries.sheets()
+        for name, summary in report.summaries.items():
+            with profile.stage("write xlsx", rows_in=len(summary)):
+                sheet.add_sheet(name, summary)
+        report.issues = validator.issues()
+        with profile.stage("write xlsx", rows_in=len(report.issues)):
+            sheet.add_sheet(ISSUES_SHEET, report.issues)
+    report.rows = sheet.rows_written
+    if state_path is not None:
+        new_state.save(state_path)
+    return report
+
+
+def _expand_globs(patterns) -> list:
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No files match {pattern}")
+        paths.extend(m for m in matches if m not in paths)
+    return paths
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="era_engine", description="Merge ERA club and production data into one workbook."
+    )
+    parser.add_argument(
+        "--club", nargs="+", default=[], metavar="GLOB",
+        help="club general_report workbooks; globs are expanded and sorted",
+    )
+    parser.add_argument(
+        "--production", nargs="+", required=True, metavar="GLOB",
+        help="Print and C&P workbooks, one or more pairs in any order; globs are expanded",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=f"ERA_Combined_Data_{datetime.today().strftime('%Y-%m-%d')}.xlsx",
+        help="output workbook (default: %(default)s)",
+    )
+    for fmt in TABLE_WRITERS:
+        parser.add_argument(
+            f"--{fmt}", metavar="PATH",
+            help=f"also write the rows as typed {fmt.upper()} to PATH",
+        )
+    parser.add_argument(
+        "--low-memory", action="store_true",
+        help="transform club files in batches to keep memory flat",
+    )
+    parser.add_argument(
+        "--state", metavar="PATH",
+        help="incremental merge: reuse the output saved in PATH for unchanged "
+        "orders and projects, then save this run's state there",
+    )
+    parser.add_argument(
+        "--store", metavar="PATH",
+        help="order store (SQLite): add the club files to it, dropping lines already "
+        "stored, and merge the stored lines placed from --since to --until",
+    )
+    parser.add_argument(
+        "--since", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="first Order Placed Date merged from --store",
+    )
+    parser.add_argument(
+        "--until", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="last Order Placed Date merged from --store",
+    )
+    parser.add_argument(
+        "--profile-json", metavar="PATH",
+        help="write per-stage timings and memory as JSON to PATH",
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="record each stage's peak Python allocations (slower)",
+    )
+    parser.add_argument(
+        "--cprofile", metavar="PATH",
+        help="run under cProfile and dump the stats to PATH (main process only)",
+    )
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="exit non-zero if any club file could not be read",
+    )
+    args = parser.parse_args(argv)
+    if not args.club and args.store is None:
+        parser.error("--club is required unless --store is given")
+    if (args.since or args.until) and args.store is None:
+        parser.error("--since/--until need --store")
+
+    extra_outputs = {
+        fmt: getattr(args, fmt) for fmt in TABLE_WRITERS if getattr(args, fmt) is not None
+    }
+    store = None
+    profile = RunProfile(trace_memory=args.trace_memory)
+    try:
+        club_paths = _expand_globs(args.club)
+        production_paths = _expand_globs(args.production)
+        if args.store is not None:
+            store = OrderStore(args.store)
+        with ExitStack() as stack:
+            stack.enter_context(profile)
+            if args.cprofile is not None:
+                profiler = stack.enter_context(cprofiled())
+                stack.callback(lambda: profiler.dump_stats(args.cprofile))
+            report = run_merge(
+                [Upload.from_path(p) for p in club_paths],
+                [Upload.from_path(p) for p in production_paths],
+                args.output,
+                low_memory=args.low_memory,
+                chunk_rows=args.chunk_rows,
+                max_workers=args.workers,
+                on_failure=lambda r: print(
+                    f"Could not read {r.name}: {r.error}", file=sys.stderr
+                ),
+                extra_outputs=extra_outputs,
+                state_path=args.state,
+                store=store,
+                since=args.since,
+                until=args.until,
+                profile=profile,
+            )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if store is not None:
+            store.close()
+
+    outputs = ", ".join([args.output, *extra_outputs.values()])
+    source = f"{len(club_paths)} club files"
+    if args.store is not None:
+        source += f" and the order store {args.store}"
+    print(f"Wrote {report.rows} rows from {source} to {outputs}")
+    if report.remerge is not None:
+        stats = report.remerge
+        print(
+            f"Rebuilt {stats.club_rebuilt} club lines and {stats.projects_rebuilt} projects; "
+            f"reused {stats.club_reused} and {stats.projects_reused}"
+        )
+    if report.production_issues is not None and len(report.production_issues):
+        print("Production Project Refs to check:", file=sys.stderr)
+        print(report.production_issues.to_string(index=False), file=sys.stderr)
+    if len(report.issues):
+        print(f"Data issues ({len(report.issues)}), listed on the Issues sheet:", file=sys.stderr)
+        print(issue_counts(report.issues).to_string(index=False), file=sys.stderr)
+    if len(report.part_matches):
+        print("Parts not matched to the catalogue exactly:", file=sys.stderr)
+        print(report.part_matches.summary().to_string(index=False), file=sys.stderr)
+    if args.profile_json is not None:
+        with open(args.profile_json, "w") as f:
+            f.write(profile.to_json(indent=2))
+    if args.strict and report.failures:
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
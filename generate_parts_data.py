@@ -1,40 +1,99 @@
+"""Compile ``Parts Export.xlsx`` into ``parts_catalogue.json``.
+
+    python generate_parts_data.py [--source "Parts Export.xlsx"]
+                                  [--output parts_catalogue.json] [--force]
+
+The compiled catalogue records the SHA-256 of the workbook it was built
+from, so a run against the same workbook stops before reading it, and
+running this on every deploy costs a file hash. Otherwise the export is
+compiled and compared with the current catalogue by Part URN; the parts
+added, removed and changed (with the columns that changed) are listed, and
+the catalogue is saved with the export's rows. ``--force`` rebuilds even
+when the workbook is unchanged.
+"""
+
+import argparse
+import hashlib
+import io
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
 import pandas as pd
-import numpy as np
-
-# Read the Excel file
-df = pd.read_excel('Parts Export.xlsx')
-
-# Print column names
-print("Column names in the Excel file:")
-print(df.columns.tolist())
-
-# Convert DataFrame to dictionary
-PARTS_DATA_RAW = {}
-for _, row in df.iterrows():
-    # Convert row to dictionary, keeping all columns
-    row_dict = row.to_dict()
-    # Replace nan values with None for proper string representation
-    row_dict = {k: (None if pd.isna(v) else v) for k, v in row_dict.items()}
-    # Use the Part URN as the key
-    key = str(int(row_dict['Part URN']))  # Convert to int first to remove decimal places
-    PARTS_DATA_RAW[key] = row_dict
-
-print("\nFirst row raw data:")
-print(df.iloc[0])
-
-print("\nFirst entry in PARTS_DATA_RAW:")
-first_key = list(PARTS_DATA_RAW.keys())[0]
-print(f"Key: {first_key}")
-print("Values:")
-for k, v in PARTS_DATA_RAW[first_key].items():
-    print(f"  {k}: {v}")
-
-# Create a string representation of the dictionary
-dict_str = "PARTS_DATA_RAW = " + str(PARTS_DATA_RAW)
-
-# Write to parts_data.py
-with open('parts_data.py', 'w') as f:
-    f.write(dict_str)
-
-print(f"\nCreated PARTS_DATA_RAW dictionary with {len(PARTS_DATA_RAW)} entries")
-print("Dictionary has been saved to 'parts_data.py'") 
\ No newline at end of file
+
+from parts_catalogue import CATALOGUE_PATH, CatalogueDiff, PartsCatalogue, diff_catalogues
+
+SOURCE_PATH = Path(__file__).with_name("Parts Export.xlsx")
+
+
+@dataclass
+class CatalogueRefresh:
+    """What a refresh did: skipped as unchanged, or rebuilt with ``diff``."""
+
+    skipped: bool
+    catalogue: Optional[PartsCatalogue] = None
+    previous: Optional[PartsCatalogue] = None
+    diff: Optional[CatalogueDiff] = None
+
+
+def _current(path) -> Optional[PartsCatalogue]:
+    try:
+        return PartsCatalogue.load(path)
+    except (OSError, ValueError):
+        # Missing, unreadable or in an old format: build from scratch
+        return None
+
+
+def refresh_catalogue(source=SOURCE_PATH, path=CATALOGUE_PATH, force: bool = False):
+    """Rebuild the catalogue at ``path`` from ``source`` unless the workbook is unchanged."""
+    data = Path(source).read_bytes()
+    source_sha256 = hashlib.sha256(data).hexdigest()
+    current = _current(path)
+    if not force and current is not None and current.source_sha256 == source_sha256:
+        return CatalogueRefresh(skipped=True, catalogue=current)
+
+    catalogue = PartsCatalogue.from_frame(pd.read_excel(io.BytesIO(data)), source_sha256)
+    diff = diff_catalogues(current, catalogue)
+    catalogue.save(path)
+    return CatalogueRefresh(skipped=False, catalogue=catalogue, previous=current, diff=diff)
+
+
+def describe(refresh: CatalogueRefresh) -> str:
+    """A report of the refresh for the console."""
+    catalogue = refresh.catalogue
+    if refresh.skipped:
+        return f"Parts export unchanged; keeping the {catalogue.n_records} compiled parts"
+    diff = refresh.diff
+
+    def name(urn, catalogue=catalogue):
+        return catalogue.by_urn(urn)["Part Name"]
+
+    lines = [
+        f"Compiled {catalogue.n_records} parts: {len(diff.added)} added, "
+        f"{len(diff.removed)} removed, {len(diff.changed)} changed"
+    ]
+    lines += [f"  + {urn} {name(urn)}" for urn in diff.added]
+    lines += [f"  - {urn} {name(urn, refresh.previous)}" for urn in diff.removed]
+    lines += [f"  ~ {urn} {name(urn)}: {', '.join(cols)}" for urn, cols in diff.changed.items()]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=str(SOURCE_PATH))
+    parser.add_argument("--output", default=str(CATALOGUE_PATH))
+    parser.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    args = parser.parse_args(argv)
+
+    try:
+        refresh = refresh_catalogue(args.source, args.output, args.force)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(describe(refresh))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
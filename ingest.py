@@ -0,0 +1,408 @@
+"""Reading and parsing uploaded workbooks.
+
+Club general_report exports and Print/C&P production workbooks are parsed
+here, optionally in a process pool so a batch of 20-40 club files uses more
+than one core. Files that fail to parse are reported individually rather
+than aborting the batch.
+"""
+
+import io
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from upload_cache import content_key
+from xlsx_reader import DEFAULT_READER, stream_sheet
+
+# Constants for general report parsing
+OLD_PRICE_COLUMNS = [
+    "Sell Price (DT)",
+    "Sell Price (FT)",
+    "Sell Price (STK)",
+    "Sell Price (STA)",
+    "Sell Price (RFP)",
+]
+
+BASE_COLUMNS = [
+    "Order Owner",
+    "Order Status",
+    "Local Marketing Order Ref",
+    "Stock Order Ref",
+    "Order Placed Date",
+    "Order Line Reference",
+    "Local Marketing Asset",
+    "Local Marketing Order Line Ref",
+    "Stock Item",
+    "Stock Order Line Ref",
+    "Part",
+    "Quantity",
+    "Date Approved",
+    "Location",
+    "Workflow Reference Number",
+]
+
+COST_COLUMNS = [
+    "If tender pre 5.25%",
+    "Print",
+    "Collate & pack",
+    "Despatch",
+    "Total",
+]
+
+FINAL_COLUMNS = BASE_COLUMNS + COST_COLUMNS
+
+# Every general_report column the parser can use
+GENERAL_REPORT_COLUMNS = FINAL_COLUMNS + OLD_PRICE_COLUMNS
+
+# Text columns with few distinct values, returned as categoricals
+CATEGORY_COLUMNS = ["Order Owner", "Order Status", "Part", "Location"]
+
+DATE_COLUMNS = ["Order Placed Date", "Date Approved"]
+
+# The column that marks a production workbook as the C&P file
+CP_PRICE = "Collate And Pack Cost Price"
+
+# Production workbook columns used by the merge
+PRODUCTION_COLUMNS = [
+    "Project Ref",
+    "Project Description",
+    "Brief Ref",
+    "Part",
+    "Height",
+    "Width",
+    "No of Pages",
+    "Material",
+    "Production Finishing Notes",
+    "Total including Spares",
+    "Production Sell Price",
+    "No of Clubs",
+    CP_PRICE,
+]
+
+def parse_general_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse a general_report sheet into a unified schema."""
+
+    # --- Promote header row ---
+    non_empty = df.notna().any(axis=1).to_numpy()
+    if not non_empty.any():
+        raise ValueError("Could not determine header row")
+    header_row_idx = int(non_empty.argmax())
+
+    header = df.iloc[header_row_idx].astype(str).str.strip()
+    df = df.iloc[header_row_idx + 1 :].reset_index(drop=True)
+    df.columns = pd.Index(header.tolist())
+    return normalise_general_report(df)
+
+
+# Date formats seen in the exports, tried with pyarrow's vectorised strptime.
+# The one that matched most cells last time is tried first; text none of them
+# match is parsed as ISO 8601 and then by day-first inference.
+DATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+    "%Y-%m-%d",
+]
+_date_format = DATE_FORMATS[0]
+
+
+def _parse_date_text(text: np.ndarray) -> np.ndarray:
+    """Date strings as datetime64[us]; unparseable ones are NaT."""
+    global _date_format
+    strings = pa.array(text, type=pa.string())
+    parsed = np.full(len(text), np.datetime64("NaT"), dtype="datetime64[us]")
+    pending = np.ones(len(text), dtype=bool)
+    matched = {}
+    for fmt in [_date_format] + [f for f in DATE_FORMATS if f != _date_format]:
+        rows = np.flatnonzero(pending)
+        if not len(rows):
+            break
+        attempt = pc.strptime(strings.take(rows), format=fmt, unit="us", error_is_null=True)
+        found = attempt.is_valid().to_numpy(zero_copy_only=False)
+        if found.any():
+            parsed[rows[found]] = attempt.to_numpy(zero_copy_only=False)[found]
+            pending[rows[found]] = False
+            matched[fmt] = found.sum()
+    if matched:
+        _date_format = max(matched, key=matched.get)
+
+    if pending.any():
+        rest = pd.Series(text[pending])
+        dates = pd.to_datetime(rest, format="ISO8601", errors="coerce")
+        guess = dates.isna().to_numpy()
+        if guess.any():
+            dates[guess] = pd.to_datetime(
+                rest[guess], format="mixed", dayfirst=True, errors="coerce"
+            )
+        parsed[pending] = dates.to_numpy(dtype="datetime64[us]")
+    return parsed
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Export date cells (datetimes or text) as datetimes; unparseable cells are NaT."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    cells = values.to_numpy(dtype=object)
+    is_text = np.fromiter((isinstance(v, str) for v in cells), dtype=bool, count=len(cells))
+    parsed = np.full(len(cells), np.datetime64("NaT"), dtype="datetime64[us]")
+    if is_text.any():
+        parsed[is_text] = _parse_date_text(cells[is_text])
+    other = ~is_text & values.notna().to_numpy()
+    if other.any():
+        # Datetime cells, or numbers from a workbook without date styles
+        parsed[other] = pd.to_datetime(
+            pd.Series(cells[other]), errors="coerce"
+        ).to_numpy(dtype="datetime64[us]")
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
+def _numbers(values: pd.Series) -> np.ndarray:
+    """``values`` as float64, with anything non-numeric as NaN."""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors="coerce")
+    return values.to_numpy(dtype=float, na_value=np.nan)
+
+
+def normalise_general_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Map a general_report frame whose columns are its header into the unified schema.
+
+    Order Owner, Order Status, Part and Location come back as categoricals
+    and Quantity as int32; cost columns are float64 with blanks as 0.
+    """
+    df.columns = df.columns.astype(str).str.strip()
+    df = df.dropna(how="all")
+
+    # --- Detect format ---
+    is_old = any(col in df.columns for col in OLD_PRICE_COLUMNS)
+    is_new = ("Total" in df.columns) and any(
+        col in df.columns for col in ["Print", "Collate & pack", "Despatch"]
+    )
+    if not (is_old or is_new):
+        raise ValueError(
+            "Unrecognized general_report format. Expected Sell Price columns or Total with Print/Collate & pack/Despatch columns."
+        )
+
+    # --- Validate required columns ---
+    missing = [c for c in BASE_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    # --- Map cost columns to the unified schema, as one float block ---
+    costs = np.zeros((len(df), len(COST_COLUMNS)))
+    if is_old:
+        # Old exports carry one price per line, spread over the Sell Price columns
+        prices = [_numbers(df[col]) for col in OLD_PRICE_COLUMNS if col in df.columns]
+        costs[:, -1] = np.nansum(np.column_stack(prices), axis=1)
+    else:
+        for i, col in enumerate(COST_COLUMNS):
+            if col in df.columns:
+                costs[:, i] = _numbers(df[col])
+        costs[np.isnan(costs)] = 0.0
+
+    # Unreadable quantities become 0, which validation reports
+    quantity = _numbers(df["Quantity"])
+    bad_quantity = np.isnan(quantity)
+
+    # --- Build the result in one go rather than copying and assigning ---
+    columns = {}
+    for col in BASE_COLUMNS:
+        if col in DATE_COLUMNS:
+            columns[col] = parse_dates(df[col])
+        elif col in CATEGORY_COLUMNS:
+            columns[col] = df[col].astype("category")
+        elif col == "Quantity":
+            columns[col] = pd.Series(
+                np.where(bad_quantity, 0, quantity).astype(np.int32), index=df.index
+            )
+        else:
+            columns[col] = df[col]
+    for i, col in enumerate(COST_COLUMNS):
+        columns[col] = pd.Series(costs[:, i], index=df.index)
+    return pd.DataFrame(columns, copy=False)
+
+
+@contextmanager
+def _timed(timings: Optional[dict], stage: str):
+    """Add the time the block takes to ``timings[stage]``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def load_club_report(
+    data: bytes, reader: str = DEFAULT_READER, timings: Optional[dict] = None
+) -> pd.DataFrame:
+    """Parse the bytes of one club general_report workbook.
+
+    The "stream" reader falls back to ``pd.read_excel`` if it cannot read
+    the workbook. Seconds spent reading the sheet and parsing the report
+    are added to ``timings["read"]`` and ``timings["parse"]``.
+    """
+    if reader == "stream":
+        try:
+            with _timed(timings, "read"):
+                df = stream_sheet(data, usecols=GENERAL_REPORT_COLUMNS)
+        except Exception:
+            pass
+        else:
+            with _timed(timings, "parse"):
+                return normalise_general_report(df)
+    with _timed(timings, "read"):
+        df = pd.read_excel(io.BytesIO(data), header=None)
+    with _timed(timings, "parse"):
+        return parse_general_report(df)
+
+
+def load_production_workbook(
+    data: bytes, reader: str = DEFAULT_READER, timings: Optional[dict] = None
+) -> pd.DataFrame:
+    """Read the bytes of a Print or C&P workbook, with stripped column names.
+
+    Seconds spent reading are added to ``timings["read"]``.
+    """
+    with _timed(timings, "read"):
+        if reader == "stream":
+            try:
+                return stream_sheet(data, header_row=1, usecols=PRODUCTION_COLUMNS)
+            except Exception:
+                pass
+        df = pd.read_excel(io.BytesIO(data), header=1)
+        df.columns = df.columns.str.strip()
+        return df
+
+
+PARSERS = {
+    "club": load_club_report,
+    "production": load_production_workbook,
+}
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("ERA_INGEST_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+@dataclass
+class Upload:
+    """An uploaded workbook: its file name and raw bytes, or a path to read them from.
+
+    An upload made with ``from_path`` holds only the path; its bytes are read
+    each time ``read`` is called, when the file is parsed, and not kept.
+    """
+
+    name: str
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+    @classmethod
+    def from_path(cls, path: str) -> "Upload":
+        return cls(os.path.basename(path), path=path)
+
+    def read(self) -> bytes:
+        if self.data is not None:
+            return self.data
+        with open(self.path, "rb") as f:
+            return f.read()
+
+
+@dataclass
+class IngestResult:
+    kind: str
+    name: str
+    frame: Optional[pd.DataFrame] = None
+    error: Optional[str] = None
+    cached: bool = False
+    timings: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _parse(kind: str, data: bytes):
+    """The parsed frame and the seconds each parsing step took."""
+    timings = {}
+    return PARSERS[kind](data, timings=timings), timings
+
+
+# Merges run in threads of the app's server, and forking a threaded process can
+# leave a child deadlocked on a lock another thread held; start workers afresh
+POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def iter_ingest(jobs, cache=None, max_workers: int = DEFAULT_MAX_WORKERS):
+    """Parse ``(kind, Upload)`` jobs, yielding one IngestResult per job in order.
+
+    Frames already in ``cache`` are reused; the rest are parsed in a process
+    pool of at most ``max_workers`` workers (inline when ``max_workers`` is
+    1). ``jobs`` may be any iterable and is consumed as the results are: at
+    most ``max_workers`` files are read and parsed ahead of the consumer, so
+    memory stays bounded however many files there are. A file that fails
+    to parse gets its error recorded on its result and the rest of the batch
+    carries on.
+    """
+    jobs = iter(jobs)
+
+    def start(kind, upload):
+        data = upload.read()
+        result = IngestResult(kind, upload.name)
+        key = content_key(kind, data)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            result.frame = cached
+            result.cached = True
+        return result, key, data
+
+    def finish(result, key, parse_call):
+        try:
+            result.frame, result.timings = parse_call()
+        except Exception as e:
+            result.error = str(e)
+            return result
+        if cache is not None:
+            cache.put(key, result.frame)
+        return result
+
+    def parse_inline(kind, upload):
+        result, key, data = start(kind, upload)
+        if not result.cached:
+            finish(result, key, lambda: _parse(kind, data))
+        return result
+
+    head = [] if max_workers <= 1 else list(islice(jobs, max_workers))
+    if len(head) <= 1:
+        for job in chain(head, jobs):
+            yield parse_inline(*job)
+        return
+
+    def submit(pool, kind, upload):
+        result, key, data = start(kind, upload)
+        future = None if result.cached else pool.submit(_parse, kind, data)
+        return result, key, future
+
+    with ProcessPoolExecutor(max_workers=len(head), mp_context=POOL_CONTEXT) as pool:
+        in_flight = deque(submit(pool, *job) for job in head)
+        while in_flight:
+            result, key, future = in_flight.popleft()
+            yield result if future is None else finish(result, key, future.result)
+            for job in islice(jobs, 1):
+                in_flight.append(submit(pool, *job))
+
+
+def ingest_uploads(jobs, cache=None, max_workers: int = DEFAULT_MAX_WORKERS) -> list:
+    """All results of ``iter_ingest`` as a list, in job order."""
+    return list(iter_ingest(jobs, cache=cache, max_workers=max_workers))
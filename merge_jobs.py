@@ -0,0 +1,213 @@
+"""Merges run as background jobs shared by every session of the app.
+
+Streamlit runs the script in the session's own thread on every interaction,
+so a merge started from the script blocks that session until it finishes,
+and the next click restarts it. ``JobRunner`` runs merges on a small thread
+pool shared by all sessions instead. A session submits a job, keeps its id,
+and on later reruns reads the job's progress and, once it is done, its
+result and outputs. Jobs beyond ``max_workers`` wait their turn in a queue.
+
+A job reports the stage it is in and how many of its files have been read
+through ``MergeJob.enter_stage`` and ``MergeJob.file_read``, which the merge
+calls as ``RunProfile(on_stage=...)`` and ``run_merge(on_file=...)``.
+Cancelling a queued job drops it; a running job stops with ``JobCancelled``
+the next time it starts a stage or finishes reading a file.
+
+Finished jobs are kept for ``keep_seconds`` or until discarded, and their
+outputs (e.g. ``OutputSpool`` objects) are closed then. Expired jobs are
+dropped whenever the runner is used (``submit``, ``get``, ``discard`` or
+``jobs``), which the app does on every rerun of any session.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+DEFAULT_MAX_JOBS = int(os.environ.get("ERA_MERGE_JOBS", "2"))
+DEFAULT_KEEP_SECONDS = int(os.environ.get("ERA_JOB_KEEP_MINUTES", "60")) * 60
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once it has been asked to stop."""
+
+
+class MergeJob:
+    """One submitted merge: its status, progress and, once finished, result or error."""
+
+    def __init__(self, target: Callable, files_total: int = 0, outputs: Optional[dict] = None):
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.stage = None
+        self.stages = []
+        self.files_done = 0
+        self.files_total = files_total
+        self.outputs = dict(outputs or {})
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._target = target
+        self._future = None
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._discarded = False
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the job's files read so far, or None if it has none."""
+        if not self.files_total:
+            return None
+        return min(1.0, self.files_done / self.files_total)
+
+    def _check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled(f"Job {self.id} was cancelled")
+
+    def enter_stage(self, name: str):
+        """Note that the merge started stage ``name``; stops a cancelled job."""
+        self._check_cancelled()
+        with self._lock:
+            self.stage = name
+            if name not in self.stages:
+                self.stages.append(name)
+
+    def file_read(self, result=None):
+        """Note that the merge read one more of its files; stops a cancelled job."""
+        with self._lock:
+            self.files_done += 1
+        self._check_cancelled()
+
+    def cancel(self) -> bool:
+        """Ask the job to stop; False if it had already finished."""
+        with self._lock:
+            if self.done:
+                return False
+            self._cancel.set()
+            if self._future is not None and self._future.cancel():
+                self._finish(CANCELLED)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; False if ``timeout`` seconds pass first."""
+        return self._finished.wait(timeout)
+
+    def _finish(self, status: str):
+        # The target holds the job's inputs (every uploaded file's bytes); let them go
+        self._target = None
+        self.status = status
+        self.stage = None
+        self.finished = time.time()
+        self._finished.set()
+        if self._discarded:
+            self.close()
+
+    def _run(self):
+        with self._lock:
+            if self._cancel.is_set():
+                self._finish(CANCELLED)
+                return
+            self.status = RUNNING
+            self.started = time.time()
+        try:
+            result = self._target(self)
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as e:
+            self.error = str(e)
+            status = FAILED
+        else:
+            self.result = result
+            status = DONE
+        with self._lock:
+            self._finish(status)
+
+    def discard(self):
+        """Cancel the job if it is unfinished and close its outputs once it is not."""
+        self.cancel()
+        with self._lock:
+            self._discarded = True
+            if self.done:
+                self.close()
+
+    def close(self):
+        for output in self.outputs.values():
+            output.close()
+
+
+class JobRunner:
+    """A queue of merge jobs run on at most ``max_workers`` threads."""
+
+    def __init__(
+        self, max_workers: int = DEFAULT_MAX_JOBS, keep_seconds: float = DEFAULT_KEEP_SECONDS
+    ):
+        self.keep_seconds = keep_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="merge-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        target: Callable[[MergeJob], object],
+        files_total: int = 0,
+        outputs: Optional[dict] = None,
+    ) -> MergeJob:
+        """Queue ``target(job)``; its return value becomes ``job.result``."""
+        job = MergeJob(target, files_total, outputs)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+            # Under the job's lock, so a cancel cannot see the job without its future
+            with job._lock:
+                job._future = self._pool.submit(job._run)
+        return job
+
+    def get(self, job_id) -> Optional[MergeJob]:
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def discard(self, job_id):
+        """Forget a job, cancelling it if it has not finished."""
+        with self._lock:
+            self._prune()
+            job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.discard()
+
+    def jobs(self) -> list:
+        """The jobs still held, oldest first."""
+        with self._lock:
+            self._prune()
+            return list(self._jobs.values())
+
+    def _prune(self):
+        cutoff = time.time() - self.keep_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.done and job.finished < cutoff:
+                del self._jobs[job_id]
+                job.discard()
+
+    def shutdown(self, wait: bool = True):
+        for job in self.jobs():
+            job.cancel()
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,180 @@
+"""State kept between merge runs for incremental re-merges.
+
+A re-merge compares the new inputs with fingerprints of the previous run's
+inputs and only rebuilds the output blocks that changed:
+
+- a club line's three rows, keyed by Local Marketing Order Ref / Local
+  Marketing Order Line Ref (plus its occurrence, when an export repeats a
+  line). Stock order lines have neither, and are keyed by their Order Line
+  Reference, or failing that their Stock Order Line Ref, instead;
+- a production project's Print rows and C&P row, keyed by Project Ref.
+
+Every key keeps the ``index no`` it was first given. New keys are numbered
+after the highest number handed out so far, and numbers of keys that
+disappear are not reused.
+
+Each dataset merged incrementally needs a state file of its own: two
+datasets sharing one would renumber each other's lines. ``dataset_state_path``
+gives every named dataset its own file under ``STATE_DIR``.
+
+The state is a pickle; only load state files written by this tool.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 2: club rows are built with normalised and fuzzy Part matching
+# 3: stock order lines are keyed by their own line reference
+STATE_FORMAT = 3
+STATE_DIR = os.environ.get("ERA_STATE_DIR", "era_merge_state")
+
+CLUB_KEY = ["Local Marketing Order Ref", "Local Marketing Order Line Ref"]
+PROJECT_KEY = ["Project Ref"]
+
+# What stock order lines, which have no Local Marketing refs, are keyed by
+STOCK_KEY_COLUMNS = ["Order Line Reference", "Stock Order Line Ref"]
+
+
+def dataset_state_path(dataset: str, state_dir: str = STATE_DIR) -> str:
+    """The state file of the dataset named ``dataset``, in ``state_dir``."""
+    name = re.sub(r"[^\w.-]+", "_", dataset.strip()).strip("._")
+    if not name:
+        raise ValueError("An incremental merge needs a dataset name")
+    os.makedirs(state_dir, exist_ok=True)
+    return os.path.join(state_dir, f"{name}.pkl")
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def parts_key(parts_frame: pd.DataFrame) -> str:
+    """Fingerprint of the part attributes club rows are built from."""
+    return hashlib.sha256(_row_hashes(parts_frame).tobytes()).hexdigest()
+
+
+def club_line_keys(club_df: pd.DataFrame) -> pd.DataFrame:
+    """``CLUB_KEY`` values of each club line.
+
+    A line with neither Local Marketing ref takes the first of
+    ``STOCK_KEY_COLUMNS`` it has: the column's name stands in for the Order
+    Ref and its value for the Line Ref. Without one, a stock line is keyed by
+    its position among such lines alone.
+    """
+    keys = club_df[CLUB_KEY].reset_index(drop=True).astype(object)
+    stock = keys.isna().all(axis=1).to_numpy()
+    for col in STOCK_KEY_COLUMNS:
+        if not stock.any() or col not in club_df.columns:
+            continue
+        refs = club_df[col].reset_index(drop=True)
+        use = stock & refs.notna().to_numpy()
+        keys.loc[use, CLUB_KEY[0]] = col
+        keys.loc[use, CLUB_KEY[1]] = refs[use].map(str)
+        stock = stock & ~use
+    return keys
+
+
+def club_fingerprints(club_df: pd.DataFrame) -> pd.DataFrame:
+    """``club_line_keys``, occurrence and a content hash for each club line, in order."""
+    keys = club_line_keys(club_df)
+    keys["occurrence"] = keys.groupby(CLUB_KEY, dropna=False, sort=False).cumcount()
+    keys["hash"] = pd.array(_row_hashes(club_df), dtype="UInt64")
+    return keys
+
+
+def project_fingerprints(df_print: pd.DataFrame, df_cp: pd.DataFrame) -> pd.DataFrame:
+    """Project Ref plus hashes of its Print rows and C&P entry, in sorted ref order."""
+    df_print = df_print[df_print["Project Ref"].notna()]
+    codes, refs = pd.factorize(df_print["Project Ref"], sort=True)
+
+    # Mix each row's hash with its position in the project so reordering counts
+    position = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    mixed = _row_hashes(pd.DataFrame({"row": _row_hashes(df_print), "position": position}))
+    print_hash = np.zeros(len(refs), dtype=np.uint64)
+    np.add.at(print_hash, codes, mixed)
+
+    cp_table = df_cp[["Project Ref", "Collate And Pack Cost Price"]].drop_duplicates(
+        "Project Ref", keep="last"
+    )
+    cp_position = pd.Index(cp_table["Project Ref"]).get_indexer(refs)
+    cp_hash = pd.arrays.IntegerArray(
+        _row_hashes(cp_table)[cp_position], mask=cp_position < 0
+    )
+    return pd.DataFrame(
+        {
+            "Project Ref": refs,
+            "print_hash": pd.array(print_hash, dtype="UInt64"),
+            "cp_hash": cp_hash,
+        }
+    )
+
+
+def assign_indices(
+    fingerprints: pd.DataFrame, previous: Optional[pd.DataFrame], key: list, next_index: int
+):
+    """Match ``fingerprints`` against the previous run's.
+
+    Returns ``(index no per row, unchanged mask, next free index)``. Keys
+    seen before keep their number; new keys are numbered from ``next_index``
+    in the order they appear. A row is unchanged when its key was seen
+    before with the same hashes.
+    """
+    hashes = [col for col in fingerprints.columns if col not in key]
+    if previous is None:
+        index = np.full(len(fingerprints), np.nan)
+        unchanged = np.zeros(len(fingerprints), dtype=bool)
+    else:
+        matched = pd.merge(
+            fingerprints,
+            previous,
+            on=key,
+            how="left",
+            suffixes=("", "_previous"),
+            validate="one_to_one",
+        )
+        unchanged = np.ones(len(fingerprints), dtype=bool)
+        for col in hashes:
+            same = matched[col] == matched[f"{col}_previous"]
+            # Missing C&P entries hash as NA on both sides
+            both_missing = matched[col].isna() & matched[f"{col}_previous"].isna()
+            unchanged &= (same.fillna(False) | both_missing).to_numpy(dtype=bool)
+        index = matched["index no"].to_numpy(dtype=float, na_value=np.nan, copy=True)
+        unchanged &= ~np.isnan(index)
+
+    new = np.isnan(index)
+    index[new] = next_index + np.arange(new.sum())
+    return index.astype(np.int64), unchanged, next_index + int(new.sum())
+
+
+@dataclass
+class MergeState:
+    """Fingerprints, ``index no`` assignments and output blocks of one run."""
+
+    parts_key: str
+    next_index: int
+    club: pd.DataFrame
+    club_output: pd.DataFrame
+    projects: pd.DataFrame
+    production_output: pd.DataFrame
+
+    @classmethod
+    def load(cls, path: str) -> Optional["MergeState"]:
+        """The state saved at ``path``, or None if there is none or it is outdated."""
+        if not os.path.exists(path):
+            return None
+        saved = pd.read_pickle(path)
+        if saved.get("format") != STATE_FORMAT:
+            return None
+        return cls(**saved["state"])
+
+    def save(self, path: str):
+        # Replace the old state in one step so a failed save leaves it intact
+        tmp_path = f"{path}.tmp"
+        pd.to_pickle({"format": STATE_FORMAT, "state": vars(self)}, tmp_path)
+        os.replace(tmp_path, path)
@@ -0,0 +1,156 @@
+"""Local SQLite store of parsed club order lines.
+
+Weekly general_report exports overlap, so the same order lines arrive again
+and again. Parsed exports are upserted here instead, keyed on Order Line
+Reference / Workflow Reference Number: a line seen before replaces its
+earlier copy, so duplicates are dropped as they arrive rather than in a pass
+over every line. Merges then read the lines placed in a date range straight
+from the store.
+
+Lines with neither reference are keyed on a hash of their contents, so only
+exact repeats of them are dropped.
+"""
+
+import sqlite3
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from ingest import CATEGORY_COLUMNS, COST_COLUMNS, DATE_COLUMNS, FINAL_COLUMNS
+from xlsx_reader import TEXT_DTYPE
+
+KEY_COLUMNS = ["Order Line Reference", "Workflow Reference Number"]
+
+# Dates are stored as text in this format, so they sort and compare as text
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+_COLUMN_TYPES = {
+    **{col: "TEXT" for col in DATE_COLUMNS},
+    **{col: "REAL" for col in COST_COLUMNS},
+    "Quantity": "INTEGER",
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _key_text(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna(), "").map(str)
+
+
+def _date_bound(value) -> str:
+    return pd.Timestamp(value).strftime(DATE_FORMAT)
+
+
+class OrderStore:
+    """Parsed club order lines (``FINAL_COLUMNS``) in an SQLite file at ``path``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._con = sqlite3.connect(path)
+        columns = ", ".join(
+            f"{_quote(col)} {_COLUMN_TYPES.get(col, '')}".rstrip() for col in FINAL_COLUMNS
+        )
+        with self._con:
+            self._con.execute(
+                f"CREATE TABLE IF NOT EXISTS club_orders ("
+                f"line_key TEXT NOT NULL, workflow_key TEXT NOT NULL, {columns}, "
+                f"PRIMARY KEY (line_key, workflow_key))"
+            )
+            self._con.execute(
+                "CREATE INDEX IF NOT EXISTS club_orders_placed "
+                'ON club_orders ("Order Placed Date")'
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self._con.execute("SELECT COUNT(*) FROM club_orders").fetchone()[0]
+
+    def close(self):
+        self._con.close()
+
+    def upsert(self, df: pd.DataFrame) -> int:
+        """Add the lines of a parsed frame, replacing lines already stored.
+
+        Within ``df`` the last copy of a line wins. Returns the number of
+        lines written.
+        """
+        df = df[FINAL_COLUMNS]
+        line_key, workflow_key = (_key_text(df[col]) for col in KEY_COLUMNS)
+        no_key = ((line_key == "") & (workflow_key == "")).to_numpy()
+        if no_key.any():
+            hashes = pd.util.hash_pandas_object(df[no_key], index=False)
+            line_key[no_key] = "#" + hashes.map("{:016x}".format).to_numpy()
+
+        values = df.astype(object).where(df.notna(), None)
+        for col in DATE_COLUMNS:
+            dates = df[col].dt.strftime(DATE_FORMAT)
+            values[col] = dates.astype(object).where(dates.notna(), None)
+        rows = zip(
+            line_key.tolist(),
+            workflow_key.tolist(),
+            *(values[col].tolist() for col in FINAL_COLUMNS),
+        )
+
+        names = ", ".join(["line_key", "workflow_key"] + [_quote(col) for col in FINAL_COLUMNS])
+        placeholders = ", ".join(["?"] * (len(FINAL_COLUMNS) + 2))
+        with self._con:
+            self._con.executemany(
+                f"INSERT OR REPLACE INTO club_orders ({names}) VALUES ({placeholders})", rows
+            )
+        return len(df)
+
+    def _query(self, since, until):
+        sql = f"SELECT {', '.join(_quote(col) for col in FINAL_COLUMNS)} FROM club_orders"
+        conditions, params = [], []
+        if since is not None:
+            conditions.append('"Order Placed Date" >= ?')
+            params.append(_date_bound(since))
+        if until is not None:
+            conditions.append('"Order Placed Date" < ?')
+            params.append(_date_bound(pd.Timestamp(until) + pd.Timedelta(days=1)))
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += ' ORDER BY "Order Placed Date", line_key, workflow_key'
+        return sql, params
+
+    def orders(self, since=None, until=None) -> pd.DataFrame:
+        """Lines placed on the days from ``since`` to ``until``, inclusive.
+
+        Either bound may be None for an open range; lines with no Order
+        Placed Date are only included when both are. Lines come in order of
+        placement, typed as ``parse_general_report`` types them.
+        """
+        sql, params = self._query(since, until)
+        return _restore_types(pd.read_sql_query(sql, self._con, params=params))
+
+    def iter_orders(
+        self, since=None, until=None, chunk_rows: int = 50_000
+    ) -> Iterator[pd.DataFrame]:
+        """``orders(since, until)`` in frames of at most ``chunk_rows`` lines."""
+        sql, params = self._query(since, until)
+        for chunk in pd.read_sql_query(sql, self._con, params=params, chunksize=chunk_rows):
+            yield _restore_types(chunk)
+
+
+def _restore_types(df: pd.DataFrame) -> pd.DataFrame:
+    for col in FINAL_COLUMNS:
+        if col in DATE_COLUMNS:
+            df[col] = pd.to_datetime(df[col], format=DATE_FORMAT)
+        elif col in COST_COLUMNS:
+            df[col] = df[col].astype(float)
+        elif col == "Quantity":
+            df[col] = df[col].astype(np.int32)
+        elif col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype(TEXT_DTYPE).astype("category")
+        else:
+            values = df[col].infer_objects()
+            df[col] = values.astype(TEXT_DTYPE) if values.isna().all() else values
+    return df
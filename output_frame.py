@@ -0,0 +1,176 @@
+"""Compact in-memory layout of the combined output.
+
+Output rows repeat a handful of strings ("Club", "Camp / Misc", "C&P",
+"Delivery", blanks in the comment columns) on nearly every row, and the
+quantity and price columns mix numbers with blanks. The transforms build
+their frames in a compact layout instead:
+
+- text columns are categoricals, apart from Project Ref and Brief ref,
+  which are mostly distinct and stay plain text;
+- ``index no`` is int64;
+- Quantity, Print Sell, Sell and Number of clubs are float64, with blanks
+  as NaN. The odd value in them that is not a number, such as a C&P price
+  of "NOT FOUND", is kept in a categorical ``"<column> (text)"`` column
+  next to it, which exists only when there is such a value.
+
+``expand_output`` turns a compact frame back into the plain values that are
+written; the writers expand a slice at a time as they write.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from table_writer import FLOAT_COLUMNS, INT_COLUMNS
+
+# Mostly distinct per row; categories would not save anything
+PLAIN_TEXT_COLUMNS = ("Project Ref", "Brief ref")
+
+
+def text_column(name: str) -> str:
+    """Name of the column holding the non-numeric values of number column ``name``."""
+    return f"{name} (text)"
+
+
+def is_text_column(name: str) -> bool:
+    return name.endswith(" (text)")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
+def _split_numbers(values: pd.Series):
+    """``(float64 numbers, categorical of the other non-blank values or None)``."""
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=float, na_value=np.nan), None
+    cells = values.to_numpy(dtype=object)
+    numeric = np.fromiter((_is_number(v) for v in cells), dtype=bool, count=len(cells))
+    numbers = np.full(len(cells), np.nan)
+    numbers[numeric] = cells[numeric].astype(float)
+    text = ~numeric & ~pd.isna(cells)
+    text[text] = cells[text] != ""
+    if not text.any():
+        return numbers, None
+    return numbers, pd.Categorical(np.where(text, cells, None))
+
+
+def _constant(value, n: int) -> pd.Categorical:
+    if pd.isna(value):
+        return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=[])
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def _compact_columns(name: str, values, n: int) -> dict:
+    """Column ``name`` (a scalar or ``n`` values) in the compact layout."""
+    if name in INT_COLUMNS:
+        return {name: np.broadcast_to(np.asarray(values, dtype=np.int64), (n,)).copy()}
+    if name in FLOAT_COLUMNS:
+        if np.ndim(values) == 0:
+            if _is_number(values):
+                return {name: np.full(n, float(values))}
+            columns = {name: np.full(n, np.nan)}
+            if not (pd.isna(values) or values == ""):
+                columns[text_column(name)] = _constant(values, n)
+            return columns
+        numbers, text = _split_numbers(pd.Series(values).reset_index(drop=True))
+        columns = {name: numbers}
+        if text is not None:
+            columns[text_column(name)] = text
+        return columns
+    if name in PLAIN_TEXT_COLUMNS or is_text_column(name):
+        return {name: values}
+    if np.ndim(values) == 0:
+        return {name: _constant(values, n)}
+    if isinstance(values, pd.Series):
+        values = values.array
+    if isinstance(values, pd.Categorical):
+        return {name: values}
+    return {name: pd.Categorical(np.asarray(values, dtype=object))}
+
+
+def output_frame(columns: dict, n: int) -> pd.DataFrame:
+    """A compact output frame of ``n`` rows from column name -> scalar or values."""
+    compact = {}
+    for name, values in columns.items():
+        compact.update(_compact_columns(name, values, n))
+    return pd.DataFrame(compact, index=pd.RangeIndex(n))
+
+
+def compact_output(df: pd.DataFrame) -> pd.DataFrame:
+    """``df`` in the compact layout; frames already in it are returned as they are."""
+    if all(_is_compact(name, df[name]) for name in df.columns):
+        return df
+    columns = {}
+    for name in df.columns:
+        if _is_compact(name, df[name]):
+            columns[name] = df[name].to_numpy() if name in FLOAT_COLUMNS else df[name].array
+        else:
+            columns.update(_compact_columns(name, df[name].reset_index(drop=True), len(df)))
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(df)))
+
+
+def _is_compact(name: str, values: pd.Series) -> bool:
+    if name in INT_COLUMNS or name in PLAIN_TEXT_COLUMNS:
+        return True
+    if name in FLOAT_COLUMNS:
+        return values.dtype == np.float64
+    return isinstance(values.dtype, pd.CategoricalDtype)
+
+
+def _union(parts: list) -> pd.Categorical:
+    """Concatenate categoricals, widening their categories to object if their types differ."""
+    dtypes = {part.categories.dtype for part in parts if len(part.categories)}
+    target = dtypes.pop() if len(dtypes) == 1 else np.dtype(object)
+    parts = [
+        part
+        if part.categories.dtype == target
+        else pd.Categorical.from_codes(part.codes, categories=part.categories.astype(target))
+        for part in parts
+    ]
+    return union_categoricals(parts)
+
+
+def concat_output(frames) -> pd.DataFrame:
+    """Stack output frames, keeping the compact layout and numbering rows from 0."""
+    frames = [compact_output(df) for df in frames]
+    names = list(dict.fromkeys(name for df in frames for name in df.columns))
+    columns = {}
+    for name in names:
+        if name in FLOAT_COLUMNS:
+            columns[name] = np.concatenate([df[name].to_numpy() for df in frames])
+        elif name in INT_COLUMNS or name in PLAIN_TEXT_COLUMNS:
+            columns[name] = pd.concat([df[name] for df in frames], ignore_index=True)
+        else:
+            columns[name] = _union(
+                [
+                    df[name].array
+                    if name in df.columns
+                    else pd.Categorical.from_codes(np.full(len(df), -1), categories=[])
+                    for df in frames
+                ]
+            )
+    return pd.DataFrame(columns, index=pd.RangeIndex(sum(len(df) for df in frames)))
+
+
+def expand_output(df: pd.DataFrame) -> pd.DataFrame:
+    """The plain values of a compact frame, as they are written.
+
+    Categoricals become text (or objects, where numbers are mixed in), and a
+    number column with non-numeric values becomes an object column holding
+    both. Blank numbers stay NaN.
+    """
+    columns = {}
+    for name in df.columns:
+        if is_text_column(name):
+            continue
+        values = df[name]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(values.cat.categories.dtype)
+        elif name in FLOAT_COLUMNS and text_column(name) in df.columns:
+            text = df[text_column(name)]
+            has_text = text.notna().to_numpy()
+            values = values.astype(object)
+            values[has_text] = text[has_text].astype(object)
+        columns[name] = values
+    return pd.DataFrame(columns, index=df.index)
@@ -0,0 +1,58 @@
+"""Size-bounded spool for generated workbooks.
+
+A workbook built in an ``io.BytesIO`` stays in the server process for as long
+as the session keeps it. An ``OutputSpool`` keeps small outputs in memory and
+rolls over to an unlinked temporary file once it passes ``max_memory``
+bytes, so concurrent sessions generating large reports use disk rather than
+RAM. The spool is released when closed or garbage collected. In the app
+spools are outputs of jobs held by the process-wide ``JobRunner``, not by
+the session, so ending a session does not release them: they are closed
+when the session's next Generate discards its previous job, or when the
+finished job is dropped after ``ERA_JOB_KEEP_MINUTES``.
+
+Downloading still needs the whole output in memory for a while: Streamlit
+serves a download from one bytes object, which ``getvalue`` builds when the
+download button is clicked.
+"""
+
+import os
+import tempfile
+import threading
+
+DEFAULT_MAX_MEMORY = int(os.environ.get("ERA_SPOOL_MEMORY_MB", "16")) * 1024 * 1024
+SPOOL_DIR = os.environ.get("ERA_SPOOL_DIR") or None
+
+
+class OutputSpool:
+    """A writable, re-readable binary file that lives in memory until it grows."""
+
+    def __init__(self, max_memory: int = DEFAULT_MAX_MEMORY, dir: str = SPOOL_DIR):
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_memory, mode="w+b", dir=dir)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def on_disk(self) -> bool:
+        return self.file._rolled
+
+    @property
+    def size(self) -> int:
+        position = self.file.tell()
+        self.file.seek(0, os.SEEK_END)
+        size = self.file.tell()
+        self.file.seek(position)
+        return size
+
+    def getvalue(self) -> bytes:
+        """The whole spooled contents; safe to call from several threads."""
+        with self._lock:
+            self.file.seek(0)
+            return self.file.read()
+
+    def close(self):
+        self.file.close()
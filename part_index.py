@@ -0,0 +1,168 @@
+"""Matching club Part names to catalogue Part Names.
+
+Club exports do not always spell a part the way the catalogue does: case,
+spacing and small suffix differences used to leave Size, Pagination,
+Material and Finishing empty. ``PartIndex`` resolves a name in three steps:
+
+1. the exact Part Name;
+2. the normalised name (``normalise_part_name``): Unicode-normalised,
+   case-folded, with runs of whitespace collapsed and spaces around the
+   "x" of dimensions removed;
+3. the most similar catalogue name with the same numbers in it, if it
+   scores at least ``FUZZY_CUTOFF``. Many Part Names differ only in their
+   dimensions or page count ("30x40 Poster OT", "60x40 Poster OT"), so a
+   close name with other numbers is never taken. Candidates are
+   shortlisted through an index of character trigrams and only the
+   shortlist is scored, so a lookup does not scan the catalogue.
+
+Results are cached per name, and a merge only resolves the distinct names
+it sees, so the cost does not grow with the number of order lines. Matches
+that were not exact, and names that matched nothing, are collected in a
+``PartMatchLog`` for the run summary.
+"""
+
+import difflib
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Lowest similarity (difflib ratio of normalised names) accepted as a match
+FUZZY_CUTOFF = 0.88
+
+# Catalogue names scored for each fuzzy lookup
+SHORTLIST = 8
+
+_SPACES = re.compile(r"\s+")
+_NUMBERS = re.compile(r"\d+")
+_DIMENSIONS = re.compile(r"(?<=\d) ?[x×] ?(?=\d)")
+
+
+def normalise_part_name(name) -> str:
+    """The key two spellings of a part name share if they differ only cosmetically."""
+    text = unicodedata.normalize("NFKC", str(name)).casefold()
+    text = _SPACES.sub(" ", text).strip()
+    return _DIMENSIONS.sub("x", text)
+
+
+def _numbers(key: str) -> tuple:
+    return tuple(_NUMBERS.findall(key))
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class PartMatch:
+    """How a Part name was resolved: ``how`` is exact, normalised, fuzzy or None."""
+
+    name: str
+    part: Optional[str]
+    how: Optional[str]
+    score: float = 0.0
+
+
+class PartIndex:
+    """Resolves Part names against a list of catalogue Part Names."""
+
+    def __init__(self, names, cutoff: float = FUZZY_CUTOFF):
+        self.names = list(names)
+        self.cutoff = cutoff
+        self._exact = set(self.names)
+        # Where two names share a key the later one wins, as it does for exact names
+        self._by_key = {normalise_part_name(name): name for name in self.names}
+        self._keys = list(self._by_key)
+        self._groups = {}
+        for i, key in enumerate(self._keys):
+            self._groups.setdefault(_numbers(key), []).append(i)
+        # Numbers -> trigram -> keys containing it, built when a group is first searched
+        self._postings = {}
+        self._cache = {}
+
+    def match(self, name) -> PartMatch:
+        """Resolve one Part name; the result is cached."""
+        found = self._cache.get(name)
+        if found is None:
+            found = self._cache[name] = self._match(name)
+        return found
+
+    def _match(self, name) -> PartMatch:
+        if name in self._exact:
+            return PartMatch(name, name, "exact", 1.0)
+        key = normalise_part_name(name)
+        if key in self._by_key:
+            return PartMatch(name, self._by_key[key], "normalised", 1.0)
+
+        postings = self._group_postings(_numbers(key))
+        shared = Counter()
+        for gram in _trigrams(key):
+            shared.update(postings.get(gram, ()))
+        best, best_score = None, 0.0
+        for i, _ in shared.most_common(SHORTLIST):
+            score = difflib.SequenceMatcher(None, key, self._keys[i]).ratio()
+            if score > best_score:
+                best, best_score = i, score
+        if best is not None and best_score >= self.cutoff:
+            return PartMatch(name, self._by_key[self._keys[best]], "fuzzy", best_score)
+        return PartMatch(name, None, None, best_score)
+
+    def _group_postings(self, numbers: tuple) -> dict:
+        postings = self._postings.get(numbers)
+        if postings is None:
+            postings = self._postings[numbers] = {}
+            for i in self._groups.get(numbers, ()):
+                for gram in _trigrams(self._keys[i]):
+                    postings.setdefault(gram, []).append(i)
+        return postings
+
+    def resolve(self, parts: pd.Series):
+        """``(codes, matches)``: each value's position in ``matches``, one match per distinct name.
+
+        Missing values get code -1 and no match.
+        """
+        if isinstance(parts.dtype, pd.CategoricalDtype):
+            codes = parts.cat.codes.to_numpy()
+            uniques = parts.cat.categories
+        else:
+            codes, uniques = pd.factorize(parts)
+        return codes, [self.match(name) for name in uniques]
+
+
+class PartMatchLog:
+    """Part names a run resolved other than exactly, with how many lines used each."""
+
+    def __init__(self):
+        self._matches = {}
+        self._lines = Counter()
+
+    def record(self, codes: np.ndarray, matches: list):
+        counts = np.bincount(codes[codes >= 0], minlength=len(matches))
+        for match, lines in zip(matches, counts):
+            if match.how != "exact" and lines:
+                self._matches[match.name] = match
+                self._lines[match.name] += int(lines)
+
+    def __len__(self):
+        return len(self._matches)
+
+    def summary(self) -> pd.DataFrame:
+        """One row per name: unmatched first, then fuzzy and normalised matches."""
+        order = {None: 0, "fuzzy": 1, "normalised": 2}
+        rows = sorted(
+            self._matches.values(), key=lambda m: (order[m.how], -self._lines[m.name], m.name)
+        )
+        return pd.DataFrame(
+            {
+                "Part": [m.name for m in rows],
+                "Matched to": [m.part or "" for m in rows],
+                "Match": [m.how or "unmatched" for m in rows],
+                "Score": [round(m.score, 3) for m in rows],
+                "Lines": [self._lines[m.name] for m in rows],
+            }
+        )
@@ -0,0 +1,212 @@
+"""Compiled parts catalogue.
+
+``generate_parts_data.py`` compiles ``Parts Export.xlsx`` into
+``parts_catalogue.json``, which stores one array per column rather than one
+dict per part, along with the SHA-256 of the workbook it was compiled from.
+The catalogue is loaded once per process and indexed by Part Name and Part
+URN, so Streamlit reruns reuse it, and the name matching index built from
+it, instead of rebuilding them.
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from part_index import PartIndex
+
+CATALOGUE_PATH = Path(__file__).with_name("parts_catalogue.json")
+CATALOGUE_FORMAT = 1
+
+# Columns a part contributes to the combined output
+PART_ATTRIBUTES = ["Size", "Pagination", "Material", "Finishing"]
+
+
+def part_attributes(record: dict) -> dict:
+    """The output columns for one catalogue record."""
+    return {
+        "Size": f"{record['Height (mm)']}x{record['Width (mm)']}",
+        "Pagination": record["No. of Pages"],
+        "Material": record["Materials"],
+        "Finishing": record.get("Finishing", ""),
+    }
+
+
+def _attributes_frame(parts_lookup: Mapping) -> pd.DataFrame:
+    return pd.DataFrame(
+        [[name] + [info[a] for a in PART_ATTRIBUTES] for name, info in parts_lookup.items()],
+        columns=["Part"] + PART_ATTRIBUTES,
+        dtype=object,
+    )
+
+
+def attributes_frame(parts_lookup: Mapping) -> pd.DataFrame:
+    """Part plus ``PART_ATTRIBUTES`` columns for any Part Name -> attributes mapping."""
+    if isinstance(parts_lookup, PartsCatalogue):
+        return parts_lookup.attributes_frame()
+    return _attributes_frame(parts_lookup)
+
+
+def part_index(parts_lookup: Mapping) -> PartIndex:
+    """A ``PartIndex`` over the Part Names of any Part Name -> attributes mapping."""
+    if isinstance(parts_lookup, PartsCatalogue):
+        return parts_lookup.part_index()
+    return PartIndex(parts_lookup)
+
+
+class PartsCatalogue(Mapping):
+    """Part Name -> output attributes, backed by columnar catalogue data.
+
+    Where two parts share a name the later one wins, as it always has.
+    """
+
+    def __init__(self, columns: dict, source_sha256: Optional[str] = None):
+        self.columns = columns
+        self.source_sha256 = source_sha256
+        self._names = list(columns["Part Name"])
+        self._row_by_urn = {
+            str(int(urn)): i for i, urn in enumerate(columns["Part URN"])
+        }
+        self._lookup = {
+            name: part_attributes(self.record_at(i)) for i, name in enumerate(self._names)
+        }
+        self._frame = None
+        self._index = None
+
+    def __len__(self):
+        return len(self._lookup)
+
+    def __iter__(self):
+        return iter(self._lookup)
+
+    def __getitem__(self, name):
+        return self._lookup[name]
+
+    @property
+    def n_records(self) -> int:
+        return len(self._names)
+
+    def record_at(self, i: int) -> dict:
+        return {col: values[i] for col, values in self.columns.items()}
+
+    def by_urn(self, urn) -> dict:
+        """The full catalogue record for a Part URN (int or str)."""
+        return self.record_at(self._row_by_urn[str(int(urn))])
+
+    @property
+    def raw(self) -> dict:
+        """The catalogue as ``{str(Part URN): record}``, the old PARTS_DATA_RAW shape."""
+        return {urn: self.record_at(i) for urn, i in self._row_by_urn.items()}
+
+    def attributes_frame(self) -> pd.DataFrame:
+        """Part plus ``PART_ATTRIBUTES`` columns, one row per Part Name, for merges."""
+        if self._frame is None:
+            self._frame = _attributes_frame(self._lookup)
+        return self._frame
+
+    def part_index(self) -> PartIndex:
+        """The name matching index, built on first use and kept with the catalogue."""
+        if self._index is None:
+            self._index = PartIndex(self._lookup)
+        return self._index
+
+    @classmethod
+    def from_raw(cls, parts_raw: dict) -> "PartsCatalogue":
+        records = list(parts_raw.values())
+        names = list(records[0]) if records else ["Part URN", "Part Name"]
+        return cls({col: [r.get(col) for r in records] for col in names})
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, source_sha256: Optional[str] = None) -> "PartsCatalogue":
+        """Build from a Parts Export sheet; blank cells become None."""
+        df = df.astype(object).where(df.notna(), None)
+        return cls({col: df[col].tolist() for col in df.columns}, source_sha256)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per Part URN (the last, where a URN repeats), indexed by the URN."""
+        df = pd.DataFrame(self.columns, dtype=object)
+        df.index = pd.Index(pd.to_numeric(df["Part URN"]).astype("int64"), name="Part URN")
+        return df[~df.index.duplicated(keep="last")]
+
+    @classmethod
+    def load(cls, path=CATALOGUE_PATH) -> "PartsCatalogue":
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("format") != CATALOGUE_FORMAT:
+            raise ValueError(f"Unsupported parts catalogue format in {path}")
+        return cls(payload["columns"], payload.get("source_sha256"))
+
+    def save(self, path=CATALOGUE_PATH):
+        payload = {"format": CATALOGUE_FORMAT, "columns": self.columns}
+        if self.source_sha256 is not None:
+            payload["source_sha256"] = self.source_sha256
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class CatalogueDiff:
+    """Parts added and removed between two catalogues, and the columns that changed."""
+
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changed: dict = field(default_factory=dict)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+def _cell_text(value) -> str:
+    if not isinstance(value, str) and pd.isna(value):
+        return ""
+    # read_excel turns an int column with a blank into floats: 1.0 is still 1
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _as_text(df: pd.DataFrame) -> pd.DataFrame:
+    # Compared as text, with blanks (None, NaN, "") and missing columns alike
+    return df.map(_cell_text)
+
+
+def diff_catalogues(old: Optional[PartsCatalogue], new: PartsCatalogue) -> CatalogueDiff:
+    """Compare two catalogues part by part, keyed by Part URN.
+
+    ``added`` and ``removed`` are sorted URNs; ``changed`` maps each URN in
+    both whose record differs to the names of the columns that differ. A
+    column only one of them has counts as blank in the other.
+    """
+    new_df = new.to_frame()
+    if old is None:
+        return CatalogueDiff(added=new_df.index.sort_values().tolist())
+    old_df = old.to_frame()
+    columns = list(dict.fromkeys([*old_df.columns, *new_df.columns]))
+    common = old_df.index.intersection(new_df.index).sort_values()
+    before = _as_text(old_df.reindex(index=common, columns=columns))
+    after = _as_text(new_df.reindex(index=common, columns=columns))
+    differs = before.to_numpy() != after.to_numpy()
+    rows = differs.any(axis=1)
+    return CatalogueDiff(
+        added=new_df.index.difference(old_df.index).sort_values().tolist(),
+        removed=old_df.index.difference(new_df.index).sort_values().tolist(),
+        changed={
+            urn: [col for col, d in zip(columns, row) if d]
+            for urn, row in zip(common[rows].tolist(), differs[rows])
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def get_catalogue(path=CATALOGUE_PATH) -> PartsCatalogue:
+    """The process-wide catalogue, loaded on first use."""
+    if not Path(path).exists():
+        raise FileNotFoundError(
+            f"Parts catalogue {path} not found; run generate_parts_data.py to build it"
+        )
+    return PartsCatalogue.load(path)
@@ -1 +1,13 @@
-PARTS_DATA_RAW = {'118': {'Part URN': 118, 'Part Name': '1000x2400 PVC banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1000, 'Width (mm)': 2400, 'Materials': 'Banner grade PVC', 'Finishing': 'Trim hem Eyelet', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '117': {'Part URN': 117, 'Part Name': '1000x3000 PVC banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1000, 'Width (mm)': 3000, 'Materials': 'Banner grade PVC', 'Finishing': 'Trim hem eyelet', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '158': {'Part URN': 158, 'Part Name': '1000x5000mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1000, 'Width (mm)': 5000, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelets & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '299': {'Part URN': 299, 'Part Name': '12pp Log Book OT', 'Part Short Name': None, 'No. of Pages': 12, 'Height (mm)': 210, 'Width (mm)': 297, 'Materials': '135gsm', 'Finishing': 'Trim, collate pages and stitch on top left edge', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '160': {'Part URN': 160, 'Part Name': '1800x1800mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1800, 'Width (mm)': 1800, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '115': {'Part URN': 115, 'Part Name': '182x170 Laminated Menu OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 182, 'Width (mm)': 170, 'Materials': '250gsm Matt', 'Finishing': 'TTS Crease and Fold, Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '157': {'Part URN': 157, 'Part Name': '2000x4000mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 2000, 'Width (mm)': 4000, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '161': {'Part URN': 161, 'Part Name': '2000x800mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 2000, 'Width (mm)': 800, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '116': {'Part URN': 116, 'Part Name': '235x170 Laminated Menu OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 235, 'Width (mm)': 170, 'Materials': '250gsm Matt', 'Finishing': 'Trim to size, crease and fold, Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '121': {'Part URN': 121, 'Part Name': '23pp 70x120 Laminated', 'Part Short Name': None, 'No. of Pages': 23, 'Height (mm)': 70, 'Width (mm)': 120, 'Materials': '250gsm Matt', 'Finishing': 'TTS Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ESP Colour LTD', '%  Overs': 0, 'Status': 'Active'}, '114': {'Part URN': 114, 'Part Name': '295x170 laminated Menu OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 295, 'Width (mm)': 170, 'Materials': '250gsm Matt', 'Finishing': 'TTS Crease and Fold, Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '119': {'Part URN': 119, 'Part Name': '297x840 Display Board Gloss Laminate OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 840, 'Materials': '1200mic display board', 'Finishing': 'TTS apply strut to back', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '112': {'Part URN': 112, 'Part Name': '30x40 Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 762, 'Width (mm)': 1016, 'Materials': '250gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '120': {'Part URN': 120, 'Part Name': '333x269 Die Cut Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 333, 'Width (mm)': 269, 'Materials': 'low tac adhesive', 'Finishing': 'Die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '241': {'Part URN': 241, 'Part Name': '40x30 Dry Wipe Laminate OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 762, 'Materials': '200gsm ', 'Finishing': 'Dry wipe laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '2': {'Part URN': 2, 'Part Name': '40x30 Poster', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 762, 'Materials': '250gsm Silk', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '63': {'Part URN': 63, 'Part Name': '40x30 Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 762, 'Materials': '250gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '288': {'Part URN': 288, 'Part Name': '40x30 Yupotako Compatible Poster', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 762, 'Materials': '200g Silk', 'Finishing': 'Overall flood varnish to face, trim to size ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '311': {'Part URN': 311, 'Part Name': '40x60" Standee Dry Wipe (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 1524, 'Materials': '2000mic Display', 'Finishing': 'Apply Dry Wipe Laminate  Trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '304': {'Part URN': 304, 'Part Name': '48 Digital Sheet', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 3048, 'Width (mm)': 6096, 'Materials': '6096 x 3048 (pix)', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '355': {'Part URN': 355, 'Part Name': '48 Sheet 600x280 (rgb) (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 280, 'Width (mm)': 600, 'Materials': 'jpg', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 3, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '354': {'Part URN': 354, 'Part Name': '48 Sheet 864x432 (rgb)(L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 432, 'Width (mm)': 864, 'Materials': 'jpg', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 3, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '356': {'Part URN': 356, 'Part Name': '6 Sheet 1920x1080 (rgb)(P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': 'jpg', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 3, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '357': {'Part URN': 357, 'Part Name': '6 Sheet 3840x2160 (jpg)(P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 3840, 'Width (mm)': 2160, 'Materials': 'jpg', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 3, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '302': {'Part URN': 302, 'Part Name': '6 Sheet Digital', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1800, 'Width (mm)': 1200, 'Materials': '1200 x 1800', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '275': {'Part URN': 275, 'Part Name': '60x40 Dry Wipe OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 1524, 'Materials': '200gsm', 'Finishing': 'Anti vandal dry wipe laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '1': {'Part URN': 1, 'Part Name': '60x40 Poster', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '250gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '62': {'Part URN': 62, 'Part Name': '60x40 Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '250g Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '76': {'Part URN': 76, 'Part Name': '60x40 Standee Dry Wipe OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic display', 'Finishing': 'Dry Wipe Laminate, TTS & strut to reverse Die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '341': {'Part URN': 341, 'Part Name': '60x40 Standee with 16 clear pockets OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic board', 'Finishing': 'Anti Van Lam & strut add Pockets on all blocks', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '279': {'Part URN': 279, 'Part Name': '60x40 V-Line Board', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '10mm V-line', 'Finishing': 'Trim to size apply strut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '287': {'Part URN': 287, 'Part Name': '60x40 Yupotako Compatible Poster', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '200g Silk', 'Finishing': 'Overall flood varnish to face, trim to size ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '15': {'Part URN': 15, 'Part Name': '60x40" Standee', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic Display', 'Finishing': 'Trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '301': {'Part URN': 301, 'Part Name': '60x40" Standee Dry Wipe (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic Display', 'Finishing': 'Apply Dry Wipe Laminate  Trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '252': {'Part URN': 252, 'Part Name': '60x40" Standee Yupotako Compatible', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic Display Board', 'Finishing': 'laminate to face, trim to size, apply sturdy rudder struts to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '259': {'Part URN': 259, 'Part Name': '60x40" Standee Yupotako Compatible OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1524, 'Width (mm)': 1016, 'Materials': '2000mic display board ', 'Finishing': 'laminate to face, TTS, rudder struts to reverse ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '159': {'Part URN': 159, 'Part Name': '700x4000mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 700, 'Width (mm)': 4000, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '113': {'Part URN': 113, 'Part Name': '75PP A4 laminated OT', 'Part Short Name': None, 'No. of Pages': 75, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '120gsm Matt', 'Finishing': 'TTS and Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '364': {'Part URN': 364, 'Part Name': '8pp Perforated Z Fold leaflet', 'Part Short Name': None, 'No. of Pages': 8, 'Height (mm)': 148, 'Width (mm)': 420, 'Materials': '150gsm', 'Finishing': "Trim, Perforate, Z fold, pack in 500's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '163': {'Part URN': 163, 'Part Name': '970x4270mm External Banner OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 970, 'Width (mm)': 4270, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '313': {'Part URN': 313, 'Part Name': 'A0 Poster (L) (Encapsulated)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 841, 'Width (mm)': 1189, 'Materials': 'Silk 200gsm', 'Finishing': 'Encapsulate and trim to finished size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '312': {'Part URN': 312, 'Part Name': 'A0 Poster (P) (Encapsulated)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1189, 'Width (mm)': 841, 'Materials': 'Silk 200gsm', 'Finishing': 'Encapsulate and trim to finished size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '165': {'Part URN': 165, 'Part Name': 'A1 Poster (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 841, 'Width (mm)': 594, 'Materials': '200gsm Silk', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '300': {'Part URN': 300, 'Part Name': 'A1 Poster Dry Wipe OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 841, 'Width (mm)': 594, 'Materials': '150gsm', 'Finishing': 'Apply dry wipe laminate and trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '127': {'Part URN': 127, 'Part Name': 'A1 Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 841, 'Width (mm)': 594, 'Materials': '200gsm Novatec', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '185': {'Part URN': 185, 'Part Name': 'A1 PVC OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 841, 'Width (mm)': 594, 'Materials': '220mic PVC', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '370': {'Part URN': 370, 'Part Name': 'A2', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 594, 'Materials': '200gsm ', 'Finishing': 'TTS Encapsulate ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '5': {'Part URN': 5, 'Part Name': 'A2 Poster (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 594, 'Width (mm)': 420, 'Materials': '200gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '61': {'Part URN': 61, 'Part Name': 'A2 Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 594, 'Width (mm)': 420, 'Materials': '200g Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '200': {'Part URN': 200, 'Part Name': 'A3 Poster (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 420, 'Materials': '170g Silk', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '146': {'Part URN': 146, 'Part Name': 'A3 Poster (L) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 420, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '154': {'Part URN': 154, 'Part Name': 'A3 Poster (L) OT (CHARGE MARKETING)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 420, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '4': {'Part URN': 4, 'Part Name': 'A3 Poster (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 297, 'Materials': '170g Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '123': {'Part URN': 123, 'Part Name': 'A3 Poster (P) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 297, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '198': {'Part URN': 198, 'Part Name': 'A3 Strut Card ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 297, 'Materials': '2000mic Display', 'Finishing': 'Trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '340': {'Part URN': 340, 'Part Name': 'A3 Strut Card (Dry Wipe)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 297, 'Materials': '2000mic Display', 'Finishing': 'Apply Dry Wipe Laminate. Trim to size and apply strut to reverse. ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '244': {'Part URN': 244, 'Part Name': 'A3 Strut Card (Dry Wipe) strut to reverse OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 297, 'Materials': '2000mic Display', 'Finishing': 'Dry Wipe Laminate, TTS & apply strut to reverse ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '281': {'Part URN': 281, 'Part Name': 'A4 100 pg Pad w/ Backboard glued to pad OT', 'Part Short Name': None, 'No. of Pages': 100, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '100gsm uncoated w/ backboard', 'Finishing': 'Collate 100 pp glue along top edge & backboard ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '285': {'Part URN': 285, 'Part Name': 'A4 124page document', 'Part Short Name': None, 'No. of Pages': 124, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '135gsm', 'Finishing': 'TTS stitch', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '272': {'Part URN': 272, 'Part Name': 'A4 13pp document ', 'Part Short Name': None, 'No. of Pages': 13, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm', 'Finishing': 'Trim to size, Edge stitch ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '273': {'Part URN': 273, 'Part Name': 'A4 24pp document OT', 'Part Short Name': None, 'No. of Pages': 24, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm', 'Finishing': 'trim edge stitch', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '172': {'Part URN': 172, 'Part Name': 'A4 2pp Poster', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Silk', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '373': {'Part URN': 373, 'Part Name': 'A4 48 page (OT)', 'Part Short Name': None, 'No. of Pages': 48, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '170gsm', 'Finishing': 'trim, collate, stitch ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '284': {'Part URN': 284, 'Part Name': 'A4 5pp document', 'Part Short Name': None, 'No. of Pages': 5, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm', 'Finishing': 'trim to size, staple ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '361': {'Part URN': 361, 'Part Name': 'A4 DM Letter with 2 vouchers', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '115gsm ', 'Finishing': 'trim, perf, personalise, add to wrap ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '266': {'Part URN': 266, 'Part Name': 'A4 event Prop ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '400gsm', 'Finishing': 'die cut apply stick', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '78': {'Part URN': 78, 'Part Name': 'A4 Information Sheet', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '369': {'Part URN': 369, 'Part Name': 'A4 menu laminated', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '300gsm ', 'Finishing': 'TTS Laminated both sides', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '344': {'Part URN': 344, 'Part Name': 'A4 Menu Pad', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '120g Uncoated', 'Finishing': 'Trim to Size. Double sided. A4 padded in 250’s at head with greyboard back', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '326': {'Part URN': 326, 'Part Name': 'A4 Pad', 'Part Short Name': None, 'No. of Pages': 250, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '120g Uncoated', 'Finishing': 'Trim to Size A4 padded in 250’s at head with greyboard back', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '79': {'Part URN': 79, 'Part Name': 'A4 Poster (Encapsulated)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Silk', 'Finishing': 'Encapsulated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '75': {'Part URN': 75, 'Part Name': 'A4 Poster (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 297, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '194': {'Part URN': 194, 'Part Name': 'A4 Poster (L) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 297, 'Materials': '150gsm Novatech Matt', 'Finishing': 'trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '211': {'Part URN': 211, 'Part Name': 'A4 Poster (Laminated)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm', 'Finishing': 'TTS Laminate both sides', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '332': {'Part URN': 332, 'Part Name': 'A4 Poster (Laminated) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm', 'Finishing': 'TTS Laminate both sides', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '3': {'Part URN': 3, 'Part Name': 'A4 Poster (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Silk', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '60': {'Part URN': 60, 'Part Name': 'A4 Poster (P) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '104': {'Part URN': 104, 'Part Name': 'A4 Ring Binder', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'As per sample', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '243': {'Part URN': 243, 'Part Name': 'A4 Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': 'Sticker for vinyl', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '56': {'Part URN': 56, 'Part Name': 'A4 Strut Card', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '2000mic Display', 'Finishing': 'trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '65': {'Part URN': 65, 'Part Name': 'A4 Strut Card (Dry Wipe Laminated) strut to reverse OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '2000 Mic Display', 'Finishing': 'Dry Wipe Laminate, TTS & apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '314': {'Part URN': 314, 'Part Name': 'A4 Strut Card (Dry Wipe)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '2000mic Display', 'Finishing': 'Apply Dry Wipe Laminate. Trim to size and apply strut to reverse. ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '18': {'Part URN': 18, 'Part Name': 'A4 Strut Card (Laminated)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '2000mic Display', 'Finishing': 'Anti Vandal Laminate, trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '331': {'Part URN': 331, 'Part Name': 'A4 Strut Card strut to reverse OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '2000mic Display', 'Finishing': 'Trim to size and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '193': {'Part URN': 193, 'Part Name': 'A4 Toilet Checklist OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Novatech Matt w/ Dry Wipe Laminate', 'Finishing': 'Trim to size and apply dry wipe laminate to front', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '10': {'Part URN': 10, 'Part Name': 'A4 Voucher sheet', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm `Silk', 'Finishing': 'Perf once vertically and 4 times horizontally to create vouchers and trimmed', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '389': {'Part URN': 389, 'Part Name': 'A4 Voucher Sheet OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '208': {'Part URN': 208, 'Part Name': 'A5 1pp (Laminated) (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '200gsm ', 'Finishing': 'TTS laminate both sides', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '319': {'Part URN': 319, 'Part Name': 'A5 1pp Leaflet (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '253': {'Part URN': 253, 'Part Name': 'A5 1pp Leaflet (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '125': {'Part URN': 125, 'Part Name': 'A5 1pp Leaflet (P) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '261': {'Part URN': 261, 'Part Name': 'A5 24pp OT', 'Part Short Name': None, 'No. of Pages': 24, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '115gsm', 'Finishing': 'trim, fold, perforate certain pages', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '151': {'Part URN': 151, 'Part Name': 'A5 2pp Encapsulated OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '200gsm Silk', 'Finishing': 'Encapsulate and trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '9': {'Part URN': 9, 'Part Name': 'A5 2pp Leaflet', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '64': {'Part URN': 64, 'Part Name': 'A5 2PP Leaflet OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '271': {'Part URN': 271, 'Part Name': 'A5 2pp Perforated leaflet', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Perforated, trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '352': {'Part URN': 352, 'Part Name': 'A5 2pp Perforated Lft (x500) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm silk', 'Finishing': "perforated, trim, pack in 500's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '8': {'Part URN': 8, 'Part Name': 'A5 2pp Reg Form', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '350gsm Uncoated ', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '274': {'Part URN': 274, 'Part Name': 'A5 2pp Scratch Card (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '350gsm uncoated', 'Finishing': 'Trim to size. Silver latex panel', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '199': {'Part URN': 199, 'Part Name': 'A5 4pp Leaflet', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size and fold', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '108': {'Part URN': 108, 'Part Name': 'A5 4PP Leaflet OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim to Size ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '100': {'Part URN': 100, 'Part Name': 'A5 Acrylic Holder', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'See sample', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '265': {'Part URN': 265, 'Part Name': 'A5 event Prop ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '400gsm', 'Finishing': 'die cut apply stick', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '317': {'Part URN': 317, 'Part Name': 'A5 Machine Reservation Card Laminated', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '250gsm', 'Finishing': 'Trim to size, Laminated', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '372': {'Part URN': 372, 'Part Name': 'A5 Menu Laminated', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '300gsm', 'Finishing': 'Trim, Laminate both sides', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '328': {'Part URN': 328, 'Part Name': 'A5 Multi Game Ticket Set', 'Part Short Name': None, 'No. of Pages': 300, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '190g Uncoated ', 'Finishing': 'Trim to size. Each leaf is a bespoke bingo ticket. Each leaf is printed to both sides, one set contains 300 leaves.', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '129': {'Part URN': 129, 'Part Name': 'A5 Postcard (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '250g Silk', 'Finishing': 'Trim to finished size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '295': {'Part URN': 295, 'Part Name': 'A5 Postcard (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '250g Silk', 'Finishing': 'Trim to finished size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '130': {'Part URN': 130, 'Part Name': 'A5 Postcards & Packs', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': 'Silk 250gsm', 'Finishing': 'Postcard = Trim to finished size.  Pack = Trim, fold and Enclose into C5 envelope', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '103': {'Part URN': 103, 'Part Name': 'A5 Poster (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '77': {'Part URN': 77, 'Part Name': 'A5 Reservation Cards OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '250gsm  Uncoated  Encapsulated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '386': {'Part URN': 386, 'Part Name': 'A5 Stamper Card ', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': '250gsm ', 'Finishing': 'Trim, ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '335': {'Part URN': 335, 'Part Name': 'A5 Sticker (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': 'Self Adhesive Sticker', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '337': {'Part URN': 337, 'Part Name': 'A5 Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 210, 'Materials': 'Self adhesive sticker', 'Finishing': 'Trim to Size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '122': {'Part URN': 122, 'Part Name': 'A5 Strut Card (laminated) Strut to reverse OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '1200mic', 'Finishing': 'TTS Apply structure to reverse, Laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '72': {'Part URN': 72, 'Part Name': 'A6 (L) 1PP Leaflet OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '73': {'Part URN': 73, 'Part Name': 'A6 (P) 1PP Leaflet OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '6': {'Part URN': 6, 'Part Name': 'A6 1pp Leaflet', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '250': {'Part URN': 250, 'Part Name': 'A6 2pp Scratch Card (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '350gsm uncoated', 'Finishing': 'Trim to size. Silver latex panel', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '7': {'Part URN': 7, 'Part Name': 'A6 2pp Stamper (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '249': {'Part URN': 249, 'Part Name': 'A6 2pp Voucher (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '109': {'Part URN': 109, 'Part Name': 'A6 2pp Voucher (L) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '89': {'Part URN': 89, 'Part Name': 'A6 2pp Voucher (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '97': {'Part URN': 97, 'Part Name': 'A6 Card (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '250gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '82': {'Part URN': 82, 'Part Name': 'A6 Card (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '250gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '69': {'Part URN': 69, 'Part Name': 'A6 Stamper (Landscape) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '182': {'Part URN': 182, 'Part Name': 'A6 Stamper (Portrait) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '264': {'Part URN': 264, 'Part Name': 'A6 Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 145, 'Width (mm)': 108, 'Materials': 'Lo tac label', 'Finishing': 'trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '11': {'Part URN': 11, 'Part Name': 'A7 1pp Voucher (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '91': {'Part URN': 91, 'Part Name': 'A7 1pp Voucher (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '148': {'Part URN': 148, 'Part Name': 'A7 2pp Stamper Card (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '336': {'Part URN': 336, 'Part Name': 'A7 2pp Stamper Card (L) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '195': {'Part URN': 195, 'Part Name': 'A7 2pp Stamper Card (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '12': {'Part URN': 12, 'Part Name': 'A7 2pp Voucher (L)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '66': {'Part URN': 66, 'Part Name': 'A7 2pp Voucher (L) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '251': {'Part URN': 251, 'Part Name': 'A7 2pp Voucher (P)', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '245': {'Part URN': 245, 'Part Name': 'A7 number insert 0-9 OT ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': '150gsm', 'Finishing': 'TTS pack numbers together', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '156': {'Part URN': 156, 'Part Name': 'A7 Stamper OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '176': {'Part URN': 176, 'Part Name': 'A7 Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': 'Self adhesive label', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '184': {'Part URN': 184, 'Part Name': 'A7 Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': 'High tac self adhesive', 'Finishing': 'Reverse Print Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '201': {'Part URN': 201, 'Part Name': 'All Winners Voucher', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 308, 'Width (mm)': 99, 'Materials': '150 gsm', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '183': {'Part URN': 183, 'Part Name': 'All Winners Voucher 2pp', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 308, 'Width (mm)': 99, 'Materials': '150 gsm', 'Finishing': 'Perforated in strips horizontally (5 positions)', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '267': {'Part URN': 267, 'Part Name': 'Animated Digital Screen 1080 x1920 MP4', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': 'MP4', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '269': {'Part URN': 269, 'Part Name': 'Animated Digital Screen 1080 x1920 WMV', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': 'WMV', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '268': {'Part URN': 268, 'Part Name': 'Animated Digital Screen 1920 x1080 MP4', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1920, 'Materials': 'MP4', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '270': {'Part URN': 270, 'Part Name': 'Animated Digital Screen 1920 x1080 WMV', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1920, 'Materials': 'WMV', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '381': {'Part URN': 381, 'Part Name': 'App 440x1240', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1240, 'Width (mm)': 440, 'Materials': 'Px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '382': {'Part URN': 382, 'Part Name': 'App 440x844 L', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 440, 'Width (mm)': 844, 'Materials': 'Px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '391': {'Part URN': 391, 'Part Name': 'App Desktop mobile banner 1316x150px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 150, 'Width (mm)': 1316, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '390': {'Part URN': 390, 'Part Name': 'App Mobile banner 1316x65px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 65, 'Width (mm)': 1316, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '166': {'Part URN': 166, 'Part Name': 'Bespoke', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 1, 'Materials': 'tbc', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '74': {'Part URN': 74, 'Part Name': 'Binder Front Cover Insert ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 290, 'Width (mm)': 260, 'Materials': '170gsm', 'Finishing': 'Trim', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '320': {'Part URN': 320, 'Part Name': 'Bingo Book Front Cover', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 230, 'Width (mm)': 100, 'Materials': '.', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '327': {'Part URN': 327, 'Part Name': 'Bingo Book Splitter Page', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 230, 'Width (mm)': 100, 'Materials': '.', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '48': {'Part URN': 48, 'Part Name': 'Birthday Card OPM', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 296, 'Materials': 'Silk 250gsm', 'Finishing': 'Finished size 210mm x 148mm. Trim, crease, fold once to finished size and seal all round to comply with Royal Mail Mailmark regulations', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '94': {'Part URN': 94, 'Part Name': 'Blank Birthday Cards', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 150, 'Width (mm)': 442, 'Materials': '250gsm Novatech Matt', 'Finishing': 'Trim and Fold and Perf', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '30': {'Part URN': 30, 'Part Name': 'Bollard Covers', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1120, 'Width (mm)': 750, 'Materials': '4mm Correx', 'Finishing': 'cut & scored, self adhesive applied to 50mm flap', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '83': {'Part URN': 83, 'Part Name': 'Bollard Wrap OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1120, 'Width (mm)': 750, 'Materials': '4mm Correx', 'Finishing': 'Trim to size, crease and apply double sided tape', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '95': {'Part URN': 95, 'Part Name': 'Booklet 16pp 99x210', 'Part Short Name': None, 'No. of Pages': 16, 'Height (mm)': 99, 'Width (mm)': 210, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim, fold, perf and stitch', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '96': {'Part URN': 96, 'Part Name': 'Booklet 36PP 297x210', 'Part Short Name': None, 'No. of Pages': 36, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '115gsm Novatech Matt', 'Finishing': 'Trim, fold and stitch', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '260': {'Part URN': 260, 'Part Name': 'Books Page OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 230, 'Width (mm)': 100, 'Materials': None, 'Finishing': 'Trim', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '347': {'Part URN': 347, 'Part Name': 'Buddy Bingo A7 1pp Voucher (499 in a set) OT)', 'Part Short Name': None, 'No. of Pages': 499, 'Height (mm)': 74, 'Width (mm)': 105, 'Materials': '150gsm Silk', 'Finishing': 'Trim to size. 1 Set = 499 vouchers', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '289': {'Part URN': 289, 'Part Name': 'Buzz Bingo Club Map', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 400, 'Width (mm)': 400, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '105': {'Part URN': 105, 'Part Name': 'Buzz Bonus Card', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': '350gsm gloss lam', 'Finishing': 'Die Cut', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '143': {'Part URN': 143, 'Part Name': 'Buzz Desk Top Carousel Banner 1315 x 300px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 300, 'Width (mm)': 1315, 'Materials': 'digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '246': {'Part URN': 246, 'Part Name': 'Buzz Large Cheque Double sided OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 650, 'Width (mm)': 1220, 'Materials': '2mm Display card', 'Finishing': 'Dry wipe laminate to face 125 micron & trim', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '137': {'Part URN': 137, 'Part Name': 'Buzz Large Cheque OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 650, 'Width (mm)': 1220, 'Materials': '1250 mic ', 'Finishing': 'Dry wipe laminate to face 1250 mic ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '203': {'Part URN': 203, 'Part Name': 'Buzz Live Casino Icon', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 257, 'Width (mm)': 456, 'Materials': 'X', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '206': {'Part URN': 206, 'Part Name': 'Buzz Live Casino Standard & Icon', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 800, 'Width (mm)': 1428, 'Materials': 'X', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '150': {'Part URN': 150, 'Part Name': 'Buzz Mobile Carousel Banner 1245 x 556px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 556, 'Width (mm)': 1245, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '350': {'Part URN': 350, 'Part Name': 'Buzz White Envelope Poster', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 740, 'Width (mm)': 330, 'Materials': '3mm foam board', 'Finishing': 'Trim, supply with double sided tape', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '351': {'Part URN': 351, 'Part Name': 'Buzz White Envelope Poster OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 740, 'Width (mm)': 330, 'Materials': '3mm foam board', 'Finishing': 'Trim, supply with double sided tape', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '145': {'Part URN': 145, 'Part Name': 'Carousel Banner Mobile 416x279', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 279, 'Width (mm)': 416, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '144': {'Part URN': 144, 'Part Name': 'Carousel Banner Tablet', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 428, 'Width (mm)': 1024, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '378': {'Part URN': 378, 'Part Name': 'Carousel desktop banners 1081x246', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 246, 'Width (mm)': 1081, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '379': {'Part URN': 379, 'Part Name': 'Carousel desktop banners 1081x332', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 332, 'Width (mm)': 1081, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '377': {'Part URN': 377, 'Part Name': 'Carousel desktop banners 1395x417', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 417, 'Width (mm)': 1395, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '190': {'Part URN': 190, 'Part Name': 'Christmas Card 4pp A5', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '350gsm Uncoated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '374': {'Part URN': 374, 'Part Name': 'Club banner (1440 x 537px) L', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 537, 'Width (mm)': 1440, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '135': {'Part URN': 135, 'Part Name': 'Club Banner 1440x430 L', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 430, 'Width (mm)': 1440, 'Materials': 'App graphic', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '375': {'Part URN': 375, 'Part Name': 'Club banner Landscape  (2960 x 395px)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 395, 'Width (mm)': 2960, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '383': {'Part URN': 383, 'Part Name': 'Club banner Landscape 1440 x 537px L', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 537, 'Width (mm)': 1440, 'Materials': 'Px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '376': {'Part URN': 376, 'Part Name': 'Club banner Page (1440 x 427) L', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 427, 'Width (mm)': 1440, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '233': {'Part URN': 233, 'Part Name': 'Club finder page 416x555', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 416, 'Width (mm)': 555, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '217': {'Part URN': 217, 'Part Name': 'Club graphic 539x370', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 539, 'Width (mm)': 370, 'Materials': 'pixel', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '128': {'Part URN': 128, 'Part Name': 'Club New Members Cards', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'x', 'Finishing': 'x', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '348': {'Part URN': 348, 'Part Name': 'Concept Line', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'concept', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '42': {'Part URN': 42, 'Part Name': 'Customer Comment Card  - Box', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': '350gsm Uncoatd', 'Finishing': 'Die cut and assembled', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '202': {'Part URN': 202, 'Part Name': 'Dabber', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 101, 'Width (mm)': 103, 'Materials': 'Plastic', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '395': {'Part URN': 395, 'Part Name': 'Desktop Banner 430x1440px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 430, 'Width (mm)': 1440, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '219': {'Part URN': 219, 'Part Name': 'Desktop Infographic 950x803', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 803, 'Width (mm)': 950, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '53': {'Part URN': 53, 'Part Name': 'Digital Screen 1080 x1920 (pix)(under 5MB)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': '1920 x 1080 (pix)', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '58': {'Part URN': 58, 'Part Name': 'Digital Screen 1920 x 1080 (pix)(under 5MB)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1920, 'Materials': '1080 x 1920 (pix)', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '393': {'Part URN': 393, 'Part Name': 'Digital Screen Landscape OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 381, 'Width (mm)': 677, 'Materials': '1080 x 1920 (pix)', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '392': {'Part URN': 392, 'Part Name': 'Digital Screen Portrait OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 677, 'Width (mm)': 381, 'Materials': '1920 x 1080 (pix)', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '22': {'Part URN': 22, 'Part Name': 'DL 1pp Flyer', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'trimmed', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '70': {'Part URN': 70, 'Part Name': 'DL 1PP Flyer OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '23': {'Part URN': 23, 'Part Name': 'DL 2pp Flyer', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '263': {'Part URN': 263, 'Part Name': 'DL 2pp Flyer  Perforated', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim to size and perforate 2x times horizontally', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '71': {'Part URN': 71, 'Part Name': 'DL 2PP Flyer OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '98': {'Part URN': 98, 'Part Name': 'DL 4pp Flyer', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 99, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim and Fold', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '24': {'Part URN': 24, 'Part Name': 'DL 4pp Flyer 210x198 OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 198, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim and Fold and Perf', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '111': {'Part URN': 111, 'Part Name': 'DL 4PP Flyer OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size and Fold', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '25': {'Part URN': 25, 'Part Name': 'DL 6pp Flyer', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150g Novatech Matt', 'Finishing': 'Trim and Fold and Perf', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '110': {'Part URN': 110, 'Part Name': 'DL 6PP Flyer OT', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim and Fold', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '13': {'Part URN': 13, 'Part Name': 'DL, 4pp 210X198 Perfed Leaflet', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 198, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Perf once vertically & twice horizontally, trim to size and fold to create 4pp Portrait DL Leaflet', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '346': {'Part URN': 346, 'Part Name': 'DM Wrap 150x150', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 150, 'Width (mm)': 150, 'Materials': '115gsm Silk', 'Finishing': 'Trim to size. Machine finished', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '207': {'Part URN': 207, 'Part Name': 'Donut Box', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 700, 'Width (mm)': 900, 'Materials': '1100mic Display Board', 'Finishing': 'Die Cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '37': {'Part URN': 37, 'Part Name': 'Draw Drum', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 410, 'Width (mm)': 470, 'Materials': '5mm PVC, 3mm PVC, Clear Axpet, 12.5 DIA ALU, 5mm Polycarb', 'Finishing': '410x470x420 Die cut and assembled', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '188': {'Part URN': 188, 'Part Name': 'Draw Drum OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 410, 'Width (mm)': 270, 'Materials': '5mm PVC, 3mm PVC, Clear Axpet, 12.5 DIA ALU, 5mm Polycarb', 'Finishing': '410x470x420 Die cut and assembled', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '178': {'Part URN': 178, 'Part Name': 'Dry Wipe Poster 508x762mm OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 508, 'Width (mm)': 762, 'Materials': '250gsm Novatech Silk', 'Finishing': 'Apply Dry Wipe Laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '134': {'Part URN': 134, 'Part Name': 'EBT Advert Screensaver 1366x767', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 767, 'Width (mm)': 1366, 'Materials': 'EBT Advert', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '133': {'Part URN': 133, 'Part Name': 'EBT Banner 1271x280', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 280, 'Width (mm)': 1271, 'Materials': 'EBT banner', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '394': {'Part URN': 394, 'Part Name': 'EBT Banner 1366x768px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 768, 'Width (mm)': 1366, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '367': {'Part URN': 367, 'Part Name': 'EBT Game images 222x143', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 143, 'Width (mm)': 222, 'Materials': 'pxl', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '366': {'Part URN': 366, 'Part Name': 'EBT Home Screen banner 1020x198', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 198, 'Width (mm)': 1020, 'Materials': 'EBT', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '52': {'Part URN': 52, 'Part Name': 'Email Assets', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 444, 'Width (mm)': 750, 'Materials': '1', 'Finishing': 'Assets - SilverPop', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '51': {'Part URN': 51, 'Part Name': 'Email Full template', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': '1', 'Finishing': 'Full template - RedEye', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '345': {'Part URN': 345, 'Part Name': 'Events F&B A4 Menu Pad Backboard glued to pad OT', 'Part Short Name': None, 'No. of Pages': 250, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '120g Uncoated w/ greyboard back', 'Finishing': 'TTS D/S padded in 250’s at head w/ greyboard back', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '21': {'Part URN': 21, 'Part Name': 'External Banner 1500x2990', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1500, 'Width (mm)': 2990, 'Materials': 'Banner Grade Vinyl 440mic PVC', 'Finishing': 'Trim to size, hem & metal Eyelet', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '162': {'Part URN': 162, 'Part Name': 'External Banner 1500x2990mm OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1500, 'Width (mm)': 2990, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '334': {'Part URN': 334, 'Part Name': 'External Banner 1500x3000', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1500, 'Width (mm)': 3000, 'Materials': 'Banner Grade Vinyl 440mic PVC', 'Finishing': 'Trim to size, hem & metal Eyelet', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '316': {'Part URN': 316, 'Part Name': 'External Banner 1510x3000', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1510, 'Width (mm)': 3000, 'Materials': 'Banner Grade Vinyl 440mic PVC', 'Finishing': 'Trim to size, hem & metal Eyelet', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '318': {'Part URN': 318, 'Part Name': 'External Banner 1520x3000', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1520, 'Width (mm)': 3000, 'Materials': 'Banner Grade Vinyl 440mic PVC', 'Finishing': 'Trim to size, hem & Eyelet', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '278': {'Part URN': 278, 'Part Name': 'External Banner 1990x2990 ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1990, 'Width (mm)': 2990, 'Materials': 'Banner Grade Vinyl 440mic PVC', 'Finishing': 'Trim to size, hem & metal eyelet include cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '315': {'Part URN': 315, 'Part Name': 'External Banner 1990x2990mm OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1990, 'Width (mm)': 2990, 'Materials': 'External Banner Grade PVC', 'Finishing': 'Trim, hemmed, metal eyelet & supplied with cable ties', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '175': {'Part URN': 175, 'Part Name': 'Facebook 1080 x 1080', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1080, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '138': {'Part URN': 138, 'Part Name': 'Facebook 1280x1280', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1280, 'Width (mm)': 1280, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '132': {'Part URN': 132, 'Part Name': 'Facebook Cover Image 360x820', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 820, 'Width (mm)': 360, 'Materials': 'Facebook', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '310': {'Part URN': 310, 'Part Name': 'Facebook Event Banner 1920x1005', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1005, 'Width (mm)': 1920, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '360': {'Part URN': 360, 'Part Name': 'Facebook Reel 500x888', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 888, 'Width (mm)': 500, 'Materials': 'digi', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '173': {'Part URN': 173, 'Part Name': 'Facebook Stories 1080x1920', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '106': {'Part URN': 106, 'Part Name': 'Flag', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': '350gsm gloss lam', 'Finishing': 'Die Cut', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '181': {'Part URN': 181, 'Part Name': 'Flag Base OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 420, 'Width (mm)': 420, 'Materials': 'plastic water filled base', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '14': {'Part URN': 14, 'Part Name': 'Free Bingo Cards', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 55, 'Width (mm)': 85, 'Materials': '350g Silk', 'Finishing': 'trimmed', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '47': {'Part URN': 47, 'Part Name': 'Free bingo postcard', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '250g Silk', 'Finishing': 'Trim to finished size. From 1 x data file supplied, us to mailsort and convert to print image tape and process to Mailmark, Admail, Entry Level Sustainable mail', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '216': {'Part URN': 216, 'Part Name': 'Free Spin Prize Icon', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 544, 'Width (mm)': 240, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '179': {'Part URN': 179, 'Part Name': 'Fryer Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 80, 'Width (mm)': 80, 'Materials': 'Self adhesive peelable', 'Finishing': 'Die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '142': {'Part URN': 142, 'Part Name': 'Gamcar Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 50, 'Width (mm)': 140, 'Materials': 'Self adhesive sticker', 'Finishing': 'Trim', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '153': {'Part URN': 153, 'Part Name': 'Gift Voucher Wallet', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 90, 'Width (mm)': 160, 'Materials': '350gsm Silk', 'Finishing': 'Die cut, fold and glue', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '282': {'Part URN': 282, 'Part Name': 'Gift Voucher Wallet OT (pack 100)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 90, 'Width (mm)': 160, 'Materials': '350gsm Silk', 'Finishing': 'Die cut, fold and glue', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '387': {'Part URN': 387, 'Part Name': 'Google asset 1024x683', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 683, 'Width (mm)': 1024, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '19': {'Part URN': 19, 'Part Name': 'Header Cards', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 90, 'Width (mm)': 580, 'Materials': '700mic Display', 'Finishing': 'trimmed', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '221': {'Part URN': 221, 'Part Name': 'Horizontal Icon 257x912', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 257, 'Width (mm)': 912, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '214': {'Part URN': 214, 'Part Name': 'In-Game Message', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 640, 'Width (mm)': 234, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '174': {'Part URN': 174, 'Part Name': 'Instagram 1080 x 1350', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1350, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '169': {'Part URN': 169, 'Part Name': 'Instagram Post 1080 x 1080', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1080, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '209': {'Part URN': 209, 'Part Name': 'Instagram Story 1080 x1920', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1080, 'Materials': 'Pixel', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '297': {'Part URN': 297, 'Part Name': 'Jackpot Board Inserts 165x143', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 165, 'Width (mm)': 143, 'Materials': '150gsm ', 'Finishing': '4 different coloured artworks in a pack. Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '296': {'Part URN': 296, 'Part Name': 'Keyholder Session Manager Workbook A4', 'Part Short Name': None, 'No. of Pages': 25, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '135gsm silk', 'Finishing': 'Trim, collate and stab sttich top left hand corner', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '222': {'Part URN': 222, 'Part Name': 'Large Icon 514x912', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 514, 'Width (mm)': 912, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '54': {'Part URN': 54, 'Part Name': 'Letterhead', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 420, 'Materials': '115gsm matt coated', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '44': {'Part URN': 44, 'Part Name': 'Letterhead perf', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 420, 'Materials': '115gsm matt coated', 'Finishing': 'Pattern perforate to form 5 vouchers (1 x vertical perforation & 4 x horizontal perforations) Re reeled ready for lasering. Supplied 1 up on Reels', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '303': {'Part URN': 303, 'Part Name': 'Light Box F&B', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1000, 'Width (mm)': 2400, 'Materials': 'Back Lit ', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '368': {'Part URN': 368, 'Part Name': 'Light Box freestanding 1700x760', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1700, 'Width (mm)': 760, 'Materials': 'Backlit', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '59': {'Part URN': 59, 'Part Name': 'Light Box Graphic (L)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 590, 'Width (mm)': 1680, 'Materials': 'Back Lit', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '16': {'Part URN': 16, 'Part Name': 'Light Box Graphic (P)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1680, 'Width (mm)': 590, 'Materials': 'Back Lit ', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '68': {'Part URN': 68, 'Part Name': 'Lightbox Graphic Landscape OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 590, 'Width (mm)': 1680, 'Materials': 'Backlit', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '67': {'Part URN': 67, 'Part Name': 'Lightbox Graphic Portrait OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1680, 'Width (mm)': 630, 'Materials': 'Backlit', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '170': {'Part URN': 170, 'Part Name': 'LinkedIn Cover Image', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 768, 'Width (mm)': 1536, 'Materials': 'Pixels', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '26': {'Part URN': 26, 'Part Name': 'Machine Ears', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 210, 'Materials': '300g Silk', 'Finishing': 'Gloss Laminate both sides, Die cut circle plus flat edge', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '29': {'Part URN': 29, 'Part Name': 'Machine Stickers ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '90g silk Self Adhesive', 'Finishing': 'Kiss Cut, 15 up on an A4 sheet, Gloss Laminated', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '177': {'Part URN': 177, 'Part Name': 'Magnetic ATM Cover OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 480, 'Width (mm)': 720, 'Materials': 'Magnetic material suitable for atm', 'Finishing': 'Die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '99': {'Part URN': 99, 'Part Name': 'Magnets', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'See sample', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '126': {'Part URN': 126, 'Part Name': 'Membership Card OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': 'PVC', 'Finishing': 'Die cut ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'Plastic Card Services Ltd', '%  Overs': 0, 'Status': 'Active'}, '80': {'Part URN': 80, 'Part Name': 'Menu  190x145', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 190, 'Width (mm)': 145, 'Materials': '350gsm Novatech Matt', 'Finishing': 'Matt Laminate b/s', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '81': {'Part URN': 81, 'Part Name': 'Menu 148x105', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 148, 'Width (mm)': 105, 'Materials': '350gsm Novetech Matt', 'Finishing': 'Matt Laminated b/s', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '325': {'Part URN': 325, 'Part Name': 'Menu 4pp ', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 295, 'Width (mm)': 170, 'Materials': '350gsm Silk ', 'Finishing': '340x295mm Flat / 295x170mm Finished.             Matt Laminate to both sides, trim to size, crease and fold. ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '32': {'Part URN': 32, 'Part Name': 'Menu 600x300', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 600, 'Width (mm)': 300, 'Materials': '400gsm Silk', 'Finishing': 'Matt lamimnate both sides, Trim & scored', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '40': {'Part URN': 40, 'Part Name': 'Menu Holders', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': 'Acrylic', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '329': {'Part URN': 329, 'Part Name': 'Mobile Banner 440 x 750px ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 440, 'Width (mm)': 750, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '380': {'Part URN': 380, 'Part Name': 'Mobile banner 575x337', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 337, 'Width (mm)': 575, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '218': {'Part URN': 218, 'Part Name': 'Mobile Infographic 450x981', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 981, 'Width (mm)': 450, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '35': {'Part URN': 35, 'Part Name': 'Mystery Envelopes', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 114, 'Width (mm)': 162, 'Materials': '100gsm', 'Finishing': 'cut & scored, apply 2 side glue/tape seams ', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '349': {'Part URN': 349, 'Part Name': 'New Member 8pp Z fold perforated', 'Part Short Name': None, 'No. of Pages': 8, 'Height (mm)': 148, 'Width (mm)': 420, 'Materials': '150gsm ', 'Finishing': "Trim to size, perforate each page, fold pack in 500's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '353': {'Part URN': 353, 'Part Name': 'New member 8pp Z fold perforated (x500) OT', 'Part Short Name': None, 'No. of Pages': 8, 'Height (mm)': 148, 'Width (mm)': 420, 'Materials': '150gsm silk', 'Finishing': "TTS, perforate each page, fold, pack in 500's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '384': {'Part URN': 384, 'Part Name': 'New member cheque book 16pp', 'Part Short Name': None, 'No. of Pages': 16, 'Height (mm)': 75, 'Width (mm)': 150, 'Materials': '130gsm', 'Finishing': "Trim, collate, stitch in 1 position, pack in 500's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '57': {'Part URN': 57, 'Part Name': 'New Members Cheque Book OT', 'Part Short Name': None, 'No. of Pages': 16, 'Height (mm)': 105, 'Width (mm)': 74, 'Materials': '130gsm', 'Finishing': 'stitch 1 position', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '136': {'Part URN': 136, 'Part Name': 'One Piece Mailer (10pp A5)', 'Part Short Name': None, 'No. of Pages': 10, 'Height (mm)': 210, 'Width (mm)': 728, 'Materials': 'Silk 170gsm', 'Finishing': 'Trim and roll fold five time to finished size and seal using line of peelable glue', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '167': {'Part URN': 167, 'Part Name': 'One Piece Mailer (4pp 148x148)', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 148, 'Width (mm)': 148, 'Materials': '250gsm Matt', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '131': {'Part URN': 131, 'Part Name': 'One Piece Mailer (4pp A5)', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 296, 'Materials': 'Silk 250gsm', 'Finishing': "Trim, fold once to A5 and seal on all edges to comply with Royal Mail's Mailmark", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '248': {'Part URN': 248, 'Part Name': 'One Piece Mailer (4pp A5) OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 296, 'Materials': '250gsm', 'Finishing': 'TTS fold', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '168': {'Part URN': 168, 'Part Name': 'One Piece Mailer (6pp 148x148)', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 148, 'Width (mm)': 148, 'Materials': '250gsm Matt', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '46': {'Part URN': 46, 'Part Name': 'One Piece Mailer (6pp A5)', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 210, 'Width (mm)': 442, 'Materials': '250g Silk', 'Finishing': 'Finished size 210mm x 148mm ', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '192': {'Part URN': 192, 'Part Name': 'One Piece Mailer (8pp 148x148)', 'Part Short Name': None, 'No. of Pages': 8, 'Height (mm)': 148, 'Width (mm)': 148, 'Materials': '250gsm Matt', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '286': {'Part URN': 286, 'Part Name': 'One Piece Mailer (8pp A5)', 'Part Short Name': None, 'No. of Pages': 8, 'Height (mm)': 210, 'Width (mm)': 592, 'Materials': '250g Silk', 'Finishing': 'Finished size 210mm x 148mm ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '41': {'Part URN': 41, 'Part Name': 'Open The Box  - Box', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1000, 'Width (mm)': 1100, 'Materials': '350gsm Uncoatd', 'Finishing': 'Die cut and assembled', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '34': {'Part URN': 34, 'Part Name': 'Open The Box Envelopes', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 162, 'Width (mm)': 229, 'Materials': '100gsm matt', 'Finishing': 'cut & scored, apply 2 side glue/tape seams ', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '39': {'Part URN': 39, 'Part Name': 'Out of Order Stickers', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 100, 'Width (mm)': 30, 'Materials': 'white gloss reelable', 'Finishing': '250 per roll/44mm Core', 'Part Sell Price': None, 'Colours Front': 2, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '92': {'Part URN': 92, 'Part Name': 'Out of Order Tape', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 30, 'Width (mm)': 130, 'Materials': 'Gloss Peelable self adhesive', 'Finishing': '1 x roll', 'Part Sell Price': None, 'Colours Front': 2, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '107': {'Part URN': 107, 'Part Name': 'Out of Order Tape 50x150', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 50, 'Width (mm)': 150, 'Materials': 'Gloss Peelable self adhesive', 'Finishing': '1 x roll', 'Part Sell Price': None, 'Colours Front': 2, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '43': {'Part URN': 43, 'Part Name': 'Outer Envelope', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 162, 'Width (mm)': 229, 'Materials': '115gsm matt coated', 'Finishing': 'Gummed Wallet Window, window  size 55mm x 95mm. Window 30mm from Left Hand Side, 55mm from Bottom', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '45': {'Part URN': 45, 'Part Name': 'Personalisation & Enclosing', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1, 'Width (mm)': 1, 'Materials': '1', 'Finishing': '1 x data file supplied - mailsort to Mailmark, Admail Entry Level sustainable. Duplex laser personalise name & address, letter text and voucher details. Trim and fold twice to A5. Enclose letter into outer envelope. Bundle & bag in mailsort order', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '308': {'Part URN': 308, 'Part Name': 'Phone Kiosk 1804mm x 714mm', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1804, 'Width (mm)': 714, 'Materials': 'TBC', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '306': {'Part URN': 306, 'Part Name': 'Phone Kiosk Bottom 655mm x 654mm', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 655, 'Width (mm)': 654, 'Materials': 'TBC', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '307': {'Part URN': 307, 'Part Name': 'Phone Kiosk Panel 116mm x 604mm', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 116, 'Width (mm)': 604, 'Materials': 'TBC', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '305': {'Part URN': 305, 'Part Name': 'Phone Kiosk Top 893mm x 654mm', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 893, 'Width (mm)': 654, 'Materials': 'TBC', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '277': {'Part URN': 277, 'Part Name': 'POG numbers 0-9', 'Part Short Name': None, 'No. of Pages': 9, 'Height (mm)': 145, 'Width (mm)': 100, 'Materials': 'Yupotako', 'Finishing': 'TTS', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '180': {'Part URN': 180, 'Part Name': 'Pole & Flag OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 3910, 'Width (mm)': 753, 'Materials': 'outdoor flag', 'Finishing': 'trim and supply with poles', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '225': {'Part URN': 225, 'Part Name': 'Pop Up Banner 766x503', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 766, 'Width (mm)': 503, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '191': {'Part URN': 191, 'Part Name': 'Presentation Cheque', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 650, 'Width (mm)': 1220, 'Materials': '1250 mic', 'Finishing': 'Dry wipe laminate to face 1250 mic ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '33': {'Part URN': 33, 'Part Name': 'Prize Draw Envelopes', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 114, 'Width (mm)': 162, 'Materials': '150g silk', 'Finishing': 'cut & scored, apply 2 side glue/tape seams ', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '204': {'Part URN': 204, 'Part Name': 'Prize Icon', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 240, 'Width (mm)': 544, 'Materials': 'x', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '258': {'Part URN': 258, 'Part Name': 'Prize Money Board Day Label 125x172 OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 172, 'Materials': 'Yupo Tako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '321': {'Part URN': 321, 'Part Name': 'Prize Money Board Day Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 172, 'Materials': 'Yupotako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '276': {'Part URN': 276, 'Part Name': 'Prize Money Board Full Length Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 856, 'Materials': 'Yupotako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '256': {'Part URN': 256, 'Part Name': 'Prize Money Board Price Label 125x130 OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 130, 'Materials': 'Yupo Tako', 'Finishing': 'trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '324': {'Part URN': 324, 'Part Name': 'Prize Money Board Price Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 130, 'Materials': 'Yupotako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '255': {'Part URN': 255, 'Part Name': 'Prize Money Board Prize Label 125x276 OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 276, 'Materials': 'Yupo Tako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '323': {'Part URN': 323, 'Part Name': 'Prize Money Board Prize Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 276, 'Materials': 'Yupotako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '257': {'Part URN': 257, 'Part Name': 'Prize Money Board Session Label 125x218 OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 218, 'Materials': 'Yupo Tako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '322': {'Part URN': 322, 'Part Name': 'Prize Money Board Session Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 218, 'Materials': 'Yupotako', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '254': {'Part URN': 254, 'Part Name': 'Prize money label 125x276mm', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 125, 'Width (mm)': 276, 'Materials': 'Yupo Tako', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 1, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '290': {'Part URN': 290, 'Part Name': 'Projector Asset', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1920, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '309': {'Part URN': 309, 'Part Name': 'Promo Box Club Page (P) 750x440', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 750, 'Width (mm)': 440, 'Materials': 'digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '147': {'Part URN': 147, 'Part Name': 'Promo Box Club Page 440x750', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 440, 'Width (mm)': 750, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '224': {'Part URN': 224, 'Part Name': 'Promo Page 768x320 ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 320, 'Width (mm)': 768, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '330': {'Part URN': 330, 'Part Name': 'Promo Page Desktop Carousel Banner 1440 x 430px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 430, 'Width (mm)': 750, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '141': {'Part URN': 141, 'Part Name': 'Promo Planner 20x30 (DRY WIPE LAM) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 508, 'Width (mm)': 762, 'Materials': '200gsm Silk', 'Finishing': 'Trim & apply dry wipe laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '140': {'Part URN': 140, 'Part Name': 'Promo Planner 40x60 (DRY WIPE LAM) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1016, 'Width (mm)': 1524, 'Materials': '200gsm Silk', 'Finishing': 'Trim & apply dry wipe laminate', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '55': {'Part URN': 55, 'Part Name': 'Pull Up Banner in cassette', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 2200, 'Width (mm)': 800, 'Materials': 'Stop light', 'Finishing': 'TTS place banner into cartridge', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '124': {'Part URN': 124, 'Part Name': 'Pull Up Banner in cassette OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 2200, 'Width (mm)': 800, 'Materials': 'Banner PVC', 'Finishing': 'TTS place banner into cartridge', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '262': {'Part URN': 262, 'Part Name': 'Removal Sticker OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 150, 'Width (mm)': 378, 'Materials': 'Removal Sticker', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '36': {'Part URN': 36, 'Part Name': 'Reserved / Out of Order Signs', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 210, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Encapsulated trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '212': {'Part URN': 212, 'Part Name': 'Schedule Digital', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 850, 'Width (mm)': 480, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '365': {'Part URN': 365, 'Part Name': 'Self adhesive Label 40x85', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 40, 'Width (mm)': 85, 'Materials': 'Self adhesive Label ', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '38': {'Part URN': 38, 'Part Name': 'Serviette Stickers', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 20, 'Width (mm)': 20, 'Materials': 'Gloss peelable self Adhesive', 'Finishing': 'Roll of Sticker', 'Part Sell Price': None, 'Colours Front': 1, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '294': {'Part URN': 294, 'Part Name': 'Share the Buzz 40x30 Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 50, 'Width (mm)': 570, 'Materials': 'Yupo tac', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '293': {'Part URN': 293, 'Part Name': 'Share the Buzz 60x40 Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 70, 'Width (mm)': 866, 'Materials': 'Yupo tac', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '164': {'Part URN': 164, 'Part Name': 'Slots Game Icons ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 257, 'Width (mm)': 456, 'Materials': 'x', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '362': {'Part URN': 362, 'Part Name': 'Slots Label 25x100 (10 per pack) OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 25, 'Width (mm)': 100, 'Materials': 'Self adhesive', 'Finishing': "Trim pack in 10's", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '87': {'Part URN': 87, 'Part Name': 'Slots Machine Cover (130x90) - Type 4', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 130, 'Width (mm)': 90, 'Materials': '2000 Mic Display', 'Finishing': 'See Artwork', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '86': {'Part URN': 86, 'Part Name': 'Slots Machine Cover (160x110) - Type 1', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 160, 'Width (mm)': 110, 'Materials': '2000 Mic Display', 'Finishing': 'See Artwork', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '88': {'Part URN': 88, 'Part Name': 'Slots Machine Cover (190x140) - Type 5', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 190, 'Width (mm)': 140, 'Materials': '2000 Mic Display', 'Finishing': 'See Artwork', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '84': {'Part URN': 84, 'Part Name': 'Slots Machine Cover (208x120) - Type 2', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 208, 'Width (mm)': 120, 'Materials': '2000 Mic Display', 'Finishing': 'See Artwork', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '85': {'Part URN': 85, 'Part Name': 'Slots Machine Cover (90x380) - Type 3', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 90, 'Width (mm)': 380, 'Materials': '2000 Mic Display', 'Finishing': 'See Artwork', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '139': {'Part URN': 139, 'Part Name': 'Slots Machine Ears OT', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 140, 'Width (mm)': 132, 'Materials': '350gsm Novatech Matt', 'Finishing': 'Gloss laminate both sides and trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '338': {'Part URN': 338, 'Part Name': 'Slots Machine Vinyl Stickers', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 38, 'Width (mm)': 38, 'Materials': 'White Vinyl', 'Finishing': 'Individually numbered stickers.  38mm dia circles, kiss cut 35 out of an A4 backing sheet. ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '339': {'Part URN': 339, 'Part Name': 'Slots Machine Vinyl Stickers OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 38, 'Width (mm)': 38, 'Materials': 'White Vinyl', 'Finishing': "Individ no'd labels 38mm dia kiss cut 35 up on A4", 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '205': {'Part URN': 205, 'Part Name': 'Slots Tournament Lower Prizes', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 120, 'Width (mm)': 540, 'Materials': 'x', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'InActive'}, '196': {'Part URN': 196, 'Part Name': 'Slots Tournament Online In Game Display Icon', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 400, 'Width (mm)': 400, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '197': {'Part URN': 197, 'Part Name': 'Slots Tournament Widget 480x850', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 480, 'Width (mm)': 850, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '385': {'Part URN': 385, 'Part Name': 'Slots website 1245x419px', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 419, 'Width (mm)': 1245, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '359': {'Part URN': 359, 'Part Name': 'Snippet for 2pp DM ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 70, 'Width (mm)': 148, 'Materials': '250gsm', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '358': {'Part URN': 358, 'Part Name': 'Snippet for 4pp DM ', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 70, 'Width (mm)': 148, 'Materials': '250gsm', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '363': {'Part URN': 363, 'Part Name': 'Snippet for A4 letter (201x78)', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 201, 'Width (mm)': 78, 'Materials': 'snippet', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '371': {'Part URN': 371, 'Part Name': 'Spirit clip 55x85 OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 55, 'Width (mm)': 85, 'Materials': '3000 mic foamed', 'Finishing': 'die cut, apply pump clip to reverse', 'Part Sell Price': None, 'Colours Front': 5, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '234': {'Part URN': 234, 'Part Name': 'Splash Page background 2045x1370', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1370, 'Width (mm)': 2045, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '237': {'Part URN': 237, 'Part Name': 'Splash page Burst – 2045 x 1470', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1470, 'Width (mm)': 2045, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '230': {'Part URN': 230, 'Part Name': 'Splash Page Desktop background – 1920 x 1010', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1010, 'Width (mm)': 1920, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '231': {'Part URN': 231, 'Part Name': 'Splash Page Mobile background – 768 x 320', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 320, 'Width (mm)': 768, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '239': {'Part URN': 239, 'Part Name': 'Splash Page Pointer – 59 x 89', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 89, 'Width (mm)': 59, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '238': {'Part URN': 238, 'Part Name': 'Splash Page Register button – 156 x 160', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 160, 'Width (mm)': 156, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '232': {'Part URN': 232, 'Part Name': 'Splash Page Secondary image 1920 x 481', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 481, 'Width (mm)': 1920, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '240': {'Part URN': 240, 'Part Name': 'Splash Page Title – 752 x 317', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 317, 'Width (mm)': 752, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '235': {'Part URN': 235, 'Part Name': 'Splash Page Wheel 529x529', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 529, 'Width (mm)': 529, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '236': {'Part URN': 236, 'Part Name': 'Splash Page Wheel frame/border – 800 x 800', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 800, 'Width (mm)': 800, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'Buzz Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '155': {'Part URN': 155, 'Part Name': 'Standard icon 257x456', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 257, 'Width (mm)': 456, 'Materials': 'Digital', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '93': {'Part URN': 93, 'Part Name': 'Sticker 51x51', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 51, 'Width (mm)': 51, 'Materials': 'Gloss peelable self Adhesive', 'Finishing': 'Pack of 50', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '280': {'Part URN': 280, 'Part Name': 'Sticker 60x60', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 60, 'Width (mm)': 60, 'Materials': 'Gloss peelable self Adhesive', 'Finishing': 'die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '90': {'Part URN': 90, 'Part Name': 'Stickers 80x80', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 80, 'Width (mm)': 80, 'Materials': 'Self Adhesive Peelable', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '17': {'Part URN': 17, 'Part Name': 'Strut Card', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 297, 'Width (mm)': 105, 'Materials': '2000mic Display', 'Finishing': 'Trim and apply strut to reverse', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '247': {'Part URN': 247, 'Part Name': 'Table Toblerone', 'Part Short Name': None, 'No. of Pages': 3, 'Height (mm)': 99, 'Width (mm)': 210, 'Materials': 'Box board', 'Finishing': 'Die cut, crease and glue to one edge', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '101': {'Part URN': 101, 'Part Name': 'Tag 180x180', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 180, 'Width (mm)': 180, 'Materials': 'TBC', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '343': {'Part URN': 343, 'Part Name': 'Team Bingo 60x40" Velcro Standee', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1800, 'Width (mm)': 1200, 'Materials': 'Foamboard', 'Finishing': 'Trim to size.   Apply double rudder strut to reverse.   Matt Laminate to face.   Add Velcro dots.', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '189': {'Part URN': 189, 'Part Name': 'Team Bingo A6 Name Cards', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '250gsm Uncoated', 'Finishing': 'Trim to size, 8 kinds to a set', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '149': {'Part URN': 149, 'Part Name': 'Team Bingo A6 Name Cards OT', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': '130gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '186': {'Part URN': 186, 'Part Name': 'Team Bingo Header', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 190, 'Width (mm)': 795, 'Materials': 'Folding Box Board', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '187': {'Part URN': 187, 'Part Name': 'Team Bingo Name Strips', 'Part Short Name': None, 'No. of Pages': 6, 'Height (mm)': 90, 'Width (mm)': 580, 'Materials': 'Folding Box Board', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '333': {'Part URN': 333, 'Part Name': 'Team Bingo Team Sticker', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 64, 'Width (mm)': 64, 'Materials': 'Self Adhesive Peelable', 'Finishing': 'Die cut - round sticker.  Will be stuck to clothing ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '342': {'Part URN': 342, 'Part Name': 'Team Bingo Tokens', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 30, 'Width (mm)': 30, 'Materials': 'Plastic Token', 'Finishing': '5 Coloured Tokens = RED BLUE GREEN YELLOW PURPLE. 100 of each colour to be sent to club', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '152': {'Part URN': 152, 'Part Name': 'Temporary Membership Cards OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 55, 'Width (mm)': 85, 'Materials': '350gm Silk', 'Finishing': 'Trim to size, supplied as a set of 50', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '20': {'Part URN': 20, 'Part Name': 'Tent Cards', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '350g Silk', 'Finishing': 'Die cut', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '298': {'Part URN': 298, 'Part Name': 'Thank you Card 148x148 OT', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 148, 'Width (mm)': 296, 'Materials': '250gsm', 'Finishing': 'TTS, crease and fold ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': '@ ITG Test Printer 1', '%  Overs': 0, 'Status': 'Active'}, '215': {'Part URN': 215, 'Part Name': 'Toaster Message', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 240, 'Width (mm)': 300, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '210': {'Part URN': 210, 'Part Name': 'Toblerone', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1475, 'Width (mm)': 1785, 'Materials': 'Display board', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '283': {'Part URN': 283, 'Part Name': 'Toblerone OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1475, 'Width (mm)': 1785, 'Materials': 'Display board', 'Finishing': 'supply with double sided tape ', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '229': {'Part URN': 229, 'Part Name': 'Top of Slots Machine Flex B Full Screen 1476x1920', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1476, 'Width (mm)': 1920, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '228': {'Part URN': 228, 'Part Name': 'Top of Slots Machine Flex B3 1920x1476', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1920, 'Width (mm)': 1476, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '227': {'Part URN': 227, 'Part Name': 'Top of Slots Machine Optimus 1920x1080', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1080, 'Width (mm)': 1920, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '226': {'Part URN': 226, 'Part Name': 'Top of Slots Machine VJ 1280x1024', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1024, 'Width (mm)': 1280, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '292': {'Part URN': 292, 'Part Name': 'Tuesday Club A5 2pp Perforated Leaflet', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 210, 'Width (mm)': 148, 'Materials': '150g Silk', 'Finishing': 'Perforate 3 times horizontally. Trim to size', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 4, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '31': {'Part URN': 31, 'Part Name': 'Twist & Lock Dispenser', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 594, 'Width (mm)': 420, 'Materials': '2000mic Display', 'Finishing': 'Amnti vandal laminate to face & Die cut', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '223': {'Part URN': 223, 'Part Name': 'Twitter Post 512x1024', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 512, 'Width (mm)': 1024, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '220': {'Part URN': 220, 'Part Name': 'Vertical Icon 514x456', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 514, 'Width (mm)': 456, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '50': {'Part URN': 50, 'Part Name': 'VIP Monthly mailer ', 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 296, 'Materials': '235g Silk', 'Finishing': 'Finish size 210mm x 148mm. Trim and fold once or twice to finished size sealing on all edges to comply with Royal Mail’s Mailmark regulations', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '102': {'Part URN': 102, 'Part Name': 'Voucher 90x180', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 90, 'Width (mm)': 180, 'Materials': '150gsm Novatech Matt', 'Finishing': 'Trim to size', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '171': {'Part URN': 171, 'Part Name': 'Website Video', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 105, 'Width (mm)': 148, 'Materials': 'Video', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '49': {'Part URN': 49, 'Part Name': "What's on now", 'Part Short Name': None, 'No. of Pages': 4, 'Height (mm)': 210, 'Width (mm)': 296, 'Materials': '235g Silk', 'Finishing': 'Finish size 210mm x 148mm. Trim and fold once or twice to finished size sealing on all edges to comply with Royal Mail’s Mailmark regulations', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '213': {'Part URN': 213, 'Part Name': 'Widget icon 400x400', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 400, 'Width (mm)': 400, 'Materials': 'px', 'Finishing': None, 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '242': {'Part URN': 242, 'Part Name': 'Window vinyl 300mm OT', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 300, 'Width (mm)': 300, 'Materials': 'Window vinyl', 'Finishing': 'die cut', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '28': {'Part URN': 28, 'Part Name': 'Wobblers 100x100', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 100, 'Width (mm)': 100, 'Materials': '250g Silk', 'Finishing': 'Glass LaminateDie cut / Attach 145mm stem', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'KAZOO PSG LIMITED OT', '%  Overs': 0, 'Status': 'Active'}, '27': {'Part URN': 27, 'Part Name': 'Wobblers 160x120', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 160, 'Width (mm)': 120, 'Materials': 'Polypropelene ', 'Finishing': 'Apply double sided tape', 'Part Sell Price': None, 'Colours Front': 0, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '291': {'Part URN': 291, 'Part Name': 'Wrist band', 'Part Short Name': None, 'No. of Pages': 2, 'Height (mm)': 30, 'Width (mm)': 148, 'Materials': '200gsm silk', 'Finishing': 'trimmed to size apply D/S tape', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}, '388': {'Part URN': 388, 'Part Name': 'YouTube banner 2560 x 1440', 'Part Short Name': None, 'No. of Pages': 1, 'Height (mm)': 1440, 'Width (mm)': 2560, 'Materials': 'Px 6MB or less', 'Finishing': 'the safe area for text and logos: 1235 x 338 px.', 'Part Sell Price': None, 'Colours Front': 4, 'Colours Back': 0, 'Content (Days)': None, 'Production Time (Days)': None, 'Content Cost': None, 'Agency': 'ITG Studio', 'Production Supplier': 'ITG Print Management', '%  Overs': 0, 'Status': 'Active'}}
\ No newline at end of file
+"""``PARTS_DATA_RAW``, now served from the compiled parts catalogue.
+
+The catalogue used to be a dict literal in this file. It lives in
+``parts_catalogue.json`` and is only loaded when first accessed.
+"""
+
+from parts_catalogue import get_catalogue
+
+
+def __getattr__(name):
+    if name == "PARTS_DATA_RAW":
+        return get_catalogue().raw
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,194 @@
+"""Per-stage timing and memory figures for a merge run.
+
+``run_merge`` records each pipeline stage it runs (reading, parsing,
+transforming, writing) in a ``RunProfile``: wall time, rows in and out, the
+process' peak RSS once the stage is done and, when ``trace_memory`` is on,
+the peak Python allocation during the stage as seen by ``tracemalloc``.
+Stages that run repeatedly, as they do in low-memory mode, are summed.
+
+tracemalloc is process-wide, so only one run is traced at a time: entering a
+tracing ``RunProfile`` waits until any other has exited. Allocations made
+meanwhile by untraced work in other threads, such as another merge, are
+still counted in its peaks.
+
+``on_stage``, if given, is called with a stage's name each time it starts,
+which is how background jobs report progress and stop when cancelled.
+
+Workbooks are parsed in worker processes, so reading and parsing are also
+reported per file and summed as "worker" stages. Their total can be more
+than the wall time of the pool that ran them.
+"""
+
+import cProfile
+import json
+import marshal
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Held for the whole of a traced run; see the module docstring
+_TRACING = threading.Lock()
+
+
+def max_rss() -> Optional[int]:
+    """Peak resident set size of this process so far, in bytes (None if unknown)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+@dataclass
+class StageRecord:
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    traced_peak: Optional[int] = None
+    max_rss: Optional[int] = None
+    worker: bool = False
+
+
+def _add_rows(total: Optional[int], rows: Optional[int]) -> Optional[int]:
+    if rows is None:
+        return total
+    return rows if total is None else total + rows
+
+
+class RunProfile:
+    """Stage records for one run, in the order the stages first ran.
+
+    Use as a context manager when ``trace_memory`` is on, so tracing is
+    started and stopped around the run, once no other traced run is going.
+    """
+
+    def __init__(
+        self, trace_memory: bool = False, on_stage: Optional[Callable[[str], None]] = None
+    ):
+        self.trace_memory = trace_memory
+        self.on_stage = on_stage
+        self.stages = {}
+        self._started = time.perf_counter()
+        self.wall_seconds = 0.0
+        self._owns_tracing = False
+
+    def __enter__(self):
+        if self.trace_memory:
+            _TRACING.acquire()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall_seconds = time.perf_counter() - self._started
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        if self.trace_memory:
+            _TRACING.release()
+
+    def _record(self, name: str, worker: bool = False) -> StageRecord:
+        if name not in self.stages:
+            self.stages[name] = StageRecord(name, worker=worker)
+        return self.stages[name]
+
+    def add(
+        self, name: str, seconds: float, rows_in=None, rows_out=None, worker=False, calls=1
+    ):
+        """Add a run of a stage measured elsewhere, e.g. in a worker process."""
+        record = self._record(name, worker)
+        record.seconds += seconds
+        record.calls += calls
+        record.rows_in = _add_rows(record.rows_in, rows_in)
+        record.rows_out = _add_rows(record.rows_out, rows_out)
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """Time the block as one run of ``name``; set ``rows_out`` on the yielded object."""
+        if self.on_stage is not None:
+            self.on_stage(name)
+        record = self._record(name)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        run = SimpleNamespace(rows_out=None, calls=1)
+        start = time.perf_counter()
+        try:
+            yield run
+        finally:
+            self.add(name, time.perf_counter() - start, rows_in, run.rows_out, calls=run.calls)
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                record.traced_peak = max(record.traced_peak or 0, peak)
+            record.max_rss = max_rss()
+
+    def iter_stage(self, name: str, items):
+        """Yield from ``items``, timing each step as a run of ``name``.
+
+        Items with a length (frames, results with a ``frame``) count as rows out.
+        """
+        items = iter(items)
+        while True:
+            with self.stage(name) as run:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    run.calls = 0
+                    return
+                frame = getattr(item, "frame", item)
+                run.rows_out = len(frame) if hasattr(frame, "__len__") else None
+            yield item
+
+    def to_dict(self) -> dict:
+        return {
+            "wall_seconds": self.wall_seconds or time.perf_counter() - self._started,
+            "max_rss": max_rss(),
+            "stages": [asdict(record) for record in self.stages.values()],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_frame(self) -> pd.DataFrame:
+        """The stages as a table for display, with memory in MB."""
+        df = pd.DataFrame([asdict(record) for record in self.stages.values()])
+        if df.empty:
+            return df
+        for col in ["traced_peak", "max_rss"]:
+            df[col] = df[col].astype(float) / 1024 ** 2
+        return df.rename(
+            columns={"traced_peak": "traced peak MB", "max_rss": "max RSS MB"}
+        ).set_index("name")
+
+
+@contextmanager
+def cprofiled():
+    """Run the block under cProfile; yields the ``cProfile.Profile``."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+
+
+def profile_stats_bytes(profiler: cProfile.Profile) -> bytes:
+    """``profiler``'s stats in the format ``dump_stats`` writes, for pstats/snakeviz."""
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
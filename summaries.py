@@ -0,0 +1,125 @@
+"""Summary sheets of the combined output, computed while it is written.
+
+Finance pivots the Combined Data sheet by Order type, club Location, Part
+and project. ``SummaryBuilder`` works those totals out during the merge
+instead: each output chunk is reduced with one groupby per summary on its
+way to the writers, and each club frame is reduced by Location as it enters
+the transform, as output rows do not carry the Location. Only these small
+per-chunk results are kept; ``sheets()`` adds them up into one frame per
+summary sheet. Nothing is read or transformed a second time.
+
+The project summary is keyed by Project Ref alone; its Project name is
+the description on the project's first row, as on its C&P row.
+
+Quantities count the product rows only, not the C&P and Delivery rows that
+follow them. Money columns are the sums of the output's Print Sell and Sell
+columns; a C&P price of "NOT FOUND" counts as nothing.
+"""
+
+import numpy as np
+import pandas as pd
+
+ORDER_TYPE_SHEET = "By order type"
+LOCATION_SHEET = "By location"
+PART_SHEET = "By part"
+PROJECT_SHEET = "By project"
+
+# Output rows that are charges on the line or project above, not products
+CHARGE_PRODUCTS = ("C&P", "Delivery")
+
+MONEY_COLUMNS = ("Print Sell", "Sell", "Print", "C&P", "Delivery")
+
+_KEYS = {
+    ORDER_TYPE_SHEET: ["Order type"],
+    LOCATION_SHEET: ["Location"],
+    PART_SHEET: ["Order type", "Product"],
+    PROJECT_SHEET: ["Project Ref"],
+}
+
+# Columns taken from the first row of each group rather than summed
+_FIRST = {PROJECT_SHEET: ["Project name"]}
+
+_VALUES = {
+    ORDER_TYPE_SHEET: ["Index nos", "Lines", "Quantity", "Print Sell", "Sell"],
+    PART_SHEET: ["Lines", "Quantity", "Print Sell"],
+    PROJECT_SHEET: ["Lines", "Quantity", "Print Sell", "Sell"],
+}
+
+
+def _group(df: pd.DataFrame, keys: list, first: list = (), sort: bool = False) -> pd.DataFrame:
+    groups = df.groupby(keys, observed=True, sort=sort, dropna=False)
+    summed = groups[[col for col in df.columns if col not in keys and col not in first]].sum()
+    for i, col in enumerate(first):
+        summed.insert(i, col, groups[col].first(skipna=False))
+    return summed.reset_index()
+
+
+class SummaryBuilder:
+    """Totals of a merge's output by Order type, Location, Part and project."""
+
+    def __init__(self):
+        self._parts = {name: [] for name in _KEYS}
+
+    def add(self, chunk: pd.DataFrame):
+        """Reduce one chunk of output rows, in the compact layout of ``output_frame``."""
+        if chunk.empty:
+            return
+        product = ~chunk["Product"].isin(CHARGE_PRODUCTS).to_numpy()
+        index_no = chunk["index no"].to_numpy()
+        # Count each index no (club order line or project) once; all its rows are in one chunk
+        first = np.ones(len(chunk), dtype=bool)
+        first[1:] = index_no[1:] != index_no[:-1]
+        rows = pd.DataFrame(
+            {
+                "Order type": chunk["Order type"],
+                "Product": chunk["Product"],
+                "Project Ref": chunk["Project Ref"],
+                "Project name": chunk["Project name"],
+                "Index nos": first.astype(np.int64),
+                "Lines": product.astype(np.int64),
+                "Quantity": np.where(product, chunk["Quantity"].fillna(0).to_numpy(), 0.0),
+                "Print Sell": chunk["Print Sell"].fillna(0).to_numpy(),
+                "Sell": chunk["Sell"].fillna(0).to_numpy(),
+            },
+            copy=False,
+        )
+        projects = (rows["Order type"] != "Club").to_numpy()
+        selections = ((ORDER_TYPE_SHEET, None), (PART_SHEET, product), (PROJECT_SHEET, projects))
+        for name, mask in selections:
+            keys, first = _KEYS[name], _FIRST.get(name, [])
+            selected = rows if mask is None else rows[mask]
+            self._parts[name].append(_group(selected[keys + first + _VALUES[name]], keys, first))
+
+    def add_club(self, club_df: pd.DataFrame, print_val, cp_val, d_val, sell):
+        """Reduce one club frame by Location, with the charges ``club_charges`` gives its lines."""
+        if club_df.empty:
+            return
+        rows = pd.DataFrame(
+            {
+                "Location": club_df["Location"],
+                "Order lines": np.ones(len(club_df), dtype=np.int64),
+                "Quantity": club_df["Quantity"].to_numpy(dtype=float),
+                "Print": print_val,
+                "C&P": cp_val,
+                "Delivery": d_val,
+                "Sell": sell,
+            },
+            copy=False,
+        )
+        self._parts[LOCATION_SHEET].append(_group(rows, ["Location"]))
+
+    def sheets(self) -> dict:
+        """Sheet name -> summary frame, sorted by its keys, for every summary with rows."""
+        sheets = {}
+        for name, keys in _KEYS.items():
+            parts = [part for part in self._parts[name] if len(part)]
+            if not parts:
+                continue
+            first = _FIRST.get(name, [])
+            parts = [part.astype({col: object for col in keys + first}) for part in parts]
+            df = pd.concat(parts, ignore_index=True)
+            df = _group(df, keys, first, sort=True)
+            money = [col for col in MONEY_COLUMNS if col in df.columns]
+            df[money] = df[money].round(2)
+            sheets[name] = df
+        return sheets
@@ -0,0 +1,123 @@
+"""Typed Parquet and CSV copies of the combined output.
+
+The "Combined Data" sheet mixes types within a column: the C&P summary rows
+carry "NOT FOUND" in Print Sell, and blank cells are empty strings. The
+writers here give every column one type instead, so downstream loaders can
+read the output without re-parsing it:
+
+- ``index no`` is int64;
+- Quantity, Print Sell, Sell and Number of clubs are float64, with blanks
+  and "NOT FOUND" read as null (a null Print Sell on a C&P row means the
+  project was missing from the C&P file);
+- every other column is text, with blanks read as null.
+
+Like ``CombinedSheetWriter``, both writers take the output a chunk at a time
+and every chunk is written with the same schema.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+INT_COLUMNS = ("index no",)
+FLOAT_COLUMNS = ("Quantity", "Print Sell", "Sell", "Number of clubs")
+
+
+def output_schema(columns) -> pa.Schema:
+    """The Arrow schema the typed writers use for ``columns``."""
+    return pa.schema(
+        [
+            (
+                col,
+                pa.int64()
+                if col in INT_COLUMNS
+                else pa.float64()
+                if col in FLOAT_COLUMNS
+                else pa.string(),
+            )
+            for col in columns
+        ]
+    )
+
+
+def _text(value):
+    if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _text_array(values: pd.Series) -> pa.Array:
+    try:
+        array = pa.array(values.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Numbers mixed in with the text
+        array = pa.array([_text(v) for v in values.tolist()], type=pa.string())
+    return pc.if_else(pc.equal(array, ""), pa.scalar(None, pa.string()), array)
+
+
+def typed_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """``df`` converted to ``schema``; see the module docstring for the rules."""
+    arrays = []
+    for field in schema:
+        values = df[field.name]
+        if pa.types.is_string(field.type):
+            arrays.append(_text_array(values))
+        else:
+            numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+            if pa.types.is_integer(field.type):
+                numbers = numbers.astype(np.int64)
+            arrays.append(pa.array(numbers, type=field.type, from_pandas=True))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class _TableWriter(ABC):
+    def __init__(self, target, columns):
+        self.columns = list(columns)
+        self.schema = output_schema(self.columns)
+        self.rows_written = 0
+        self._writer = self._open(target)
+
+    @abstractmethod
+    def _open(self, target):
+        """The Arrow writer for ``target``, writing ``self.schema``."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, df):
+        """Write the rows of ``df`` (with ``self.columns``) after those already written."""
+        self._writer.write_table(typed_table(df, self.schema))
+        self.rows_written += len(df)
+
+    def close(self):
+        self._writer.close()
+
+
+class ParquetTableWriter(_TableWriter):
+    """Appends output frames to a Parquet file at ``target`` (path or binary file)."""
+
+    def _open(self, target):
+        return pq.ParquetWriter(target, self.schema)
+
+
+class CsvTableWriter(_TableWriter):
+    """Appends output frames to a CSV file at ``target`` (path or binary file)."""
+
+    def _open(self, target):
+        return pa_csv.CSVWriter(target, self.schema)
+
+
+TABLE_WRITERS = {
+    "parquet": ParquetTableWriter,
+    "csv": CsvTableWriter,
+}
@@ -0,0 +1,73 @@
+import json
+import os
+import platform
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.suite import baseline, is_regression, main
+from benchmarks.synthetic import (
+    PART_NAMES,
+    make_general_report,
+    make_production_workbooks,
+    workbook_bytes,
+)
+from ingest import FINAL_COLUMNS, load_club_report, load_production_workbook
+
+
+def test_generated_reports_parse_in_both_formats():
+    new = load_club_report(workbook_bytes(make_general_report(200)))
+    old = load_club_report(workbook_bytes(make_general_report(200, old_format=True)))
+
+    for df in (new, old):
+        assert list(df.columns) == FINAL_COLUMNS
+        assert len(df) == 200
+        assert df["Order Placed Date"].notna().all()
+        assert df["Local Marketing Order Ref"].isna().any()
+        assert set(df["Part"]) <= set(PART_NAMES) | {"Unknown part OT"}
+    assert new["Total"].sum() == old["Total"].sum()
+
+
+def test_generated_production_workbooks_load():
+    print_bytes, cp_bytes = make_production_workbooks(80)
+    df_print = load_production_workbook(print_bytes)
+    df_cp = load_production_workbook(cp_bytes)
+    assert len(df_print) == 80
+    assert "Collate And Pack Cost Price" in df_cp.columns
+    assert df_print["Project Ref"].isin(df_cp["Project Ref"]).any()
+
+
+def test_suite_records_history(tmp_path):
+    history = tmp_path / "history.jsonl"
+    args = ["--sizes", "50", "--history", str(history), "--data-dir", str(tmp_path / "data")]
+    assert main(args) == 0
+    assert main(args + ["--max-xlsx-rows", "10"]) == 0
+
+    records = [json.loads(line) for line in history.read_text().splitlines()]
+    runs = pd.DataFrame(records).groupby("stage").size()
+    assert runs["write xlsx"] == 1
+    assert runs["club transform"] == 2
+    assert {"read club (old)", "parse club (new)", "write parquet"} <= set(runs.index)
+
+
+def test_slower_run_is_flagged(tmp_path):
+    history = [
+        {"host": "a", "rows": 10, "stage": "club transform", "seconds": s}
+        for s in (9.0, 1.0, 1.1, 0.9)
+    ]
+    assert baseline(history, "a", 10, "club transform", window=3) == 1.0
+    assert baseline(history, "b", 10, "club transform") is None
+    assert is_regression(1.5, 1.0, threshold=0.2, min_seconds=0.05)
+    assert not is_regression(1.1, 1.0, threshold=0.2, min_seconds=0.05)
+    assert not is_regression(0.002, 0.001, threshold=0.2, min_seconds=0.05)
+
+    path = tmp_path / "history.jsonl"
+    with path.open("w") as f:
+        for stage in ("club transform", "write csv"):
+            record = {"host": platform.node(), "rows": 50, "stage": stage, "seconds": 0}
+            f.write(json.dumps(record) + "\n")
+    args = ["--sizes", "50", "--history", str(path), "--min-seconds", "0", "--no-record"]
+    assert main(args) == 0
+    assert main(args + ["--fail-on-regression"]) == 1
+    assert len(path.read_text().splitlines()) == 2
@@ -0,0 +1,25 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# Each benchmark the README documents, at a size small enough to run with the tests
+@pytest.mark.parametrize(
+    "name, argv",
+    [
+        ("bench_club_transform", ["--sizes", "200"]),
+        ("bench_production_transform", ["--sizes", "200"]),
+        ("bench_xlsx_reader", ["--sizes", "100"]),
+        ("bench_xlsx_writer", ["--sizes", "100"]),
+        ("bench_output_formats", ["--sizes", "100"]),
+        ("bench_part_matching", ["--catalogue", "40", "--lines", "200"]),
+        ("bench_parts_catalogue", ["--repeat", "1", "--lookups", "100"]),
+    ],
+)
+def test_documented_benchmark_runs(name, argv, capsys):
+    importlib.import_module(f"benchmarks.{name}").main(argv)
+    assert capsys.readouterr().out
@@ -0,0 +1,71 @@
+import io
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import (
+    OUTPUT_COLUMNS,
+    iter_combined_chunks,
+    transform_club_orders,
+    transform_production,
+)
+from parts_catalogue import get_catalogue
+from xlsx_writer import SHEET_NAME, CombinedSheetWriter
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+
+def _in_memory(club_frames, df_print, df_cp):
+    club_df = pd.concat(club_frames, ignore_index=True)
+    club_out = transform_club_orders(club_df, get_catalogue())
+    prod_out = transform_production(df_print, df_cp, 1 + len(club_df))
+    return pd.concat([club_out, prod_out], ignore_index=True)
+
+
+def _workbook(chunks) -> pd.DataFrame:
+    buffer = io.BytesIO()
+    with CombinedSheetWriter(buffer, OUTPUT_COLUMNS) as writer:
+        for chunk in chunks:
+            writer.append(chunk)
+    return pd.read_excel(io.BytesIO(buffer.getvalue()), sheet_name=SHEET_NAME)
+
+
+def test_chunks_match_in_memory_output():
+    club_frames = [make_club_df(250, seed=1), make_club_df(130, seed=2)]
+    df_print, df_cp = make_production_pair(200, seed=3)
+
+    expected = _in_memory(club_frames, df_print, df_cp)
+    chunks = list(
+        iter_combined_chunks(club_frames, df_print, df_cp, get_catalogue(), chunk_rows=64)
+    )
+
+    assert max(len(c) for c in chunks[:-1]) <= 3 * 64
+    combined = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(combined, expected, check_dtype=False)
+    assert combined["index no"].is_monotonic_increasing
+
+    pd.testing.assert_frame_equal(_workbook(chunks), _workbook([expected]))
+
+
+def test_rows_past_the_sheet_limit_continue_on_further_sheets():
+    club_frames = [make_club_df(40, seed=4)]
+    df_print, df_cp = make_production_pair(10, seed=5)
+    chunks = list(
+        iter_combined_chunks(club_frames, df_print, df_cp, get_catalogue(), chunk_rows=16)
+    )
+    expected = pd.concat(chunks, ignore_index=True)
+
+    buffer = io.BytesIO()
+    with CombinedSheetWriter(buffer, OUTPUT_COLUMNS, max_rows=50) as writer:
+        for chunk in chunks:
+            writer.append(chunk)
+    assert writer.rows_written == len(expected)
+
+    sheets = pd.read_excel(io.BytesIO(buffer.getvalue()), sheet_name=None)
+    names = [SHEET_NAME] + [f"{SHEET_NAME} ({n})" for n in range(2, len(sheets) + 1)]
+    assert list(sheets) == names and len(sheets) == -(-len(expected) // 50)
+    assert all(len(sheet) == 50 for sheet in list(sheets.values())[:-1])
+    pd.testing.assert_frame_equal(
+        pd.concat(sheets.values(), ignore_index=True), _workbook([expected]), check_dtype=False
+    )
@@ -0,0 +1,96 @@
+import io
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, main, run_merge
+from ingest import Upload
+from xlsx_writer import SHEET_NAME
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+
+def _write_inputs(tmp_path):
+    for i, seed in enumerate((1, 2)):
+        make_club_df(120, seed=seed).to_excel(tmp_path / f"club_{i}.xlsx", index=False)
+    (tmp_path / "club_9.xlsx").write_bytes(b"not a workbook")
+    df_print, df_cp = make_production_pair(80, seed=3)
+    df_print.to_excel(tmp_path / "print.xlsx", index=False, startrow=1)
+    df_cp.to_excel(tmp_path / "cp.xlsx", index=False, startrow=1)
+
+
+def test_cli_merges_globbed_club_files(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    output = tmp_path / "out.xlsx"
+    argv = [
+        "--club", str(tmp_path / "club_*.xlsx"),
+        "--production", str(tmp_path / "cp.xlsx"), str(tmp_path / "print.xlsx"),
+        "-o", str(output),
+        "--workers", "1",
+    ]
+    assert main(argv) == 0
+    assert "Could not read club_9.xlsx" in capsys.readouterr().err
+
+    out = pd.read_excel(output, sheet_name=SHEET_NAME)
+    assert list(out.columns) == OUTPUT_COLUMNS
+    assert (out["Order type"] == "Club").sum() == 3 * 240
+
+    assert main(argv + ["--strict"]) == 2
+
+
+def test_low_memory_run_writes_same_sheet(tmp_path):
+    _write_inputs(tmp_path)
+    clubs = [Upload(p.name, p.read_bytes()) for p in sorted(tmp_path.glob("club_[01].xlsx"))]
+    production = [Upload(p.name, p.read_bytes()) for p in (tmp_path / "print.xlsx", tmp_path / "cp.xlsx")]
+
+    sheets = []
+    for low_memory in (False, True):
+        buffer = io.BytesIO()
+        report = run_merge(clubs, production, buffer, low_memory=low_memory, chunk_rows=50, max_workers=1)
+        assert report.rows > 0 and not report.failures
+        sheets.append(pd.read_excel(io.BytesIO(buffer.getvalue()), sheet_name=SHEET_NAME))
+    pd.testing.assert_frame_equal(sheets[0], sheets[1])
+
+
+def test_no_readable_club_file_is_an_error_in_both_modes(tmp_path):
+    _write_inputs(tmp_path)
+    clubs = [Upload("club_9.xlsx", (tmp_path / "club_9.xlsx").read_bytes())]
+    production = [Upload(p.name, p.read_bytes()) for p in (tmp_path / "print.xlsx", tmp_path / "cp.xlsx")]
+    for low_memory in (False, True):
+        output = tmp_path / f"out_{low_memory}.xlsx"
+        with pytest.raises(ValueError, match="None of the club order files could be read"):
+            run_merge(clubs, production, str(output), low_memory=low_memory, max_workers=1)
+        assert not output.exists()
+
+
+def test_missing_production_file_is_an_error(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    argv = [
+        "--club", str(tmp_path / "club_0.xlsx"),
+        "--production", str(tmp_path / "print.xlsx"), str(tmp_path / "missing.xlsx"),
+        "-o", str(tmp_path / "out.xlsx"),
+    ]
+    assert main(argv) == 1
+    assert "error:" in capsys.readouterr().err
+
+
+def test_cli_takes_several_production_pairs(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    df_print, df_cp = make_production_pair(40, seed=4)
+    df_print.to_excel(tmp_path / "print_2.xlsx", index=False, startrow=1)
+    pd.concat([df_cp, df_cp.head(1)]).to_excel(tmp_path / "cp_2.xlsx", index=False, startrow=1)
+    argv = [
+        "--club", str(tmp_path / "club_0.xlsx"),
+        "--production", str(tmp_path / "print*.xlsx"), str(tmp_path / "cp*.xlsx"),
+        "-o", str(tmp_path / "out.xlsx"),
+        "--workers", "1",
+    ]
+    assert main(argv) == 0
+    err = capsys.readouterr().err
+    assert "Production Project Refs to check" in err
+    assert df_cp["Project Ref"].iloc[0] in err
+
+    out = pd.read_excel(tmp_path / "out.xlsx", sheet_name=SHEET_NAME)
+    assert (out["Order type"] == "Camp / Misc").sum() > 80
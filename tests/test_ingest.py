@@ -0,0 +1,76 @@
+import io
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ingest import FINAL_COLUMNS, POOL_CONTEXT, Upload, ingest_uploads, iter_ingest, load_club_report
+from upload_cache import UploadCache
+from test_parse_general_report import NEW_CSV, OLD_CSV
+
+
+def _club_xlsx(csv_text: str) -> bytes:
+    buffer = io.BytesIO()
+    pd.read_csv(io.StringIO(csv_text)).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _production_xlsx(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, startrow=1)
+    return buffer.getvalue()
+
+
+def test_parallel_results_keep_input_order_and_isolate_errors():
+    old, new = _club_xlsx(OLD_CSV), _club_xlsx(NEW_CSV)
+    jobs = [
+        ("club", Upload("new.xlsx", new)),
+        ("club", Upload("broken.xlsx", b"not a workbook")),
+        ("club", Upload("old.xlsx", old)),
+        ("production", Upload("cp.xlsx", _production_xlsx(
+            pd.DataFrame({" Project Ref ": ["P1"], "Collate And Pack Cost Price": [1.5]})
+        ))),
+    ]
+    results = ingest_uploads(jobs, max_workers=2)
+    # Workers are never forked from the (threaded) merging process
+    assert POOL_CONTEXT.get_start_method() != "fork"
+
+    assert [r.name for r in results] == ["new.xlsx", "broken.xlsx", "old.xlsx", "cp.xlsx"]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert results[1].frame is None and results[1].error
+    pd.testing.assert_frame_equal(results[0].frame, load_club_report(new))
+    pd.testing.assert_frame_equal(results[2].frame, load_club_report(old))
+    assert list(results[0].frame.columns) == FINAL_COLUMNS
+    assert list(results[3].frame.columns) == ["Project Ref", "Collate And Pack Cost Price"]
+
+
+def test_cached_files_are_not_reparsed():
+    cache = UploadCache()
+    jobs = [("club", Upload("new.xlsx", _club_xlsx(NEW_CSV)))]
+    first = ingest_uploads(jobs, cache=cache)[0]
+    second = ingest_uploads(jobs, cache=cache)[0]
+    assert not first.cached and second.cached
+    assert second.frame is first.frame
+
+
+def test_path_uploads_are_read_as_they_are_parsed(tmp_path):
+    data = _club_xlsx(NEW_CSV)
+    for i in range(5):
+        (tmp_path / f"club_{i}.xlsx").write_bytes(data)
+    taken = []
+
+    def jobs():
+        for path in sorted(tmp_path.glob("club_*.xlsx")):
+            taken.append(path.name)
+            yield "club", Upload.from_path(str(path))
+
+    for max_workers in (1, 2):
+        taken.clear()
+        results = iter_ingest(jobs(), max_workers=max_workers)
+        first = next(results)
+        # Only the files parsed ahead of the consumer have been taken
+        assert len(taken) == max_workers
+        assert first.name == "club_0.xlsx" and first.frame.equals(load_club_report(data))
+        assert [r.name for r in results] == [f"club_{i}.xlsx" for i in range(1, 5)]
+    assert Upload.from_path(str(tmp_path / "club_0.xlsx")).data is None
@@ -0,0 +1,142 @@
+import gc
+import os
+import sys
+import tempfile
+import threading
+import weakref
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import run_merge
+from ingest import Upload
+from merge_jobs import CANCELLED, DONE, FAILED, QUEUED, JobRunner
+from output_spool import OutputSpool
+from run_profile import RunProfile
+from test_era_engine import _write_inputs
+
+
+def _uploads(tmp_path):
+    _write_inputs(tmp_path)
+    clubs = [Upload(p.name, p.read_bytes()) for p in sorted(tmp_path.glob("club_*.xlsx"))]
+    production = [Upload(p.name, p.read_bytes()) for p in (tmp_path / "print.xlsx", tmp_path / "cp.xlsx")]
+    return clubs, production
+
+
+def _merge(clubs, production, spool, before_stage=None, **options):
+    def run(job):
+        def on_stage(name):
+            if before_stage is not None:
+                before_stage(name)
+            job.enter_stage(name)
+
+        return run_merge(
+            clubs, production, spool.file, max_workers=1,
+            profile=RunProfile(on_stage=on_stage), on_file=job.file_read, **options
+        )
+
+    return run
+
+
+def test_job_runs_merge_and_reports_progress(tmp_path):
+    clubs, production = _uploads(tmp_path)
+    runner = JobRunner(max_workers=1)
+    spool = OutputSpool()
+    target = _merge(clubs, production, spool)
+    job = runner.submit(target, files_total=len(clubs) + 2, outputs={"xlsx": spool})
+    # The finished job lets go of the merge and the uploads it holds
+    target = weakref.ref(target)
+    assert job.wait(60)
+    gc.collect()
+    assert target() is None
+
+    assert job.status == DONE and job.error is None
+    assert job.result.rows > 0 and len(job.result.failures) == 1
+    assert job.files_done == job.files_total == 5 and job.fraction == 1.0
+    assert {"production files", "club transform", "write xlsx"} <= set(job.stages)
+    assert runner.get(job.id) is job
+    assert spool.getvalue()[:2] == b"PK"
+
+    runner.discard(job.id)
+    assert runner.get(job.id) is None
+    assert spool.file.closed
+    runner.shutdown()
+
+
+def test_cancel_stops_running_and_queued_jobs(tmp_path):
+    clubs, production = _uploads(tmp_path)
+    runner = JobRunner(max_workers=1)
+    transforming, release = threading.Event(), threading.Event()
+
+    def hold(name):
+        if name == "club transform":
+            transforming.set()
+            release.wait(10)
+
+    running = runner.submit(_merge(clubs, production, OutputSpool(), hold), files_total=5)
+    target = _merge(clubs, production, OutputSpool())
+    queued = runner.submit(target)
+    target = weakref.ref(target)
+    assert transforming.wait(30)
+    assert queued.status == QUEUED
+
+    assert queued.cancel() and queued.status == CANCELLED
+    gc.collect()
+    assert target() is None
+    assert running.cancel()
+    release.set()
+    assert running.wait(60)
+    assert running.status == CANCELLED
+    assert "write xlsx" not in running.stages
+    assert not running.cancel()
+    runner.shutdown()
+
+
+def test_cancelled_low_memory_job_leaves_no_temporary_files(tmp_path, monkeypatch):
+    clubs, production = _uploads(tmp_path)
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    runner = JobRunner(max_workers=1)
+    transforms, submitted = [], threading.Event()
+
+    def cancel_on_second_transform(name):
+        if name == "club transform":
+            transforms.append(name)
+            if len(transforms) == 2:
+                submitted.wait(10)
+                job.cancel()
+
+    spool = OutputSpool()
+    job = runner.submit(
+        _merge(clubs, production, spool, cancel_on_second_transform, low_memory=True, chunk_rows=50),
+        outputs={"xlsx": spool},
+    )
+    submitted.set()
+    assert job.wait(60)
+    assert job.status == CANCELLED
+    runner.discard(job.id)
+    assert list(temp_dir.iterdir()) == []
+    runner.shutdown()
+
+
+def test_failed_job_keeps_its_error():
+    runner = JobRunner(max_workers=1)
+
+    def fail(job):
+        job.enter_stage("production files")
+        raise ValueError("Every production file must be readable")
+
+    job = runner.submit(fail)
+    assert job.wait(60)
+    assert job.status == FAILED
+    assert job.error == "Every production file must be readable"
+    runner.shutdown()
+
+
+def test_finished_jobs_are_pruned(tmp_path):
+    runner = JobRunner(max_workers=1, keep_seconds=0)
+    spool = OutputSpool()
+    old = runner.submit(lambda job: None, outputs={"xlsx": spool})
+    assert old.wait(60)
+    assert runner.get(old.id) is None
+    assert spool.file.closed
+    runner.shutdown()
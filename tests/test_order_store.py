@@ -0,0 +1,115 @@
+import os
+import sys
+import warnings
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, build_combined, main
+from ingest import BASE_COLUMNS, parse_general_report
+from order_store import OrderStore
+from parts_catalogue import get_catalogue
+from benchmarks.synthetic import make_club_df, make_production_pair
+from test_parse_general_report import NEW_CSV, OLD_CSV, _read_raw
+
+
+def _assert_same_lines(stored, expected):
+    # Costs come back as floats and empty columns as text, whatever they were
+    # parsed as, and categoricals hold the categories of every stored line
+    assert_frame_equal(
+        stored, _placement_order(expected), check_dtype=False, check_categorical=False
+    )
+
+
+def _placement_order(df):
+    return df.sort_values(
+        ["Order Placed Date", "Order Line Reference", "Workflow Reference Number"],
+        kind="stable",
+    ).reset_index(drop=True)
+
+
+def test_round_trip_keeps_parsed_types():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        parsed = [parse_general_report(_read_raw(csv)) for csv in (NEW_CSV, OLD_CSV)]
+
+    with OrderStore(":memory:") as store:
+        for df in parsed:
+            store.upsert(df)
+        for df in parsed:
+            stored = store.orders().merge(df[["Order Line Reference"]])
+            _assert_same_lines(_placement_order(stored), df)
+            base = len(BASE_COLUMNS)
+            # Categoricals hold the categories of every stored line
+            assert (stored.dtypes.iloc[:base].map(str) == df.dtypes.iloc[:base].map(str)).all()
+
+
+def test_overlapping_exports_are_deduplicated():
+    week1 = make_club_df(200, seed=1)
+    week2 = pd.concat([week1.iloc[150:], make_club_df(100, seed=2)], ignore_index=True)
+    week2.loc[0, "Total"] = 123.0
+
+    with OrderStore(":memory:") as store:
+        store.upsert(week1)
+        store.upsert(week2)
+        assert len(store) == 300
+
+        stored = store.orders()
+        # The later copy of a line replaces the earlier one
+        expected = pd.concat([week1.iloc[:150], week2], ignore_index=True)
+        _assert_same_lines(stored, expected)
+
+
+def test_lines_without_references_are_kept_unless_identical():
+    df = make_club_df(3, seed=4)
+    df["Order Line Reference"] = pd.NA
+    df["Workflow Reference Number"] = pd.NA
+    with OrderStore(":memory:") as store:
+        store.upsert(df)
+        store.upsert(df)
+        assert len(store) == 3
+
+
+def test_orders_in_date_range():
+    df = make_club_df(500, seed=5)
+    with OrderStore(":memory:") as store:
+        store.upsert(df)
+        june = store.orders(since="2025-06-01", until="2025-06-30")
+        placed = df["Order Placed Date"]
+        expected = df[(placed >= "2025-06-01") & (placed < "2025-07-01")]
+        _assert_same_lines(june, expected)
+
+        chunks = list(store.iter_orders(since="2025-06-01", until="2025-06-30", chunk_rows=64))
+        assert max(len(c) for c in chunks) == 64
+        # Chunks categorise their own values, so they concatenate to plain text
+        assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), june, check_dtype=False, check_categorical=False
+        )
+
+
+def test_cli_merges_from_store(tmp_path, capsys):
+    club = make_club_df(120, seed=1)
+    club.to_excel(tmp_path / "week1.xlsx", index=False)
+    club.iloc[60:].to_excel(tmp_path / "week2.xlsx", index=False)
+    df_print, df_cp = make_production_pair(30, seed=3)
+    df_print.to_excel(tmp_path / "print.xlsx", index=False, startrow=1)
+    df_cp.to_excel(tmp_path / "cp.xlsx", index=False, startrow=1)
+
+    common = [
+        "--production", str(tmp_path / "print.xlsx"), str(tmp_path / "cp.xlsx"),
+        "--store", str(tmp_path / "orders.sqlite"),
+        "--workers", "1",
+    ]
+    argv = ["--club", str(tmp_path / "week*.xlsx"), "-o", str(tmp_path / "a.xlsx")] + common
+    assert main(argv) == 0
+    # Later runs can merge straight from the store
+    argv = ["-o", str(tmp_path / "b.xlsx"), "--since", "2025-06-01"] + common
+    assert main(argv) == 0
+    capsys.readouterr()
+
+    sheet = pd.read_excel(tmp_path / "b.xlsx")
+    assert_frame_equal(sheet, pd.read_excel(tmp_path / "a.xlsx"))
+    expected = build_combined([_placement_order(club)], df_print, df_cp, get_catalogue())
+    assert list(sheet.columns) == OUTPUT_COLUMNS
+    assert len(sheet) == len(expected)
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, build_combined
+from output_frame import compact_output, concat_output, expand_output, output_frame, text_column
+from parts_catalogue import get_catalogue
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+
+def _final_df(n=3000):
+    df_print, df_cp = make_production_pair(n // 10, seed=2)
+    return build_combined([make_club_df(n, seed=1)], df_print, df_cp, get_catalogue())
+
+
+def test_combined_output_is_compact():
+    final_df = _final_df()
+    for col in ["Matrix", "Order type", "Product", "Size", "Pagination", "Comment", "Credit"]:
+        assert isinstance(final_df[col].dtype, pd.CategoricalDtype), col
+    for col in ["Quantity", "Print Sell", "Sell", "Number of clubs"]:
+        assert final_df[col].dtype == np.float64, col
+
+    plain = expand_output(final_df).astype(object)
+    assert final_df.memory_usage(deep=True).sum() < plain.memory_usage(deep=True).sum() / 3
+
+
+def test_text_in_number_columns_survives_expansion():
+    df = output_frame(
+        {"index no": [1, 2, 3], "Product": "C&P", "Print Sell": [1.5, "NOT FOUND", ""]}, 3
+    )
+    assert list(df.columns) == ["index no", "Product", "Print Sell", text_column("Print Sell")]
+    assert df["Print Sell"].isna().tolist() == [False, True, True]
+
+    plain = expand_output(df)
+    assert list(plain.columns) == ["index no", "Product", "Print Sell"]
+    assert plain["Print Sell"].tolist()[:2] == [1.5, "NOT FOUND"]
+    assert pd.isna(plain["Print Sell"].iloc[2])
+    assert plain["Product"].tolist() == ["C&P"] * 3
+
+
+def test_concat_keeps_categories_and_text_columns():
+    club = output_frame({"Pagination": [4, 8], "Print Sell": [1.0, 2.0]}, 2)
+    production = output_frame({"Pagination": ["", "2pp"], "Print Sell": ["TBC", 3.0]}, 2)
+    combined = concat_output([club, production])
+
+    assert isinstance(combined["Pagination"].dtype, pd.CategoricalDtype)
+    plain = expand_output(combined)
+    assert plain["Pagination"].tolist() == [4, 8, "", "2pp"]
+    assert plain["Print Sell"].tolist() == [1.0, 2.0, "TBC", 3.0]
+
+
+def test_plain_frames_are_compacted():
+    # Output saved by earlier versions holds plain values
+    plain = expand_output(_final_df(300))
+    compact = compact_output(plain.astype(object))
+    pd.testing.assert_frame_equal(expand_output(compact), plain, check_dtype=False)
+    assert compact_output(compact) is compact
+    both = concat_output([plain, compact])
+    assert len(both) == 2 * len(plain)
+    assert list(expand_output(both).columns) == OUTPUT_COLUMNS
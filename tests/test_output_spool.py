@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, run_merge
+from ingest import Upload
+from output_spool import OutputSpool
+from xlsx_writer import SHEET_NAME
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+
+def _xlsx_bytes(df, **kwargs):
+    spool = OutputSpool()
+    df.to_excel(spool.file, index=False, **kwargs)
+    return spool.getvalue()
+
+
+def test_small_output_stays_in_memory():
+    with OutputSpool(max_memory=1024) as spool:
+        spool.file.write(b"x" * 100)
+        assert not spool.on_disk
+        assert spool.size == 100
+        assert spool.getvalue() == b"x" * 100
+
+
+def test_large_output_rolls_over_to_disk(tmp_path):
+    with OutputSpool(max_memory=1024, dir=str(tmp_path)) as spool:
+        spool.file.write(b"x" * 4096)
+        assert spool.on_disk
+        # Repeated reads start from the beginning and leave the contents intact
+        assert spool.getvalue() == b"x" * 4096
+        assert spool.getvalue() == b"x" * 4096
+        assert spool.size == 4096
+
+
+def test_run_merge_into_spool(tmp_path):
+    df_print, df_cp = make_production_pair(40, seed=3)
+    clubs = [Upload("club.xlsx", _xlsx_bytes(make_club_df(60, seed=1)))]
+    production = [
+        Upload("print.xlsx", _xlsx_bytes(df_print, startrow=1)),
+        Upload("cp.xlsx", _xlsx_bytes(df_cp, startrow=1)),
+    ]
+
+    with OutputSpool(max_memory=1024, dir=str(tmp_path)) as spool:
+        report = run_merge(clubs, production, spool.file, max_workers=1)
+        assert spool.on_disk
+
+        path = tmp_path / "out.xlsx"
+        path.write_bytes(spool.getvalue())
+    result = pd.read_excel(path, sheet_name=SHEET_NAME)
+    assert list(result.columns) == OUTPUT_COLUMNS
+    assert len(result) == report.rows
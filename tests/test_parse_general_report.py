@@ -32,7 +32,8 @@ def test_old_format_parsing():
     assert list(df.columns) == FINAL_COLUMNS
     assert (df["Total"] > 0).any()
     assert df["Print"].sum() == 0
-    assert df["Quantity"].dtype == int
+    assert df["Quantity"].dtype == "int32"
+    assert df["Part"].dtype == "category"
 
 
 def test_new_format_parsing():
@@ -41,4 +42,31 @@ def test_new_format_parsing():
     assert list(df.columns) == FINAL_COLUMNS
     assert (df["Total"] > 0).any()
     assert df["Print"].sum() > 0
-    assert df["Quantity"].dtype == int
+    assert df["Quantity"].dtype == "int32"
+    assert df["Part"].dtype == "category"
+
+
+def test_compact_dtypes():
+    df = parse_general_report(_read_raw(NEW_CSV))
+    for col in ["Order Owner", "Order Status", "Part", "Location"]:
+        assert df[col].dtype == "category"
+    assert df["Total"].dtype == float
+    assert df["Print"].tolist() == [0, 23.01, 4.91, 4.91, 0]
+
+
+def test_dates_in_mixed_formats():
+    # ISO dates with a day past the 12th must not be read day-first
+    raw = _read_raw(NEW_CSV)
+    raw.loc[3, 4] = "28/06/2025 09:15"
+    raw.loc[4, 4] = "28/06/2025"
+    raw.loc[5, 4] = "not a date"
+    df = parse_general_report(raw)
+    assert df["Date Approved"].tolist() == [pd.Timestamp("2025-06-30 14:11:57")] * 2 + [
+        pd.Timestamp("2025-06-30 14:21:08")
+    ] * 2 + [pd.Timestamp("2025-06-30 14:13:56")]
+    assert df["Order Placed Date"].tolist()[1:4] == [
+        pd.Timestamp("2025-06-27 14:44:50"),
+        pd.Timestamp("2025-06-28 09:15"),
+        pd.Timestamp("2025-06-28"),
+    ]
+    assert df["Order Placed Date"].isna().tolist() == [False] * 4 + [True]
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import remerge_combined, transform_club_orders
+from part_index import PartIndex, PartMatchLog, normalise_part_name
+from parts_catalogue import get_catalogue, part_index
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+NAMES = ["A3 Strut Card ", "40x30 Poster", "40x30 Poster OT", "30x40 Poster OT", "A5 2pp Leaflet"]
+
+
+def test_names_resolve_exact_normalised_then_fuzzy():
+    index = PartIndex(NAMES)
+    assert normalise_part_name("  40 X 30   Poster ") == "40x30 poster"
+
+    assert index.match("40x30 Poster").how == "exact"
+    assert index.match("a3 strut  card").part == "A3 Strut Card "
+    assert index.match("40 x 30 poster ot").part == "40x30 Poster OT"
+    fuzzy = index.match("A5 2pp Leafet")
+    assert (fuzzy.part, fuzzy.how) == ("A5 2pp Leaflet", "fuzzy")
+    # Close, but another size
+    assert index.match("60x40 Poster OT").part is None
+    assert index.match("Unknown part OT").how is None
+    assert index.match("A5 2pp Leafet") is fuzzy
+
+
+def test_transform_fills_attributes_of_near_misses():
+    catalogue = get_catalogue()
+    name = next(n for n in catalogue if n.endswith(" ") and "x" not in n.lower())
+    club_df = make_club_df(6, seed=1)
+    club_df["Part"] = [name, name.strip().upper(), name, "Unknown part OT", None, name]
+
+    log = PartMatchLog()
+    out = transform_club_orders(club_df, catalogue, matches=log)
+    part_rows = out.iloc[::3].reset_index(drop=True)
+    size = catalogue[name]["Size"]
+    assert part_rows["Size"].astype(object).tolist() == [size, size, size, "", "", size]
+    assert part_rows["Product"].iloc[1] == name.strip().upper()
+
+    summary = log.summary()
+    assert summary["Part"].tolist() == ["Unknown part OT", name.strip().upper()]
+    assert summary["Match"].tolist() == ["unmatched", "normalised"]
+    assert summary["Lines"].tolist() == [1, 1]
+
+
+def test_index_is_kept_with_the_catalogue():
+    catalogue = get_catalogue()
+    assert part_index(catalogue) is part_index(catalogue)
+    assert part_index(dict(catalogue)).names == part_index(catalogue).names
+
+
+def test_remerge_reports_reused_lines_too():
+    club_df = make_club_df(1000, seed=4)
+    df_print, df_cp = make_production_pair(10, seed=5)
+    catalogue = get_catalogue()
+    _, state, _ = remerge_combined([club_df], df_print, df_cp, catalogue)
+
+    log = PartMatchLog()
+    _, _, stats = remerge_combined([club_df], df_print, df_cp, catalogue, state, matches=log)
+    assert stats.club_rebuilt == 0
+    unknown = int(np.sum(club_df["Part"].astype(object) == "Unknown part OT"))
+    assert unknown
+    summary = log.summary()
+    assert summary.loc[summary["Part"] == "Unknown part OT", "Lines"].tolist() == [unknown]
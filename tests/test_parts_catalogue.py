@@ -0,0 +1,80 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import build_parts_lookup, transform_club_orders
+from generate_parts_data import describe, refresh_catalogue
+from parts_catalogue import PartsCatalogue, diff_catalogues, get_catalogue
+from parts_data import PARTS_DATA_RAW
+from benchmarks.synthetic import make_club_df
+
+
+def test_lookup_matches_raw_dict():
+    catalogue = get_catalogue()
+    assert dict(catalogue) == build_parts_lookup(PARTS_DATA_RAW)
+    assert get_catalogue() is catalogue
+
+
+def test_by_urn_accepts_int_and_str():
+    catalogue = get_catalogue()
+    urn, record = next(iter(PARTS_DATA_RAW.items()))
+    assert catalogue.by_urn(urn) == record
+    assert catalogue.by_urn(int(urn)) == record
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / "catalogue.json"
+    PartsCatalogue.from_raw(PARTS_DATA_RAW).save(path)
+    assert PartsCatalogue.load(path).raw == PARTS_DATA_RAW
+
+
+def test_transform_accepts_catalogue():
+    club_df = make_club_df(500, seed=1)
+    expected = transform_club_orders(club_df, build_parts_lookup(PARTS_DATA_RAW))
+    pd.testing.assert_frame_equal(transform_club_orders(club_df, get_catalogue()), expected)
+
+
+def test_diff_reports_added_removed_and_changed_parts():
+    old = get_catalogue().to_frame().reset_index(drop=True)
+    new = old.iloc[1:].copy()
+    new.loc[new.index[0], "Materials"] = "Gloss"
+    new = pd.concat([new, old.iloc[[0]].assign(**{"Part URN": 999999})], ignore_index=True)
+
+    diff = diff_catalogues(PartsCatalogue.from_frame(old), PartsCatalogue.from_frame(new))
+    assert diff.added == [999999]
+    assert diff.removed == [int(old["Part URN"].iloc[0])]
+    assert diff.changed == {int(new["Part URN"].iloc[0]): ["Materials"]}
+    assert not diff_catalogues(get_catalogue(), get_catalogue())
+
+
+def test_diff_ignores_blank_and_number_representations():
+    old = get_catalogue().to_frame().reset_index(drop=True).head(3)
+    old["No. of Pages"] = [4, 8, 2]
+    # As read_excel gives the export back once a column gains a blank:
+    # whole numbers as floats, blanks as NaN
+    new = old.copy()
+    new["No. of Pages"] = [4.0, 8.0, np.nan]
+    new["Part Short Name"] = np.nan
+
+    diff = diff_catalogues(PartsCatalogue.from_frame(old), PartsCatalogue.from_frame(new))
+    assert diff.changed == {int(old["Part URN"].iloc[2]): ["No. of Pages"]}
+
+
+def test_refresh_skips_unchanged_export(tmp_path):
+    source, path = tmp_path / "Parts Export.xlsx", tmp_path / "catalogue.json"
+    export = get_catalogue().to_frame().reset_index(drop=True).head(20)
+    export.to_excel(source, index=False)
+
+    first = refresh_catalogue(source, path)
+    assert not first.skipped and len(first.diff.added) == 20
+    assert refresh_catalogue(source, path).skipped
+
+    export.iloc[:19].to_excel(source, index=False)
+    refresh = refresh_catalogue(source, path)
+    assert refresh.diff.removed == [int(export["Part URN"].iloc[19])]
+    assert not refresh.diff.changed
+    assert "1 removed" in describe(refresh)
+    assert PartsCatalogue.load(path).n_records == 19
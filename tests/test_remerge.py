@@ -0,0 +1,151 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import build_combined, main, remerge_combined
+from merge_state import MergeState, dataset_state_path
+from parts_catalogue import get_catalogue
+from benchmarks.synthetic import make_club_df, make_production_pair
+from test_era_engine import _write_inputs
+
+
+def _inputs():
+    club_frames = [make_club_df(60, seed=1), make_club_df(40, seed=2)]
+    df_print, df_cp = make_production_pair(50, seed=3)
+    return club_frames, df_print, df_cp
+
+
+def _assert_same_rows(result, expected):
+    assert_frame_equal(
+        result.astype(object).reset_index(drop=True),
+        expected.astype(object).reset_index(drop=True),
+    )
+
+
+def test_first_run_matches_full_merge():
+    club_frames, df_print, df_cp = _inputs()
+    parts = get_catalogue()
+    final_df, state, stats = remerge_combined(club_frames, df_print, df_cp, parts)
+
+    assert_frame_equal(final_df, build_combined(club_frames, df_print, df_cp, parts))
+    assert stats.club_reused == stats.projects_reused == 0
+    assert stats.club_rebuilt == 100
+
+
+def test_unchanged_inputs_reuse_everything(tmp_path):
+    club_frames, df_print, df_cp = _inputs()
+    parts = get_catalogue()
+    first, state, _ = remerge_combined(club_frames, df_print, df_cp, parts)
+    path = str(tmp_path / "state.pkl")
+    state.save(path)
+
+    again, _, stats = remerge_combined(club_frames, df_print, df_cp, parts, MergeState.load(path))
+    _assert_same_rows(again, first)
+    assert stats.club_rebuilt == stats.projects_rebuilt == 0
+
+
+def test_only_changed_blocks_are_rebuilt():
+    club_frames, df_print, df_cp = _inputs()
+    parts = get_catalogue()
+    _, state, _ = remerge_combined(club_frames, df_print, df_cp, parts)
+
+    club_frames[1] = club_frames[1].copy()
+    club_frames[1].loc[5, "Total"] = 999.0
+    df_print = df_print.copy()
+    ref = df_print["Project Ref"].iloc[0]
+    df_print.loc[df_print["Project Ref"] == ref, "Production Sell Price"] = 1.0
+
+    final_df, _, stats = remerge_combined(club_frames, df_print, df_cp, parts, state)
+    assert (stats.club_rebuilt, stats.projects_rebuilt) == (1, 1)
+    # Nothing was added or removed, so the numbering matches a fresh run
+    _assert_same_rows(final_df, build_combined(club_frames, df_print, df_cp, parts))
+
+
+def test_index_no_is_stable_when_lines_are_removed_and_added():
+    club_frames, df_print, df_cp = _inputs()
+    parts = get_catalogue()
+    first, state, _ = remerge_combined(club_frames, df_print, df_cp, parts)
+
+    new_club = make_club_df(5, seed=9)
+    df_cp = df_cp[df_cp["Project Ref"] != df_cp["Project Ref"].iloc[0]]
+    final_df, new_state, stats = remerge_combined(
+        [club_frames[1], new_club], df_print, df_cp, parts, state
+    )
+    assert stats.club_reused == 40 and stats.club_rebuilt == 5
+    assert stats.projects_rebuilt == 1
+
+    # Lines kept from the second file keep their numbers
+    kept = first[first["Project Ref"].isin(club_frames[1]["Local Marketing Order Ref"])]
+    kept = kept[kept["Order type"] == "Club"]
+    club_rows = final_df[final_df["Order type"] == "Club"]
+    _assert_same_rows(club_rows.iloc[: len(kept)], kept)
+
+    # New lines are numbered after everything handed out before
+    new_numbers = club_rows["index no"].iloc[len(kept):].unique()
+    np.testing.assert_array_equal(new_numbers, state.next_index + np.arange(5))
+    assert new_state.next_index == state.next_index + 5
+
+    # Production projects keep their numbers too
+    production = final_df[final_df["Order type"] != "Club"]
+    before = first[first["Order type"] != "Club"]
+    _assert_same_rows(
+        production[["index no", "Project Ref"]].drop_duplicates(),
+        before[["index no", "Project Ref"]].drop_duplicates(),
+    )
+
+
+def test_stock_lines_keep_their_index_no_when_stock_lines_are_added():
+    club_df = make_club_df(30, seed=4)
+    stock = np.arange(30) % 3 == 0
+    club_df.loc[stock, ["Local Marketing Order Ref", "Local Marketing Order Line Ref"]] = np.nan
+    df_print, df_cp = make_production_pair(10, seed=5)
+    parts = get_catalogue()
+    first, state, _ = remerge_combined([club_df], df_print, df_cp, parts)
+
+    added = make_club_df(4, seed=6)
+    added[["Local Marketing Order Ref", "Local Marketing Order Line Ref"]] = np.nan
+    added["Order Line Reference"] = [f"S{i}/1" for i in range(4)]
+    # New stock lines go in front of the existing ones
+    final_df, _, stats = remerge_combined([added, club_df], df_print, df_cp, parts, state)
+    assert stats.club_reused == 30 and stats.club_rebuilt == 4
+
+    before = first[first["Order type"] == "Club"].drop_duplicates("index no")
+    after = final_df[final_df["Order type"] == "Club"].drop_duplicates("index no")
+    kept = after[after["index no"].isin(before["index no"])]
+    assert len(kept) == 30
+    _assert_same_rows(
+        kept.sort_values("index no")[["index no", "Product", "Quantity"]],
+        before.sort_values("index no")[["index no", "Product", "Quantity"]],
+    )
+
+
+def test_cli_state_round_trip(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    argv = [
+        "--club", str(tmp_path / "club_*.xlsx"),
+        "--production", str(tmp_path / "cp.xlsx"), str(tmp_path / "print.xlsx"),
+        "-o", str(tmp_path / "out.xlsx"),
+        "--state", str(tmp_path / "state.pkl"),
+        "--workers", "1",
+    ]
+    assert main(argv) == 0
+    first = pd.read_excel(tmp_path / "out.xlsx")
+    capsys.readouterr()
+
+    assert main(argv) == 0
+    assert "Rebuilt 0 club lines and 0 projects" in capsys.readouterr().out
+    assert_frame_equal(pd.read_excel(tmp_path / "out.xlsx"), first)
+
+
+def test_each_dataset_has_its_own_state_file(tmp_path):
+    names = ("Club A 2025", "club-b/2025", "Club A 2025 ")
+    paths = {dataset_state_path(name, str(tmp_path)) for name in names}
+    assert len(paths) == 2
+    assert all(os.path.dirname(p) == str(tmp_path) for p in paths)
+    with pytest.raises(ValueError):
+        dataset_state_path("  ", str(tmp_path))
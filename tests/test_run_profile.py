@@ -0,0 +1,90 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import main
+from run_profile import RunProfile
+from test_era_engine import _write_inputs
+
+
+def test_stages_accumulate_in_order():
+    with RunProfile(trace_memory=True) as profile:
+        for n in (3, 4):
+            with profile.stage("transform", rows_in=n) as run:
+                [0] * 100_000
+                run.rows_out = n * 3
+        with profile.stage("write"):
+            time.sleep(0.01)
+        profile.add("parse (summed over files)", 1.5, rows_out=10, worker=True)
+
+    stages = profile.to_dict()["stages"]
+    assert [s["name"] for s in stages] == ["transform", "write", "parse (summed over files)"]
+    transform = stages[0]
+    assert (transform["calls"], transform["rows_in"], transform["rows_out"]) == (2, 7, 21)
+    assert transform["traced_peak"] >= 800_000
+    assert stages[1]["seconds"] >= 0.01 and stages[1]["rows_in"] is None
+    assert stages[2]["worker"] and stages[2]["seconds"] == 1.5
+    assert profile.wall_seconds >= stages[1]["seconds"]
+
+
+def test_traced_runs_take_turns():
+    entered, peaks = threading.Event(), []
+
+    def second_run():
+        with RunProfile(trace_memory=True) as profile:
+            entered.set()
+            with profile.stage("transform"):
+                [0] * 100_000
+        peaks.append(profile.stages["transform"].traced_peak)
+
+    with RunProfile(trace_memory=True):
+        thread = threading.Thread(target=second_run)
+        thread.start()
+        assert not entered.wait(0.2)
+    assert entered.wait(10)
+    thread.join(10)
+    assert peaks[0] >= 800_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_iter_stage_counts_items_and_rows():
+    profile = RunProfile()
+    items = list(profile.iter_stage("read", [[1, 2], [3], [4, 5, 6]]))
+    assert items == [[1, 2], [3], [4, 5, 6]]
+    record = profile.stages["read"]
+    assert (record.calls, record.rows_out) == (3, 6)
+
+
+def test_cli_writes_profile_json_and_cprofile(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    argv = [
+        "--club", str(tmp_path / "club_*.xlsx"),
+        "--production", str(tmp_path / "cp.xlsx"), str(tmp_path / "print.xlsx"),
+        "-o", str(tmp_path / "out.xlsx"),
+        "--csv", str(tmp_path / "out.csv"),
+        "--workers", "1",
+        "--profile-json", str(tmp_path / "profile.json"),
+        "--cprofile", str(tmp_path / "run.prof"),
+    ]
+    assert main(argv) == 0
+    capsys.readouterr()
+
+    stages = {s["name"]: s for s in json.loads((tmp_path / "profile.json").read_text())["stages"]}
+    for name in [
+        "production files",
+        "club files",
+        "club read (summed over files)",
+        "club parse (summed over files)",
+        "club transform",
+        "production transform",
+        "write xlsx",
+        "write csv",
+    ]:
+        assert stages[name]["seconds"] > 0
+    assert stages["club transform"]["rows_in"] == 240
+    assert stages["club transform"]["rows_out"] == 720
+    assert (tmp_path / "run.prof").stat().st_size > 0
@@ -0,0 +1,97 @@
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import club_charges, run_merge, transform_production
+from ingest import Upload
+from summaries import LOCATION_SHEET, ORDER_TYPE_SHEET, PART_SHEET, PROJECT_SHEET, SummaryBuilder
+from test_era_engine import _write_inputs
+from xlsx_writer import SHEET_NAME
+
+
+def _uploads(tmp_path):
+    _write_inputs(tmp_path)
+    clubs = [Upload(p.name, p.read_bytes()) for p in sorted(tmp_path.glob("club_[01].xlsx"))]
+    production = [Upload(p.name, p.read_bytes()) for p in (tmp_path / "print.xlsx", tmp_path / "cp.xlsx")]
+    return clubs, production
+
+
+def test_summaries_match_pivots_of_the_combined_sheet(tmp_path):
+    clubs, production = _uploads(tmp_path)
+    buffer = io.BytesIO()
+    report = run_merge(clubs, production, buffer, max_workers=1)
+    sheets = pd.read_excel(io.BytesIO(buffer.getvalue()), sheet_name=None)
+    out = sheets[SHEET_NAME]
+    products = out[~out["Product"].isin(["C&P", "Delivery"])]
+    money = lambda col: pd.to_numeric(out[col], errors="coerce").fillna(0)
+
+    by_type = report.summaries[ORDER_TYPE_SHEET].set_index("Order type")
+    expected = out.assign(**{"Print Sell": money("Print Sell"), "Sell": money("Sell")}).groupby("Order type")
+    np.testing.assert_allclose(by_type["Sell"], expected["Sell"].sum().round(2)[by_type.index])
+    np.testing.assert_allclose(by_type["Print Sell"], expected["Print Sell"].sum().round(2)[by_type.index])
+    assert (by_type["Index nos"] == expected["index no"].nunique()[by_type.index]).all()
+    assert by_type["Quantity"].sum() == products["Quantity"].sum()
+
+    by_part = report.summaries[PART_SHEET]
+    assert by_part["Lines"].sum() == len(products)
+    by_project = report.summaries[PROJECT_SHEET].set_index("Project Ref")
+    projects = out[out["Order type"] != "Club"].assign(Sell=money("Sell")).groupby("Project Ref")
+    np.testing.assert_allclose(by_project["Sell"], projects["Sell"].sum().round(2)[by_project.index])
+
+    # Club lines carry no Location in the output; their Sell still adds up to the Club total
+    by_location = report.summaries[LOCATION_SHEET]
+    assert by_location["Order lines"].sum() == by_type.loc["Club", "Index nos"] == 240
+    assert round(by_location["Sell"].sum(), 2) == by_type.loc["Club", "Sell"]
+
+    for name, summary in report.summaries.items():
+        pd.testing.assert_frame_equal(sheets[name], summary, check_dtype=False)
+
+
+def test_low_memory_run_gives_the_same_summaries(tmp_path):
+    clubs, production = _uploads(tmp_path)
+    in_memory = run_merge(clubs, production, io.BytesIO(), max_workers=1)
+    chunked = run_merge(clubs, production, io.BytesIO(), max_workers=1, low_memory=True, chunk_rows=50)
+    assert list(chunked.summaries) == list(in_memory.summaries)
+    for name, summary in in_memory.summaries.items():
+        pd.testing.assert_frame_equal(chunked.summaries[name], summary)
+
+
+def test_club_charges_split_lines_without_breakdown():
+    club_df = pd.DataFrame(
+        {
+            "Print": [10.0, 0.0],
+            "Collate & pack": [1.0, 0.0],
+            "Despatch": [0.0, 0.0],
+            "Total": [12.0, 8.0],
+        }
+    )
+    print_val, cp_val, d_val, sell = club_charges(club_df)
+    assert print_val.tolist() == [10.0, 8.0]
+    assert cp_val[0] == 1.0 and d_val[0] == d_val[1] > 0
+    assert sell.tolist() == [12.0, 8.0]
+
+
+def test_projects_are_summed_by_ref_whatever_their_descriptions():
+    df_print = pd.DataFrame(
+        {
+            "Project Ref": ["P2", "P1", "P2"],
+            "Project Description": ["Two", "One", "Two b"],
+            "Part": ["A", "B", "C"],
+            "Total including Spares": [10, 20, 30],
+            "Production Sell Price": [12.0, 4.0, 5.5],
+            "No of Clubs": [3, 4, 5],
+        }
+    )
+    df_cp = pd.DataFrame({"Project Ref": ["P1", "P2"], "Collate And Pack Cost Price": [1.0, 2.0]})
+    builder = SummaryBuilder()
+    builder.add(transform_production(df_print, df_cp))
+    by_project = builder.sheets()[PROJECT_SHEET]
+    assert by_project["Project Ref"].tolist() == ["P1", "P2"]
+    assert by_project["Project name"].tolist() == ["One", "Two"]
+    assert by_project["Lines"].tolist() == [1, 2]
+    assert by_project["Quantity"].tolist() == [20, 40]
+    assert by_project["Sell"].tolist() == [5.0, 19.5]
@@ -0,0 +1,105 @@
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, build_combined, iter_combined_chunks, main
+from parts_catalogue import get_catalogue
+from output_frame import expand_output
+from table_writer import CsvTableWriter, ParquetTableWriter, _TableWriter, output_schema
+from benchmarks.synthetic import make_club_df, make_production_pair
+from test_era_engine import _write_inputs
+
+
+def _inputs():
+    club_frames = [make_club_df(50, seed=1), make_club_df(30, seed=2)]
+    df_print, df_cp = make_production_pair(40, seed=3)
+    # A project missing from the C&P file gets "NOT FOUND" in the sheet
+    df_cp = df_cp[df_cp["Project Ref"] != df_cp["Project Ref"].iloc[0]]
+    return club_frames, df_print, df_cp
+
+
+def _write(writer_cls, chunks):
+    buffer = io.BytesIO()
+    with writer_cls(buffer, OUTPUT_COLUMNS) as writer:
+        for chunk in chunks:
+            writer.append(chunk)
+    buffer.seek(0)
+    return buffer, writer.rows_written
+
+
+def test_parquet_has_stable_numeric_schema():
+    club_frames, df_print, df_cp = _inputs()
+    final_df = build_combined(club_frames, df_print, df_cp, get_catalogue())
+
+    buffer, rows = _write(ParquetTableWriter, [final_df])
+    table = pq.read_table(buffer)
+    assert table.schema == output_schema(OUTPUT_COLUMNS)
+    assert rows == table.num_rows == len(final_df)
+
+    result = table.to_pandas()
+    plain = expand_output(final_df)
+    print_sell = plain["Print Sell"]
+    not_found = (print_sell == "NOT FOUND").to_numpy()
+    assert not_found.any()
+    assert result["Print Sell"][not_found].isna().all()
+    np.testing.assert_array_equal(
+        result["Print Sell"][~not_found].to_numpy(),
+        print_sell[~not_found].astype(float).to_numpy(),
+    )
+    sell = pd.to_numeric(plain["Sell"].replace("", np.nan))
+    np.testing.assert_array_equal(result["Sell"].to_numpy(), sell.to_numpy(dtype=float))
+    # Blank text cells read back as null rather than empty strings
+    assert result["Matrix URN"].isna().all()
+    assert (result["Order type"] == plain["Order type"]).all()
+
+
+def test_chunked_parquet_matches_in_memory():
+    club_frames, df_print, df_cp = _inputs()
+    parts = get_catalogue()
+    whole, _ = _write(ParquetTableWriter, [build_combined(club_frames, df_print, df_cp, parts)])
+    chunked, _ = _write(
+        ParquetTableWriter,
+        iter_combined_chunks(club_frames, df_print, df_cp, parts, chunk_rows=7),
+    )
+    assert pq.read_table(chunked).equals(pq.read_table(whole))
+
+
+def test_csv_reads_back_with_numeric_columns():
+    club_frames, df_print, df_cp = _inputs()
+    final_df = build_combined(club_frames, df_print, df_cp, get_catalogue())
+    buffer, rows = _write(CsvTableWriter, [final_df])
+
+    result = pd.read_csv(buffer)
+    assert list(result.columns) == OUTPUT_COLUMNS
+    assert len(result) == rows == len(final_df)
+    for col in ["index no", "Print Sell", "Sell"]:
+        assert pd.api.types.is_numeric_dtype(result[col])
+
+
+def test_base_writer_needs_a_format():
+    with pytest.raises(TypeError):
+        _TableWriter(io.BytesIO(), OUTPUT_COLUMNS)
+
+
+def test_cli_writes_extra_formats(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    argv = [
+        "--club", str(tmp_path / "club_*.xlsx"),
+        "--production", str(tmp_path / "cp.xlsx"), str(tmp_path / "print.xlsx"),
+        "-o", str(tmp_path / "out.xlsx"),
+        "--parquet", str(tmp_path / "out.parquet"),
+        "--csv", str(tmp_path / "out.csv"),
+        "--workers", "1",
+    ]
+    assert main(argv) == 0
+    capsys.readouterr()
+
+    sheet = pd.read_excel(tmp_path / "out.xlsx")
+    assert len(pd.read_parquet(tmp_path / "out.parquet")) == len(sheet)
+    assert len(pd.read_csv(tmp_path / "out.csv")) == len(sheet)
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, build_parts_lookup, transform_club_orders
+from ingest import parse_general_report
+from output_frame import expand_output
+from parts_data import PARTS_DATA_RAW
+from table_writer import FLOAT_COLUMNS
+from benchmarks.legacy import transform_club_orders_rowwise
+from benchmarks.synthetic import make_club_df
+from test_parse_general_report import NEW_CSV, OLD_CSV, _read_raw
+
+PARTS_DATA = build_parts_lookup(PARTS_DATA_RAW)
+
+
+def assert_matches_rowwise(result, expected):
+    # The compact layout keeps blank numbers as NaN rather than ""
+    expected = expected.copy()
+    for col in FLOAT_COLUMNS:
+        values = expected[col].astype(object)
+        expected[col] = values.where(values != "", np.nan)
+    pd.testing.assert_frame_equal(expand_output(result), expected, check_dtype=False)
+
+
+def test_matches_rowwise_on_report_fixtures():
+    for csv_text in (OLD_CSV, NEW_CSV):
+        club_df = parse_general_report(_read_raw(csv_text))
+        expected = transform_club_orders_rowwise(club_df, PARTS_DATA)
+        assert_matches_rowwise(transform_club_orders(club_df, PARTS_DATA), expected)
+
+
+def test_matches_rowwise_on_synthetic_lines():
+    club_df = make_club_df(2000, seed=3)
+    expected = transform_club_orders_rowwise(club_df, PARTS_DATA, start_index=7)
+    result = transform_club_orders(club_df, PARTS_DATA, start_index=7)
+    assert_matches_rowwise(result, expected)
+
+
+def test_three_rows_per_line_and_defaults():
+    club_df = parse_general_report(_read_raw(OLD_CSV))
+    out = transform_club_orders(club_df, PARTS_DATA)
+    assert list(out.columns) == OUTPUT_COLUMNS
+    assert len(out) == 3 * len(club_df)
+    assert list(out["Product"].iloc[1:3]) == ["C&P", "Delivery"]
+    # Old-format lines have no breakdown, so defaults apply
+    assert out["Print Sell"].iloc[1] == 2.35
+    assert out["Print Sell"].iloc[2] == 5.33
+
+
+def test_empty_input():
+    club_df = parse_general_report(_read_raw(NEW_CSV)).iloc[:0]
+    out = transform_club_orders(club_df, PARTS_DATA)
+    assert out.empty
+    assert list(out.columns) == OUTPUT_COLUMNS
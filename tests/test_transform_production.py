@@ -0,0 +1,113 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import OUTPUT_COLUMNS, combine_production, transform_production
+from output_frame import expand_output, text_column
+from benchmarks.legacy import transform_production_rowwise
+from benchmarks.synthetic import make_production_pair
+from test_transform_club_orders import assert_matches_rowwise
+
+
+def test_matches_rowwise_on_synthetic_projects():
+    df_print, df_cp = make_production_pair(3000, seed=5)
+    expected = transform_production_rowwise(df_print, df_cp, start_index=42)
+    result = transform_production(df_print, df_cp, start_index=42)
+    assert_matches_rowwise(result, expected)
+
+
+def test_not_found_and_summary_rows():
+    df_print = pd.DataFrame(
+        {
+            "Project Ref": ["P2", "P1", "P2", np.nan],
+            "Project Description": ["Two", "One", "Two b", "None"],
+            "Brief Ref": ["b1", "b2", "b3", "b4"],
+            "Part": ["A", "B", "C", "D"],
+            "Height": [297, 420, 297, 1],
+            "Width": [210, 297, 210, 1],
+            "No of Pages": [1, 2, 4, 1],
+            "Material": ["m", "m", "m", "m"],
+            "Production Finishing Notes": ["", "", "", ""],
+            "Total including Spares": [10, 20, 30, 40],
+            "Production Sell Price": [10.0, "oops", 5.5, 1.0],
+            "No of Clubs": [3, 4, 5, 6],
+        }
+    )
+    df_cp = pd.DataFrame({"Project Ref": ["P2", "P2"], "Collate And Pack Cost Price": [1.0, 2.0]})
+
+    compact = transform_production(df_print, df_cp, start_index=10)
+    expected = transform_production_rowwise(df_print, df_cp, start_index=10)
+    assert_matches_rowwise(compact, expected)
+    assert list(compact.columns) == OUTPUT_COLUMNS + [text_column("Print Sell")]
+
+    out = expand_output(compact)
+    assert list(out.columns) == OUTPUT_COLUMNS
+    assert list(out["Product"]) == ["B", "C&P", "A", "C", "C&P"]
+    assert list(out["index no"]) == [10, 10, 11, 11, 11]
+    assert out["Print Sell"].iloc[0] == 0
+    assert out["Print Sell"].iloc[1] == "NOT FOUND"
+    assert out["Sell"].iloc[1] == 0
+    # Later duplicate C&P entries win
+    assert out["Print Sell"].iloc[4] == 2.0
+    assert out["Sell"].iloc[4] == 17.5
+    assert out["Project name"].iloc[4] == "Two"
+
+
+def test_workbook_pairs_are_classified_and_combined():
+    print_1, cp_1 = make_production_pair(400, seed=1)
+    print_2, cp_2 = make_production_pair(300, seed=2, projects=20)
+    print_2["Project Ref"] = print_2["Project Ref"].str.replace("PRJ", "NEW")
+    cp_2["Project Ref"] = cp_2["Project Ref"].str.replace("PRJ", "NEW")
+    # One ref billed twice at the same price, one at two prices, one printed in both months
+    same, changed = cp_1["Project Ref"].iloc[0], cp_1["Project Ref"].iloc[1]
+    cp_2 = pd.concat(
+        [cp_2, cp_1.iloc[[0]], cp_1.iloc[[1]].assign(**{"Collate And Pack Cost Price": 1.5})],
+        ignore_index=True,
+    )
+    print_2 = pd.concat([print_2, print_1.iloc[[0]]], ignore_index=True)
+
+    production = combine_production(
+        [
+            ("cp_2.xlsx", cp_2),
+            ("print_1.xlsx", print_1),
+            ("cp_1.xlsx", cp_1),
+            ("print_2.xlsx", print_2),
+        ]
+    )
+    assert len(production.df_print) == len(print_1) + len(print_2)
+    assert production.df_cp["Project Ref"].is_unique
+
+    issues = production.issues.set_index("Project Ref")
+    assert issues.loc[same, "Issue"] == "duplicate C&P"
+    assert issues.loc[changed, "Issue"] == "conflicting C&P"
+    assert issues.loc[changed, "Files"] == "cp_2.xlsx, cp_1.xlsx"
+    assert issues.loc[changed, "Used"] == cp_1["Collate And Pack Cost Price"].iloc[1]
+    assert issues.loc[print_1["Project Ref"].iloc[0], "Issue"] == "in several Print workbooks"
+
+    result = transform_production(production.df_print, production.df_cp)
+    expected = transform_production_rowwise(
+        pd.concat([print_1, print_2], ignore_index=True), pd.concat([cp_2, cp_1], ignore_index=True)
+    )
+    assert_matches_rowwise(result, expected)
+
+
+def test_production_needs_print_and_cp():
+    df_print, df_cp = make_production_pair(20)
+    with pytest.raises(ValueError, match="one Print and one C&P"):
+        combine_production([("a.xlsx", df_print), ("b.xlsx", df_print)])
+    assert combine_production([("b.xlsx", df_cp), ("a.xlsx", df_print)]).issues.empty
+
+
+def test_used_c_and_p_price_is_the_merged_one_even_when_blank():
+    df_print = pd.DataFrame({"Project Ref": ["P1"], "Production Sell Price": [10.0]})
+    cp_1 = pd.DataFrame({"Project Ref": ["P1"], "Collate And Pack Cost Price": [5.0]})
+    cp_2 = pd.DataFrame({"Project Ref": ["P1"], "Collate And Pack Cost Price": [np.nan]})
+    production = combine_production([("p.xlsx", df_print), ("c1.xlsx", cp_1), ("c2.xlsx", cp_2)])
+
+    assert production.df_cp["Collate And Pack Cost Price"].isna().all()
+    issue = production.issues.iloc[0]
+    assert issue["Issue"] == "conflicting C&P" and pd.isna(issue["Used"])
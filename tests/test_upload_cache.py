@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from upload_cache import UploadCache, frame_nbytes
+
+
+def _parser(calls):
+    def parse(data: bytes) -> pd.DataFrame:
+        calls.append(data)
+        return pd.DataFrame({"value": list(data)})
+
+    return parse
+
+
+def test_same_bytes_parsed_once():
+    calls = []
+    cache = UploadCache()
+    first = cache.get_or_parse("club", b"abc", _parser(calls))
+    second = cache.get_or_parse("club", bytes(b"abc"), _parser(calls))
+    assert first is second
+    assert calls == [b"abc"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_kind_is_part_of_key():
+    calls = []
+    cache = UploadCache()
+    cache.get_or_parse("club", b"abc", _parser(calls))
+    cache.get_or_parse("production", b"abc", _parser(calls))
+    assert len(calls) == 2
+
+
+def test_lru_eviction_under_memory_bound():
+    calls = []
+    one_entry = frame_nbytes(pd.DataFrame({"value": list(b"aaaa")}))
+    cache = UploadCache(max_bytes=2 * one_entry)
+    for data in (b"aaaa", b"bbbb", b"aaaa", b"cccc"):
+        cache.get_or_parse("club", data, _parser(calls))
+    # "bbbb" was least recently used when "cccc" arrived
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    cache.get_or_parse("club", b"aaaa", _parser(calls))
+    cache.get_or_parse("club", b"bbbb", _parser(calls))
+    assert calls == [b"aaaa", b"bbbb", b"cccc", b"bbbb"]
+
+
+def test_oversized_frames_not_cached():
+    cache = UploadCache(max_bytes=1)
+    cache.get_or_parse("club", b"abc", _parser([]))
+    assert len(cache) == 0
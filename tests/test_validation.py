@@ -0,0 +1,121 @@
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from era_engine import ISSUES_SHEET, combine_production, run_merge
+from ingest import CP_PRICE, Upload
+from parts_catalogue import get_catalogue
+from validation import CLUB, CP, ERROR, PRINT, Validator, issue_counts, production_issues
+from benchmarks.synthetic import make_club_df, make_production_pair
+
+
+def _rules(issues, source):
+    rows = issues[issues["Source"] == source]
+    return sorted(zip(rows["Rule"], rows["Reference"]))
+
+
+def test_club_rules_flag_each_bad_line():
+    club_df = make_club_df(8, seed=4)
+    club_df["Part"] = club_df["Part"].astype(object)
+    club_df.loc[0, "Part"] = None
+    club_df.loc[1, "Part"] = "Unknown part OT"
+    club_df.loc[2, "Quantity"] = 0
+    club_df.loc[3, "Total"] = -5.0
+    club_df.loc[4, ["Print", "Collate & pack", "Despatch", "Total"]] = 0.0
+    club_df.loc[5, "Order Placed Date"] = pd.NaT
+    club_df.loc[7, ["Local Marketing Order Ref", "Local Marketing Order Line Ref"]] = (
+        club_df.loc[6, ["Local Marketing Order Ref", "Local Marketing Order Line Ref"]]
+    )
+    ref = lambda i: " / ".join(club_df.loc[i, ["Local Marketing Order Ref", "Local Marketing Order Line Ref"]])
+
+    validator = Validator(get_catalogue())
+    validator.check(CLUB, club_df, "club.xlsx")
+    issues = validator.issues()
+    assert _rules(issues, CLUB) == sorted(
+        [
+            ("missing part", ref(0)),
+            ("unknown part", ref(1)),
+            ("zero, negative or non-numeric quantity", ref(2)),
+            ("negative total", ref(3)),
+            ("no price", ref(4)),
+            ("missing or unreadable order date", ref(5)),
+            ("repeated order line", ref(7)),
+        ]
+    )
+    # Errors come first
+    assert issues["Severity"].tolist()[:2] == [ERROR, ERROR]
+    assert (issues["File"] == "club.xlsx").all()
+
+    # A line seen in an earlier file is repeated too
+    validator.check(CLUB, club_df.iloc[[6]], "again.xlsx")
+    assert validator.issues()["File"].tolist().count("again.xlsx") == 1
+
+
+def test_production_rules_cross_check_print_and_cp():
+    df_print = pd.DataFrame(
+        {
+            "Project Ref": ["P1", "P1", "P2", "P3", None],
+            "Production Sell Price": [10.0, "TBC", 0, None, 5.0],
+        }
+    )
+    df_cp = pd.DataFrame({"Project Ref": ["P1", "P3", "P9"], CP_PRICE: [2.5, "n/a", -1.0]})
+
+    validator = Validator()
+    validator.set_production(df_print, df_cp)
+    validator.check(PRINT, df_print, "print.xlsx")
+    validator.check(CP, df_cp, "cp.xlsx")
+    issues = validator.issues()
+    assert _rules(issues, PRINT) == [
+        ("missing project ref", ""),
+        ("missing sell price", "P3"),
+        ("no C&P entry", "P2"),
+        ("non-numeric sell price", "P1"),
+        ("zero or negative sell price", "P2"),
+    ]
+    assert _rules(issues, CP) == [
+        ("C&P entry with no Print rows", "P9"),
+        ("non-numeric C&P price", "P3"),
+        ("zero or negative C&P price", "P9"),
+    ]
+    counts = issue_counts(issues)
+    assert counts["Issues"].sum() == len(issues) == len(validator)
+
+
+def test_production_issues_show_the_c_and_p_price_used():
+    print_1 = pd.DataFrame({"Project Ref": ["P1", "P2"], "Production Sell Price": [10.0, 4.0]})
+    print_2 = pd.DataFrame({"Project Ref": ["P2"], "Production Sell Price": [4.0]})
+    cp_1 = pd.DataFrame({"Project Ref": ["P1"], CP_PRICE: [2.0]})
+    cp_2 = pd.DataFrame({"Project Ref": ["P1"], CP_PRICE: [3.0]})
+    production = combine_production(
+        [("p1.xlsx", print_1), ("p2.xlsx", print_2), ("c1.xlsx", cp_1), ("c2.xlsx", cp_2)]
+    )
+    issues = production_issues(production.issues).set_index("Reference")
+    assert issues.loc["P1", "Rule"] == "conflicting C&P"
+    assert issues.loc["P1", "Value"] == "2.0, 3.0 (used 3.0)"
+    assert issues.loc["P2", "Value"] == ""
+
+
+def test_merge_reports_issues_and_writes_issues_sheet():
+    club_df = make_club_df(60, seed=5)
+    club_df["Quantity"] = np.where(np.arange(60) < 3, -1, club_df["Quantity"]).astype(np.int32)
+    df_print, df_cp = make_production_pair(20, seed=6)
+    clubs, production = [], []
+    for name, df, uploads in (
+        ("club.xlsx", club_df, clubs), ("print.xlsx", df_print, production), ("cp.xlsx", df_cp, production)
+    ):
+        buffer = io.BytesIO()
+        df.to_excel(buffer, index=False, startrow=0 if uploads is clubs else 1)
+        uploads.append(Upload(name, buffer.getvalue()))
+
+    buffer = io.BytesIO()
+    report = run_merge(clubs, production, buffer, max_workers=1)
+    quantity = report.issues[report.issues["Rule"] == "zero, negative or non-numeric quantity"]
+    assert len(quantity) == 3 and set(quantity["Value"]) == {"-1"}
+
+    sheet = pd.read_excel(io.BytesIO(buffer.getvalue()), sheet_name=ISSUES_SHEET, dtype=str)
+    assert len(sheet) == len(report.issues)
+    assert sheet["Rule"].tolist() == report.issues["Rule"].tolist()
@@ -0,0 +1,52 @@
+import io
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ingest import load_club_report, load_production_workbook
+from xlsx_reader import stream_sheet
+from benchmarks.synthetic import make_club_df, make_production_pair
+from test_parse_general_report import NEW_CSV, OLD_CSV
+
+
+def _xlsx(df: pd.DataFrame, startrow: int = 0, engine: str = "xlsxwriter") -> bytes:
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, startrow=startrow, engine=engine)
+    return buffer.getvalue()
+
+
+def test_header_found_after_blank_rows_and_columns_projected():
+    df = pd.DataFrame({" a ": [1, 2], "b": ["x", None], "c": [3.5, 4.0]})
+    out = stream_sheet(_xlsx(df, startrow=3), usecols=["a", "c"])
+    assert list(out.columns) == ["a", "c"]
+    assert out["a"].tolist() == [1, 2]
+    assert out["c"].tolist() == [3.5, 4]
+
+
+def test_club_readers_agree():
+    for csv_text in (OLD_CSV, NEW_CSV):
+        data = _xlsx(pd.read_csv(io.StringIO(csv_text)), startrow=1)
+        pd.testing.assert_frame_equal(
+            load_club_report(data, reader="stream"), load_club_report(data, reader="pandas")
+        )
+
+
+def test_club_readers_agree_on_dates_from_either_writer():
+    df = make_club_df(300, seed=4)
+    for engine in ("xlsxwriter", "openpyxl"):
+        data = _xlsx(df, engine=engine)
+        streamed = load_club_report(data, reader="stream")
+        pd.testing.assert_frame_equal(streamed, load_club_report(data, reader="pandas"))
+        assert streamed["Order Placed Date"].notna().all()
+
+
+def test_production_readers_agree_on_used_columns():
+    df_print, _ = make_production_pair(200, seed=2)
+    df_print["Unused"] = "x"
+    data = _xlsx(df_print, startrow=1)
+    streamed = load_production_workbook(data, reader="stream")
+    full = load_production_workbook(data, reader="pandas")
+    assert "Unused" not in streamed.columns
+    pd.testing.assert_frame_equal(streamed, full[streamed.columns])
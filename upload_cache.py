@@ -0,0 +1,96 @@
+"""Content-addressed cache for parsed uploads.
+
+Streamlit reruns the whole script on every interaction, so the same workbook
+bytes get parsed again and again. Entries are keyed by a hash of the uploaded
+bytes, so an unchanged file is a hit however it was re-uploaded, and the
+least recently used frames are evicted once the cache exceeds its memory
+bound.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+
+DEFAULT_MAX_BYTES = int(os.environ.get("ERA_UPLOAD_CACHE_MB", "512")) * 1024 * 1024
+
+
+def content_key(kind: str, data: bytes) -> tuple:
+    return kind, hashlib.sha256(data).hexdigest()
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class UploadCache:
+    """LRU map of (kind, sha256 of bytes) -> parsed DataFrame.
+
+    Cached frames are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_parse(
+        self, kind: str, data: bytes, parse: Callable[[bytes], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """The cached frame for ``data``, running ``parse(data)`` on a miss."""
+        key = content_key(kind, data)
+        df = self.get(key)
+        if df is None:
+            # Parse outside the lock so other sessions aren't held up
+            df = parse(data)
+            self.put(key, df)
+        return df
+
+    def get(self, key: tuple):
+        """The cached frame for ``key``, or None; counts as a hit or miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, df: pd.DataFrame):
+        size = frame_nbytes(df)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (df, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
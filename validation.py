@@ -0,0 +1,260 @@
+"""Data quality rules checked on the merge inputs.
+
+Each ``Rule`` names the input it checks (club lines, Print rows or C&P
+entries), a severity and a function that returns a boolean mask of the
+offending rows, computed over the whole frame at once. A ``Validator`` runs
+the rules on every frame a merge reads and collects one issue per offending
+row: the rule, the row's reference (Local Marketing Order Ref / Line Ref,
+or Project Ref), the column and value at fault and the file it came from.
+``Validator.issues()`` returns them as one table, which the app shows and
+the workbook gets as an extra sheet.
+
+Parsing coerces what it cannot read, so some rules check the result: a
+Quantity that was not a number arrives as 0, and an unreadable date as
+NaT.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ingest import CP_PRICE
+from merge_state import CLUB_KEY
+from parts_catalogue import part_index
+
+ERROR = "error"
+WARNING = "warning"
+
+CLUB = "club"
+PRINT = "Print"
+CP = "C&P"
+
+ISSUE_COLUMNS = ["Severity", "Rule", "Source", "File", "Reference", "Column", "Value"]
+
+
+@dataclass
+class Context:
+    """What rules need beyond the frame they check."""
+
+    parts: object = None
+    print_refs: Optional[pd.Index] = None
+    cp_refs: Optional[pd.Index] = None
+    # Hashes of the club order lines seen so far, to catch repeats across files
+    seen_lines: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    source: str
+    severity: str
+    column: str
+    check: Callable[[pd.DataFrame, Context], np.ndarray]
+
+
+def _numbers(values: pd.Series) -> np.ndarray:
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def _not_numeric(values: pd.Series) -> np.ndarray:
+    """Non-blank values that are not numbers."""
+    return np.isnan(_numbers(values)) & values.notna().to_numpy() & (values != "").to_numpy()
+
+
+def _unknown_part(df: pd.DataFrame, context: Context) -> np.ndarray:
+    if context.parts is None:
+        return np.zeros(len(df), dtype=bool)
+    codes, matches = context.parts.resolve(df["Part"])
+    matched = np.array([m.part is not None for m in matches] + [True], dtype=bool)
+    return ~matched[codes]
+
+
+def _repeated_line(df: pd.DataFrame, context: Context) -> np.ndarray:
+    keys = df[CLUB_KEY]
+    has_key = keys.notna().all(axis=1).to_numpy()
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    repeated = pd.Series(hashes).duplicated().to_numpy() | np.isin(hashes, context.seen_lines)
+    context.seen_lines = np.union1d(context.seen_lines, hashes[has_key])
+    return repeated & has_key
+
+
+def _first_of_project(df: pd.DataFrame) -> np.ndarray:
+    return ~df["Project Ref"].duplicated().to_numpy() & df["Project Ref"].notna().to_numpy()
+
+
+def _no_cp_entry(df: pd.DataFrame, context: Context) -> np.ndarray:
+    if context.cp_refs is None:
+        return np.zeros(len(df), dtype=bool)
+    return _first_of_project(df) & ~df["Project Ref"].isin(context.cp_refs).to_numpy()
+
+
+def _no_print_rows(df: pd.DataFrame, context: Context) -> np.ndarray:
+    if context.print_refs is None:
+        return np.zeros(len(df), dtype=bool)
+    return df["Project Ref"].notna().to_numpy() & ~df["Project Ref"].isin(context.print_refs)
+
+
+def _column(name: str):
+    def get(df: pd.DataFrame) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series(np.nan, index=df.index)
+
+    return get
+
+
+_sell = _column("Production Sell Price")
+
+RULES = [
+    Rule("missing part", CLUB, ERROR, "Part", lambda df, c: df["Part"].isna().to_numpy()),
+    Rule("unknown part", CLUB, WARNING, "Part", _unknown_part),
+    Rule(
+        "zero, negative or non-numeric quantity", CLUB, WARNING, "Quantity",
+        lambda df, c: df["Quantity"].to_numpy() <= 0,
+    ),
+    Rule("negative total", CLUB, ERROR, "Total", lambda df, c: df["Total"].to_numpy() < 0),
+    Rule(
+        "no price", CLUB, WARNING, "Total",
+        lambda df, c: (df[["Print", "Collate & pack", "Despatch", "Total"]] == 0)
+        .all(axis=1)
+        .to_numpy(),
+    ),
+    Rule(
+        "missing or unreadable order date", CLUB, WARNING, "Order Placed Date",
+        lambda df, c: df["Order Placed Date"].isna().to_numpy(),
+    ),
+    Rule("repeated order line", CLUB, WARNING, "Local Marketing Order Line Ref", _repeated_line),
+    Rule(
+        "missing project ref", PRINT, ERROR, "Project Ref",
+        lambda df, c: df["Project Ref"].isna().to_numpy(),
+    ),
+    Rule(
+        "non-numeric sell price", PRINT, ERROR, "Production Sell Price",
+        lambda df, c: _not_numeric(_sell(df)),
+    ),
+    Rule(
+        "zero or negative sell price", PRINT, WARNING, "Production Sell Price",
+        lambda df, c: _numbers(_sell(df)) <= 0,
+    ),
+    Rule(
+        "missing sell price", PRINT, WARNING, "Production Sell Price",
+        lambda df, c: _sell(df).isna().to_numpy(),
+    ),
+    Rule("no C&P entry", PRINT, ERROR, "Project Ref", _no_cp_entry),
+    Rule(
+        "non-numeric C&P price", CP, ERROR, CP_PRICE,
+        lambda df, c: _not_numeric(df[CP_PRICE]),
+    ),
+    Rule(
+        "zero or negative C&P price", CP, WARNING, CP_PRICE,
+        lambda df, c: _numbers(df[CP_PRICE]) <= 0,
+    ),
+    Rule("C&P entry with no Print rows", CP, WARNING, "Project Ref", _no_print_rows),
+]
+
+
+def _references(source: str, rows: pd.DataFrame) -> np.ndarray:
+    if source == CLUB:
+        order, line = (rows[col].astype(object).fillna("").astype(str) for col in CLUB_KEY)
+        return (order + " / " + line).to_numpy(dtype=object)
+    return rows["Project Ref"].astype(object).fillna("").astype(str).to_numpy(dtype=object)
+
+
+def _values(values: pd.Series) -> np.ndarray:
+    return values.astype(object).where(values.notna(), "").astype(str).to_numpy(dtype=object)
+
+
+class Validator:
+    """Runs ``rules`` over the frames of one merge and collects their issues."""
+
+    def __init__(self, parts_lookup=None, rules=RULES):
+        self.rules = list(rules)
+        self.context = Context(parts=None if parts_lookup is None else part_index(parts_lookup))
+        self.counts = Counter()
+        self._issues = []
+
+    def set_production(self, df_print: pd.DataFrame, df_cp: pd.DataFrame):
+        """The combined Print rows and C&P table, for the rules that cross-check them."""
+        self.context.print_refs = pd.Index(df_print["Project Ref"].dropna().unique())
+        self.context.cp_refs = pd.Index(df_cp["Project Ref"].dropna().unique())
+
+    def check(self, source: str, df: pd.DataFrame, file: str = ""):
+        """Run the rules for ``source`` (club, Print or C&P) over ``df``."""
+        if df.empty:
+            return
+        for rule in self.rules:
+            if rule.source != source:
+                continue
+            mask = np.asarray(rule.check(df, self.context), dtype=bool)
+            if not mask.any():
+                continue
+            rows = df[mask]
+            values = rows[rule.column] if rule.column in rows.columns else pd.Series("", index=rows.index)
+            self.add(
+                pd.DataFrame(
+                    {
+                        "Severity": rule.severity,
+                        "Rule": rule.name,
+                        "Source": source,
+                        "File": file,
+                        "Reference": _references(source, rows),
+                        "Column": rule.column,
+                        "Value": _values(values),
+                    }
+                )
+            )
+
+    def add(self, issues: pd.DataFrame):
+        """Add issues found elsewhere, with ``ISSUE_COLUMNS``."""
+        if len(issues):
+            self._issues.append(issues[ISSUE_COLUMNS].reset_index(drop=True))
+            self.counts.update(zip(issues["Severity"], issues["Rule"]))
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def issues(self) -> pd.DataFrame:
+        """Every issue, errors first, then by rule in the order the rules are listed."""
+        if not self._issues:
+            return pd.DataFrame({col: pd.Series(dtype=object) for col in ISSUE_COLUMNS})
+        df = pd.concat(self._issues, ignore_index=True)
+        order = {rule.name: i for i, rule in enumerate(self.rules)}
+        key = np.lexsort(
+            (
+                df["Rule"].map(order).fillna(len(order)).to_numpy(),
+                (df["Severity"] != ERROR).to_numpy(),
+            )
+        )
+        return df.take(key).reset_index(drop=True)
+
+
+def production_issues(issues: pd.DataFrame) -> pd.DataFrame:
+    """``combine_production`` issues (repeated and conflicting Project Refs) as validation issues.
+
+    The Value of a C&P issue lists the ref's prices and the one merged, e.g.
+    ``"2.0, 3.0 (used 3.0)"``.
+    """
+    conflicting = (issues["Issue"] == "conflicting C&P").to_numpy()
+    print_issue = (issues["Issue"] == "in several Print workbooks").to_numpy()
+    prices = issues["C&P prices"].astype(str) + " (used " + issues["Used"].astype(str) + ")"
+    return pd.DataFrame(
+        {
+            "Severity": np.where(conflicting, ERROR, WARNING),
+            "Rule": issues["Issue"].to_numpy(),
+            "Source": np.where(print_issue, PRINT, CP),
+            "File": issues["Files"].to_numpy(),
+            "Reference": issues["Project Ref"].astype(str).to_numpy(),
+            "Column": np.where(print_issue, "Project Ref", CP_PRICE),
+            "Value": np.where(print_issue, "", prices.to_numpy(dtype=object)),
+        }
+    )
+
+
+def issue_counts(issues: pd.DataFrame) -> pd.DataFrame:
+    """Number of issues per severity, source and rule, in the issues' order."""
+    return (
+        issues.groupby(["Severity", "Source", "Rule"], sort=False)
+        .size()
+        .reset_index(name="Issues")
+    )
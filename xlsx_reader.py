@@ -0,0 +1,209 @@
+"""Streaming xlsx reader.
+
+``pd.read_excel`` goes through openpyxl, which builds a cell object for every
+cell and parses each shared string into a rich-text tree. Here the first
+sheet's XML is streamed straight out of the zip with ``iterparse``, the
+header row is found as rows arrive, and only the requested columns are ever
+materialised. Values come out as ``pd.read_excel`` would give them.
+"""
+
+import io
+import os
+import posixpath
+import zipfile
+from datetime import datetime
+from typing import Iterable, Optional
+from xml.etree.ElementTree import iterparse
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel
+
+# pandas' default dtype for text: str under pandas 3, object before
+TEXT_DTYPE = pd.Series(["text"]).dtype
+
+READERS = ("stream", "pandas")
+DEFAULT_READER = os.environ.get("ERA_XLSX_READER", "stream")
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _is_blank(value) -> bool:
+    return value is None or (isinstance(value, str) and value == "")
+
+
+def _clean(value):
+    # Match pd.read_excel: blanks read as NaN and whole floats as ints
+    if value is None or (isinstance(value, str) and value == ""):
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _text(element) -> str:
+    """Text of a shared/inline string, skipping phonetic runs."""
+    t = element.find(f"{_MAIN}t")
+    if t is not None:
+        return t.text or ""
+    return "".join(r.findtext(f"{_MAIN}t", "") for r in element.iter(f"{_MAIN}r"))
+
+
+def _first_sheet(zf: zipfile.ZipFile):
+    """Path of the first worksheet and the workbook's date epoch."""
+    with zf.open("xl/workbook.xml") as f:
+        workbook = iterparse(f, events=("end",))
+        epoch, rel_id = CALENDAR_WINDOWS_1900, None
+        for _, element in workbook:
+            if element.tag == f"{_MAIN}workbookPr":
+                if element.get("date1904") in ("1", "true"):
+                    epoch = CALENDAR_MAC_1904
+            elif element.tag == f"{_MAIN}sheet" and rel_id is None:
+                rel_id = element.get(f"{_REL}id")
+
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        for _, element in iterparse(f):
+            if element.tag == f"{_PKG_REL}Relationship" and element.get("Id") == rel_id:
+                target = element.get("Target")
+                if target.startswith("/"):
+                    return target.lstrip("/"), epoch
+                return posixpath.normpath(posixpath.join("xl", target)), epoch
+    raise ValueError("Workbook has no worksheets")
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings = []
+    with zf.open("xl/sharedStrings.xml") as f:
+        for _, element in iterparse(f):
+            if element.tag == f"{_MAIN}si":
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _date_styles(zf: zipfile.ZipFile) -> set:
+    """Indices of the cell formats that display numbers as dates."""
+    if "xl/styles.xml" not in zf.namelist():
+        return set()
+    custom, xf_formats = {}, []
+    with zf.open("xl/styles.xml") as f:
+        in_cell_xfs = False
+        for event, element in iterparse(f, events=("start", "end")):
+            if element.tag == f"{_MAIN}cellXfs":
+                in_cell_xfs = event == "start"
+            elif event == "end" and element.tag == f"{_MAIN}numFmt":
+                custom[int(element.get("numFmtId"))] = element.get("formatCode")
+            elif event == "end" and in_cell_xfs and element.tag == f"{_MAIN}xf":
+                xf_formats.append(int(element.get("numFmtId", 0)))
+    return {
+        i
+        for i, fmt_id in enumerate(xf_formats)
+        if is_date_format(custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, "General")))
+    }
+
+
+def _iter_rows(data: bytes):
+    """Yield ``(row number, {column index: value})`` for each stored row."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        sheet_path, epoch = _first_sheet(zf)
+        shared = _shared_strings(zf)
+        date_styles = _date_styles(zf)
+        column_index = {}
+
+        with zf.open(sheet_path) as f:
+            for _, element in iterparse(f):
+                if element.tag != f"{_MAIN}row":
+                    continue
+                row_number = int(element.get("r"))
+                cells = {}
+                for position, cell in enumerate(element.iter(f"{_MAIN}c")):
+                    ref = cell.get("r")
+                    if ref is None:
+                        col = position
+                    else:
+                        letters = ref.rstrip("0123456789")
+                        col = column_index.get(letters)
+                        if col is None:
+                            col = column_index[letters] = column_index_from_string(letters) - 1
+                    kind = cell.get("t", "n")
+                    if kind == "inlineStr":
+                        inline = cell.find(f"{_MAIN}is")
+                        cells[col] = _text(inline) if inline is not None else None
+                        continue
+                    value = cell.findtext(f"{_MAIN}v")
+                    if value is None:
+                        continue
+                    if kind == "s":
+                        cells[col] = shared[int(value)]
+                    elif kind == "n":
+                        number = float(value) if any(c in value for c in ".Ee") else int(value)
+                        if int(cell.get("s", 0)) in date_styles:
+                            number = from_excel(number, epoch)
+                        cells[col] = number
+                    elif kind == "b":
+                        cells[col] = value == "1"
+                    elif kind == "d":
+                        cells[col] = datetime.fromisoformat(value)
+                    else:
+                        cells[col] = value
+                element.clear()
+                yield row_number, cells
+
+
+def stream_sheet(
+    data: bytes, header_row: Optional[int] = None, usecols: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """The first sheet of an xlsx workbook as a DataFrame.
+
+    ``header_row`` is the 0-based row holding the column names; when None the
+    first row with any value is used. Column names are stripped, and when
+    ``usecols`` is given only those columns are kept (the first one wins if
+    a name repeats). Raises ValueError if no header row is found.
+    """
+    rows = _iter_rows(data)
+
+    header = None
+    for row_number, cells in rows:
+        if header_row is None:
+            if not all(_is_blank(v) for v in cells.values()):
+                header = cells
+                break
+        elif row_number - 1 == header_row:
+            header = cells
+            break
+        elif row_number - 1 > header_row:
+            break
+    if header is None:
+        raise ValueError("Could not determine header row")
+
+    wanted = None if usecols is None else set(usecols)
+    positions = {}
+    for pos in sorted(header):
+        name = str(header[pos]).strip()
+        if (wanted is None or name in wanted) and name not in positions:
+            positions[name] = pos
+
+    columns = {name: [] for name in positions}
+    targets = [(columns[name], pos) for name, pos in positions.items()]
+    for _, cells in rows:
+        if all(_is_blank(v) for v in cells.values()):
+            continue
+        for values, pos in targets:
+            values.append(_clean(cells.get(pos)))
+
+    # An empty column reads as missing text, as it does under pd.read_excel
+    n_rows = len(next(iter(columns.values()), []))
+    return pd.DataFrame(
+        {
+            name: values
+            if any(v is not np.nan for v in values)
+            else pd.Series(np.nan, index=range(n_rows), dtype=TEXT_DTYPE)
+            for name, values in columns.items()
+        }
+    )
@@ -0,0 +1,185 @@
+"""Writer for the formatted "Combined Data" workbook.
+
+Output frames are appended in order, so the sheet can be written from a
+stream of bounded-size chunks as well as from one complete frame. The
+workbook is written in xlsxwriter's constant-memory mode: each row goes to
+disk as soon as it is complete, so the sheet is never held in RAM. The
+header is written up front, borders are applied as cell formats while rows
+are written, and column widths are set on close. Small tables, such as the
+validation issues, can follow on sheets of their own with ``add_sheet``.
+
+A sheet holds at most ``SHEET_MAX_ROWS`` rows below its header; xlsxwriter
+silently skips cells past that. Rows beyond it carry on in further sheets
+named "<sheet> (2)", "<sheet> (3)" and so on, each with its own header.
+"""
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from output_frame import expand_output, text_column
+
+SHEET_NAME = "Combined Data"
+
+# Rows an xlsx sheet can hold, less the header row
+SHEET_MAX_ROWS = 1_048_575
+
+# Non-text columns longer than this are sized from a sample of their values
+WIDTH_SAMPLE = 10_000
+
+# Rows expanded from the compact layout to plain values at a time
+WRITE_ROWS = 50_000
+
+
+def column_width(series: pd.Series) -> int:
+    """Length of the longest value ``series`` displays, ignoring blanks.
+
+    Text columns are measured exactly with one vectorised string-length
+    pass. Other columns are measured on their extremes plus an evenly spaced
+    sample of at most ``WIDTH_SAMPLE`` values, which avoids converting every
+    number to a string.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = pd.Series(series.cat.categories)
+    elif not isinstance(series.dtype, pd.StringDtype) and len(series) > WIDTH_SAMPLE:
+        picks = np.linspace(0, len(series) - 1, WIDTH_SAMPLE).astype(int)
+        sample = series.iloc[picks]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            extremes = series.agg(["min", "max"]).astype(series.dtype)
+            sample = pd.concat([sample, extremes])
+        series = sample
+
+    values = series.dropna()
+    if not isinstance(series.dtype, pd.StringDtype):
+        values = values.astype(str)
+    lengths = values.str.len()
+    return int(lengths.max()) if len(lengths) else 0
+
+
+def _is_blank(value) -> bool:
+    # Missing values and empty strings are written as empty, bordered cells
+    if value.__class__ is str:
+        return not value
+    return value is None or value is pd.NA or value != value
+
+
+class CombinedSheetWriter:
+    """Appends output frames to a "Combined Data" sheet in ``target``.
+
+    ``target`` is a path or a writable binary file object. Use as a context
+    manager, or call ``close()`` once every chunk has been appended.
+    ``rows_written`` counts rows over all the sheets they were spread across.
+    """
+
+    def __init__(self, target, columns, max_rows: int = SHEET_MAX_ROWS):
+        self.columns = list(columns)
+        self.max_rows = max_rows
+        self.workbook = xlsxwriter.Workbook(target, {"constant_memory": True})
+        self.rows_written = 0
+        self._widths = [len(str(col)) for col in self.columns]
+
+        self._border_fmt = self.workbook.add_format(
+            {
+                "border": 1,
+                "border_color": "#000000",
+            }
+        )
+
+        self._header_fmt = self.workbook.add_format(
+            {
+                "border": 1,
+                "border_color": "#000000",
+                "bold": True,
+                "text_wrap": True,
+                "valign": "top",
+            }
+        )
+
+        self.worksheets = [self._add_worksheet(SHEET_NAME, self.columns, 1)]
+        self._sheet_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, df):
+        """Write the rows of ``df`` (with ``self.columns``) below those already written.
+
+        ``df`` may be in the compact layout of ``output_frame``; it is
+        expanded to plain values ``WRITE_ROWS`` rows at a time.
+        """
+        for col_num, col in enumerate(self.columns):
+            width = column_width(df[col])
+            if text_column(col) in df.columns:
+                width = max(width, column_width(df[text_column(col)]))
+            self._widths[col_num] = max(self._widths[col_num], width)
+
+        for start in range(0, len(df), WRITE_ROWS):
+            rows = expand_output(df.iloc[start : start + WRITE_ROWS])
+            written = 0
+            while written < len(rows):
+                if self._sheet_rows == self.max_rows:
+                    self.worksheets.append(
+                        self._add_worksheet(SHEET_NAME, self.columns, len(self.worksheets) + 1)
+                    )
+                    self._sheet_rows = 0
+                part = rows.iloc[written : written + self.max_rows - self._sheet_rows]
+                self._sheet_rows = self._write_rows(
+                    self.worksheets[-1], part, self.columns, self._sheet_rows
+                )
+                written += len(part)
+            self.rows_written += len(rows)
+
+    def add_sheet(self, name: str, df: pd.DataFrame):
+        """Write the plain frame ``df`` whole to a further sheet ``name``.
+
+        Call it once every chunk of the combined sheet has been appended:
+        in constant-memory mode rows cannot go back to an earlier sheet.
+        """
+        columns = list(df.columns)
+        widths = [max(len(str(col)), column_width(df[col])) + 2 for col in columns]
+        # An empty frame still gets its sheet, with just the header
+        for number, start in enumerate(range(0, max(len(df), 1), self.max_rows), 1):
+            worksheet = self._add_worksheet(name, columns, number)
+            self._write_rows(worksheet, df.iloc[start : start + self.max_rows], columns, 0)
+            for idx, width in enumerate(widths):
+                worksheet.set_column(idx, idx, width)
+
+    def _add_worksheet(self, name: str, columns, number: int):
+        """Sheet ``name``, or its ``number``th continuation, with the header written."""
+        worksheet = self.workbook.add_worksheet(name if number == 1 else f"{name} ({number})")
+        for col_num, value in enumerate(columns):
+            worksheet.write(0, col_num, value, self._header_fmt)
+        return worksheet
+
+    def _write_rows(self, worksheet, df, columns, row_num: int) -> int:
+        """Write ``df`` below row ``row_num``; returns the last row written."""
+        # Write by type rather than through write(), which regex-checks
+        # every string for formulas and URLs
+        writers = {
+            str: worksheet.write_string,
+            int: worksheet.write_number,
+            float: worksheet.write_number,
+            bool: worksheet.write_boolean,
+        }
+        write = worksheet.write
+        write_blank = worksheet.write_blank
+        border_fmt = self._border_fmt
+        values = [df[col].tolist() for col in columns]
+
+        for row in zip(*values):
+            row_num += 1
+            for col_num, value in enumerate(row):
+                if _is_blank(value):
+                    write_blank(row_num, col_num, None, border_fmt)
+                else:
+                    writers.get(value.__class__, write)(row_num, col_num, value, border_fmt)
+        return row_num
+
+    def close(self):
+        for worksheet in self.worksheets:
+            for idx, width in enumerate(self._widths):
+                worksheet.set_column(idx, idx, width + 2)
+        self.workbook.close()